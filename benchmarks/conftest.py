@@ -0,0 +1,37 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tests.conftest import *
+from gas_recorder import GasRecorder
+
+_recorder = GasRecorder()
+
+
+@pytest.fixture(scope='session')
+def gasRecorder():
+    return _recorder
+
+
+@pytest.fixture(scope='function', autouse=True)
+def check_gas_regressions(gasRecorder):
+    yield
+    regressions = gasRecorder.regressions()
+    if regressions:
+        pytest.fail('\n'.join(
+            'gas regression {}: {} -> {}'.format(key, baseGas, gasUsed) if baseGas is not None
+            else 'missing from the baseline {}: {} (GAS_BASELINE_UPDATE=1 records it)'.format(key, gasUsed)
+            for key, baseGas, gasUsed in regressions
+        ))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if not _recorder.entries:
+        return
+    _recorder.save_report()
+    if _recorder.isUpdate:
+        _recorder.save_baseline()
@@ -0,0 +1,86 @@
+import json
+import os
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gas_baseline.json')
+REPORT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gas_report.md')
+
+DEFAULT_TOLERANCE = 0.02 # 2%
+
+
+class GasRecorder:
+    """
+    Collects gas_used per scenario and function and compares it with the stored baseline.
+
+    GAS_TOLERANCE overrides the tolerance from the baseline (0.05 is 5%),
+    GAS_BASELINE_UPDATE=1 rewrites the baseline with the recorded values.
+    """
+
+    def __init__(self, path=BASELINE_PATH):
+        self.path = path
+        self.baseline = {}
+        self.tolerance = DEFAULT_TOLERANCE
+        if os.path.exists(path):
+            with open(path) as file:
+                stored = json.load(file)
+            self.baseline = stored.get('entries', {})
+            self.tolerance = stored.get('tolerance', DEFAULT_TOLERANCE)
+        if os.getenv('GAS_TOLERANCE'):
+            self.tolerance = float(os.getenv('GAS_TOLERANCE'))
+        self.isUpdate = os.getenv('GAS_BASELINE_UPDATE') == '1'
+        self.entries = {}
+        self.checked = set()
+
+    @staticmethod
+    def key(scenario, function):
+        return scenario + '::' + function
+
+    def record(self, scenario, function, tx):
+        gasUsed = tx if isinstance(tx, int) else tx.gas_used
+        self.entries[self.key(scenario, function)] = gasUsed
+        return gasUsed
+
+    def regressions(self):
+        """
+        Returns the entries recorded since the last call which are more expensive than the baseline
+        or are missing from it (baseGas is None), so a new scenario can not pass without a baseline.
+        """
+        result = []
+        for key, gasUsed in self.entries.items():
+            if key in self.checked:
+                continue
+            self.checked.add(key)
+            if self.isUpdate:
+                continue
+            baseGas = self.baseline.get(key)
+            if baseGas is None or gasUsed > baseGas * (1 + self.tolerance):
+                result.append((key, baseGas, gasUsed))
+        return result
+
+    def save_baseline(self):
+        entries = dict(self.baseline)
+        entries.update(self.entries)
+        with open(self.path, 'w') as file:
+            json.dump({'tolerance': self.tolerance, 'entries': dict(sorted(entries.items()))}, file, indent=2)
+            file.write('\n')
+
+    def to_markdown(self):
+        lines = [
+            '| Scenario | Function | Gas used | Baseline | Change |',
+            '|---|---|---:|---:|---:|',
+        ]
+        for key in sorted(self.entries):
+            scenario, function = key.split('::', 1)
+            gasUsed = self.entries[key]
+            baseGas = self.baseline.get(key)
+            if baseGas:
+                change = '{:+.2f}%'.format((gasUsed - baseGas) * 100 / baseGas)
+                lines.append('| {} | {} | {} | {} | {} |'.format(scenario, function, gasUsed, baseGas, change))
+            else:
+                lines.append('| {} | {} | {} | - | new |'.format(scenario, function, gasUsed))
+        return '\n'.join(lines) + '\n'
+
+    def save_report(self, path=REPORT_PATH):
+        with open(path, 'w') as file:
+            file.write('#### Gas report\n\n')
+            file.write('Tolerance: {:.2f}%\n\n'.format(self.tolerance * 100))
+            file.write(self.to_markdown())
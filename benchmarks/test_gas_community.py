@@ -0,0 +1,160 @@
+import pytest
+from brownie import ZERO_ADDRESS, chain, reverts, network
+import brownie
+
+IPFS_HASH = 'QmdfTbBqBPQ7VNxZEYEj14VmRuZBkqFbiwReogJgS1zR1n'
+DIGEST = '0xe3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855'
+AMOUNT = 10000000000000000000000
+
+
+def add_balance(pageBank, pageToken, treasury, user):
+    pageToken.transfer(user, AMOUNT, {'from': treasury})
+    pageToken.approve(pageBank, AMOUNT, {'from': user})
+    pageBank.addBalance(AMOUNT, {'from': user})
+
+
+def test_gas_posts(gasRecorder, pageCommunity, someUser, deployer):
+    scenario = 'posts'
+    network.gas_price("65 gwei")
+    gasRecorder.record(scenario, 'addCommunity', pageCommunity.addCommunity('First users'))
+    gasRecorder.record(scenario, 'join', pageCommunity.join(1, {'from': someUser}))
+    pageCommunity.join(1, {'from': deployer})
+
+    gasRecorder.record('post_first', 'writePost', pageCommunity.writePost(1, IPFS_HASH, deployer, {'from': someUser}))
+    for i in range(3): pageCommunity.writePost(1, IPFS_HASH, deployer, {'from': someUser})
+    gasRecorder.record('post_steady', 'writePost', pageCommunity.writePost(1, IPFS_HASH, deployer, {'from': someUser}))
+    gasRecorder.record('post_steady', 'writePostDigest', pageCommunity.writePostDigest(1, DIGEST, deployer, {'from': someUser}))
+
+
+def test_gas_comments(gasRecorder, pageCommunity, someUser, deployer, accounts):
+    network.gas_price("65 gwei")
+    pageCommunity.addCommunity('First users')
+    pageCommunity.join(1, {'from': someUser})
+    pageCommunity.join(1, {'from': deployer})
+    pageCommunity.join(1, {'from': accounts[2]})
+    pageCommunity.writePost(1, IPFS_HASH, deployer, {'from': someUser})
+
+    gasRecorder.record('comment_first', 'writeComment', pageCommunity.writeComment(0, IPFS_HASH, False, False, deployer, {'from': deployer}))
+    for i in range(3): pageCommunity.writeComment(0, IPFS_HASH, False, False, deployer, {'from': deployer})
+    gasRecorder.record('comment_steady', 'writeComment', pageCommunity.writeComment(0, IPFS_HASH, False, False, deployer, {'from': deployer}))
+    gasRecorder.record('comment_steady', 'writeCommentDigest', pageCommunity.writeCommentDigest(0, DIGEST, False, False, deployer, {'from': deployer}))
+    gasRecorder.record('comment_up', 'writeComment', pageCommunity.writeComment(0, IPFS_HASH, True, False, deployer, {'from': someUser}))
+    gasRecorder.record('comment_down', 'writeComment', pageCommunity.writeComment(0, IPFS_HASH, False, True, deployer, {'from': accounts[2]}))
+
+    batchSize = 10
+    tx = pageCommunity.writeComments(
+        1, [0] * batchSize, [IPFS_HASH] * batchSize, [False] * batchSize, [False] * batchSize, deployer, {'from': deployer}
+    )
+    gasRecorder.record('comment_batch_10', 'writeComments', tx)
+
+
+def test_gas_burn_and_visibility(gasRecorder, pageBank, pageCommunity, pageToken, pageVoteForCommon, someUser, deployer, accounts, treasury):
+    scenario = 'moderation'
+    moderator = accounts[2]
+    network.gas_price("65 gwei")
+    pageCommunity.addCommunity('First users')
+    pageCommunity.join(1, {'from': someUser})
+    pageCommunity.join(1, {'from': deployer})
+    pageCommunity.join(1, {'from': moderator})
+    pageCommunity.addModerator(1, moderator, {'from': pageVoteForCommon})
+    add_balance(pageBank, pageToken, treasury, moderator)
+    add_balance(pageBank, pageToken, treasury, deployer)
+
+    pageCommunity.writePost(1, IPFS_HASH, deployer, {'from': deployer})
+    pageCommunity.writePostDigest(1, DIGEST, deployer, {'from': deployer})
+    pageCommunity.writeComment(0, IPFS_HASH, False, False, deployer, {'from': someUser})
+    pageCommunity.writeComment(0, IPFS_HASH, False, False, deployer, {'from': someUser})
+    pageCommunity.writeCommentDigest(1, DIGEST, False, False, deployer, {'from': someUser})
+
+    gasRecorder.record(scenario, 'setVisibilityComment', pageCommunity.setVisibilityComment(0, 1, False, {'from': moderator}))
+    gasRecorder.record(scenario, 'burnComment', pageCommunity.burnComment(0, 0, {'from': moderator}))
+    gasRecorder.record(scenario, 'burnComment_packed', pageCommunity.burnComment(1, 0, {'from': moderator}))
+    gasRecorder.record(scenario, 'setPostVisibility', pageCommunity.setPostVisibility(1, False, {'from': moderator}))
+    gasRecorder.record(scenario, 'burnPost', pageCommunity.burnPost(0, {'from': deployer}))
+    gasRecorder.record(scenario, 'burnPost_packed', pageCommunity.burnPost(1, {'from': deployer}))
+
+
+def test_gas_membership(gasRecorder, pageCommunity, pageVoteForCommon, someUser, deployer, accounts):
+    scenario = 'membership'
+    pageCommunity.addCommunity('First users')
+    pageCommunity.join(1, {'from': someUser})
+    pageCommunity.join(1, {'from': accounts[2]})
+
+    gasRecorder.record(scenario, 'addModerator', pageCommunity.addModerator(1, accounts[2], {'from': pageVoteForCommon}))
+    gasRecorder.record(scenario, 'addBannedUser', pageCommunity.addBannedUser(1, someUser, {'from': accounts[2]}))
+    gasRecorder.record(scenario, 'removeBannedUser', pageCommunity.removeBannedUser(1, someUser, {'from': accounts[2]}))
+    gasRecorder.record(scenario, 'removeModerator', pageCommunity.removeModerator(1, accounts[2], {'from': pageVoteForCommon}))
+    gasRecorder.record(scenario, 'setPostOwner', pageCommunity.setPostOwner(1, {'from': pageVoteForCommon}))
+    gasRecorder.record(scenario, 'quit', pageCommunity.quit(1, {'from': someUser}))
+
+
+def test_gas_rate_tiers(gasRecorder, pageCommunity, someUser, deployer):
+    scenario = 'rate_tiers'
+    network.gas_price("65 gwei")
+    pageCommunity.addCommunity('First users')
+    pageCommunity.join(1, {'from': someUser})
+    pageCommunity.join(1, {'from': deployer})
+
+    for i in range(9): pageCommunity.writePost(1, IPFS_HASH, deployer, {'from': someUser})
+    gasRecorder.record(scenario, 'writePost_10th', pageCommunity.writePost(1, IPFS_HASH, deployer, {'from': someUser}))
+    gasRecorder.record(scenario, 'writePost_11th', pageCommunity.writePost(1, IPFS_HASH, deployer, {'from': someUser}))
+
+    for i in range(9): pageCommunity.writeComment(0, IPFS_HASH, False, False, deployer, {'from': deployer})
+    gasRecorder.record(scenario, 'writeComment_10th', pageCommunity.writeComment(0, IPFS_HASH, False, False, deployer, {'from': deployer}))
+    gasRecorder.record(scenario, 'writeComment_11th', pageCommunity.writeComment(0, IPFS_HASH, False, False, deployer, {'from': deployer}))
+
+
+def test_gas_private_community(gasRecorder, pageBank, pageCommunity, pageToken, pageVoteForEarn, someUser, deployer, treasury):
+    scenario = 'private_community'
+    network.gas_price("65 gwei")
+    pageCommunity.addCommunity('First users')
+    pageCommunity.join(1, {'from': someUser})
+    pageCommunity.join(1, {'from': deployer})
+
+    gasRecorder.record(scenario, 'setCommunityPrivate', pageCommunity.setCommunityPrivate(1, True, {'from': deployer}))
+    gasRecorder.record(scenario, 'setPriceForPrivacyAccess', pageBank.setPriceForPrivacyAccess(1, 10, {'from': pageVoteForEarn}))
+
+    pageToken.transfer(someUser, AMOUNT, {'from': treasury})
+    pageToken.approve(pageBank, AMOUNT, {'from': someUser})
+    gasRecorder.record(scenario, 'addBalance', pageBank.addBalance(AMOUNT, {'from': someUser}))
+    gasRecorder.record(scenario, 'payForPrivacyAccess', pageBank.payForPrivacyAccess(100, 1, {'from': someUser}))
+    for communityId in [2, 3, 4]:
+        pageCommunity.addCommunity('Private users')
+        pageBank.setPriceForPrivacyAccess(communityId, 10, {'from': pageVoteForEarn})
+    tx = pageBank.payForPrivacyAccessBatch([2, 3, 4], [100, 100, 100], {'from': someUser})
+    gasRecorder.record(scenario, 'payForPrivacyAccessBatch_3', tx)
+
+    gasRecorder.record(scenario, 'writePost', pageCommunity.writePost(1, IPFS_HASH, deployer, {'from': someUser}))
+    gasRecorder.record(scenario, 'writeComment', pageCommunity.writeComment(0, IPFS_HASH, False, False, deployer, {'from': someUser}))
+    gasRecorder.record(scenario, 'withdraw', pageBank.withdraw(AMOUNT // 2, {'from': someUser}))
+
+
+def test_gas_accrual_mode(gasRecorder, pageBank, pageCommunity, someUser, deployer):
+    scenario = 'accrual_mode'
+    network.gas_price("65 gwei")
+    pageCommunity.addCommunity('First users')
+    pageCommunity.join(1, {'from': someUser})
+    pageCommunity.join(1, {'from': deployer})
+    pageCommunity.writePost(1, IPFS_HASH, deployer, {'from': someUser})
+
+    gasRecorder.record(scenario, 'setAccrualMode', pageBank.setAccrualMode(True, {'from': deployer}))
+    gasRecorder.record(scenario, 'writePost', pageCommunity.writePost(1, IPFS_HASH, deployer, {'from': someUser}))
+    gasRecorder.record(scenario, 'writeComment', pageCommunity.writeComment(0, IPFS_HASH, False, False, deployer, {'from': someUser}))
+    gasRecorder.record(scenario, 'withdraw', pageBank.withdraw(pageBank.balanceOf(someUser), {'from': someUser}))
+    gasRecorder.record(scenario, 'settleTreasury', pageBank.settleTreasury({'from': someUser}))
+
+
+def test_gas_fee_inheritance(gasRecorder, pageBank, pageCommunity, pageVoteForCommon, someUser, deployer):
+    scenario = 'fee_inheritance'
+    network.gas_price("65 gwei")
+    gasRecorder.record(scenario, 'addCommunity_first', pageCommunity.addCommunity('First users'))
+    gasRecorder.record(scenario, 'addCommunity_second', pageCommunity.addCommunity('Second users'))
+    for communityId in [1, 2]:
+        pageCommunity.join(communityId, {'from': someUser})
+        # the owner of a post has to be a member of the community
+        pageCommunity.join(communityId, {'from': deployer})
+        pageCommunity.writePost(communityId, IPFS_HASH, deployer, {'from': someUser})
+
+    gasRecorder.record(scenario, 'updatePostFee', pageBank.updatePostFee(2, 4000, 5000, 0, 9000, {'from': pageVoteForCommon}))
+    gasRecorder.record(scenario, 'writePost_default_fee', pageCommunity.writePost(1, IPFS_HASH, deployer, {'from': someUser}))
+    gasRecorder.record(scenario, 'writePost_voted_fee', pageCommunity.writePost(2, IPFS_HASH, deployer, {'from': someUser}))
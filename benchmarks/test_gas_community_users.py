@@ -0,0 +1,31 @@
+import pytest
+from brownie import ZERO_ADDRESS, chain, reverts, network
+import brownie
+
+PAGE_LIMIT = 100
+CHECKPOINTS = [1000, 10000, 30000]
+
+
+def test_gas_read_community_users(gasRecorder, pageCommunity, accounts):
+    # the gas of reading one page must not depend on the community size,
+    # the community grows to 30,000 members, so it takes a long time on ganache
+    pageCommunity.addCommunity('First users')
+
+    membersCount = 0
+    pageGas = []
+    for checkpoint in CHECKPOINTS:
+        while membersCount < checkpoint:
+            pageCommunity.join(1, {'from': accounts.add(), 'gas_price': 0})
+            membersCount += 1
+
+        assert pageCommunity.readCommunity(1)[4] == membersCount
+        scenario = 'community_users_{}'.format(membersCount)
+        pageGas.append(gasRecorder.record(
+            scenario, 'readCommunityUsers_first', pageCommunity.readCommunityUsers.estimate_gas(1, 0, PAGE_LIMIT)
+        ))
+        pageGas.append(gasRecorder.record(
+            scenario, 'readCommunityUsers_last',
+            pageCommunity.readCommunityUsers.estimate_gas(1, membersCount - PAGE_LIMIT, PAGE_LIMIT)
+        ))
+
+    assert max(pageGas) - min(pageGas) < min(pageGas) * 0.05
@@ -0,0 +1,22 @@
+import pytest
+from brownie import ZERO_ADDRESS, chain, reverts, network
+import brownie
+
+
+def record_nft(gasRecorder, scenario, nft, minter, admin, someUser):
+    network.gas_price("65 gwei")
+    gasRecorder.record(scenario, 'mint_first', nft.mint(admin, {'from': minter}))
+    for i in range(3): nft.mint(admin, {'from': minter})
+    gasRecorder.record(scenario, 'mint', nft.mint(admin, {'from': minter}))
+
+    nft.approve(someUser, 1, {'from': admin})
+    gasRecorder.record(scenario, 'transferFrom', nft.transferFrom(admin, someUser, 1, {'from': admin}))
+    gasRecorder.record(scenario, 'burn', nft.burn(2, {'from': minter}))
+
+
+def test_gas_nft_enumerable(gasRecorder, pageNFT, pageCommunity, admin, someUser):
+    record_nft(gasRecorder, 'nft_enumerable', pageNFT, pageCommunity, admin, someUser)
+
+
+def test_gas_nft_lean(gasRecorder, pageNFTLean, deployer, admin, someUser):
+    record_nft(gasRecorder, 'nft_lean', pageNFTLean, deployer, admin, someUser)
@@ -0,0 +1,31 @@
+import pytest
+from brownie import network
+import brownie
+
+from tests.conftest import PageSystem
+
+IPFS_HASH = 'QmdfTbBqBPQ7VNxZEYEj14VmRuZBkqFbiwReogJgS1zR1n'
+
+
+@pytest.mark.parametrize('proxy', [None, 'page', 'uups'])
+def test_gas_proxy_hops(accounts, gasRecorder, someUser, deployer, proxy):
+    """
+    writePost goes through Community, NFT, Bank, CalcUserRate, Oracle and Token,
+    so the difference with the direct deployment is the overhead of these proxy hops.
+    transfer of PAGE tokens is a single hop.
+    """
+    scenario = 'proxy_' + (proxy or 'direct')
+    network.gas_price("65 gwei")
+    system = PageSystem(accounts, proxy)
+    pageCommunity = system.get('pageCommunity')
+    pageToken = system.get('pageToken')
+
+    pageCommunity.addCommunity('First users')
+    pageCommunity.join(1, {'from': someUser})
+    pageCommunity.join(1, {'from': deployer})
+    pageCommunity.writePost(1, IPFS_HASH, deployer, {'from': someUser})
+    pageCommunity.writeComment(0, IPFS_HASH, False, False, deployer, {'from': deployer})
+
+    gasRecorder.record(scenario, 'writePost', pageCommunity.writePost(1, IPFS_HASH, deployer, {'from': someUser}))
+    gasRecorder.record(scenario, 'writeComment', pageCommunity.writeComment(0, IPFS_HASH, False, False, deployer, {'from': deployer}))
+    gasRecorder.record(scenario, 'token_transfer', pageToken.transfer(someUser, 100, {'from': system.treasury}))
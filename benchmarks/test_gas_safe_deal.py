@@ -0,0 +1,62 @@
+import pytest
+from brownie import Wei, accounts, chain, network
+import brownie
+
+from relayer.permit import sign_permit
+
+MESSAGE_COUNT = 500
+MESSAGE = 'The goods were sent today, the tracking number is in the attachment.'
+
+
+@pytest.mark.parametrize('isMessageHash', [False, True])
+def test_gas_deal_messages(gasRecorder, pageSafeDeal, pageToken, pageBank, pageOracle, deployer, someUser, admin, isMessageHash):
+    scenario = 'deal_messages_hash' if isMessageHash else 'deal_messages_storage'
+    network.gas_price("65 gwei")
+    if isMessageHash:
+        pageSafeDeal.setMessageHashMode(True, {'from': deployer})
+
+    value = Wei('1 ether')/5
+    currentTime = pageSafeDeal.currentTime()
+    mintAmount = pageOracle.getFromWethToPageAmount(pageSafeDeal.GUARANTOR_FEE())
+    pageToken.mint(someUser, mintAmount, {'from': pageBank})
+    pageToken.approve(pageSafeDeal, mintAmount, {'from': someUser})
+    pageSafeDeal.makeDeal('deal', deployer, admin, currentTime + 100, currentTime + 1000, value, True, {'from': someUser, 'value': value})
+    dealId = pageSafeDeal.dealCount()
+
+    gasRecorder.record(scenario, 'addMessage_1st', pageSafeDeal.addMessage(dealId, MESSAGE, {'from': someUser}))
+    for i in range(MESSAGE_COUNT - 2): pageSafeDeal.addMessage(dealId, MESSAGE, {'from': deployer})
+    tx = pageSafeDeal.addMessage(dealId, MESSAGE, {'from': someUser})
+    gasRecorder.record(scenario, 'addMessage_{}th'.format(MESSAGE_COUNT), tx)
+    gasRecorder.record(scenario, 'setIssue', pageSafeDeal.setIssue(dealId, MESSAGE, {'from': someUser}))
+
+    if not isMessageHash:
+        readRange = pageSafeDeal.readMessagesDeal['uint256,uint256,uint256']
+        gasRecorder.record(scenario, 'readMessagesDeal_50', readRange.estimate_gas(dealId, 0, 50))
+        gasRecorder.record(scenario, 'readMessagesDeal_{}'.format(MESSAGE_COUNT), readRange.estimate_gas(dealId, 0, 2 ** 256 - 1))
+        gasRecorder.record(
+            scenario, 'readMessagesDeal_all', pageSafeDeal.readMessagesDeal['uint256'].estimate_gas(dealId)
+        )
+
+
+@pytest.mark.parametrize('isEth', [False, True])
+def test_gas_make_deal(gasRecorder, pageSafeDeal, pageToken, pageBank, pageOracle, deployer, admin, isEth):
+    scenario = 'make_deal_eth' if isEth else 'make_deal_tokens'
+    network.gas_price("65 gwei")
+    buyer = accounts.add()
+    deployer.transfer(buyer, '1 ether')
+    bonus = pageOracle.getFromWethToPageAmount(pageSafeDeal.GUARANTOR_FEE())
+    amount = Wei('1 ether')/5 if isEth else 1000
+    allowance = bonus if isEth else bonus + amount
+    pageToken.mint(buyer, allowance * 2, {'from': pageBank})
+    currentTime = pageSafeDeal.currentTime()
+    options = {'from': buyer, 'value': amount if isEth else 0}
+
+    gasRecorder.record(scenario, 'approve', pageToken.approve(pageSafeDeal, allowance, {'from': buyer}))
+    tx = pageSafeDeal.makeDeal('deal', deployer, admin, currentTime + 100, currentTime + 1000, amount, isEth, options)
+    gasRecorder.record(scenario, 'makeDeal', tx)
+
+    permit = sign_permit(buyer.private_key, chain.id, pageToken, buyer, pageSafeDeal, allowance, 0, currentTime + 1000)
+    tx = pageSafeDeal.makeDealWithPermit(
+        'deal', deployer, admin, currentTime + 100, currentTime + 1000, amount, isEth, permit, options
+    )
+    gasRecorder.record(scenario, 'makeDealWithPermit', tx)
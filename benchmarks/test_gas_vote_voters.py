@@ -0,0 +1,24 @@
+import pytest
+from brownie import ZERO_ADDRESS, chain, reverts, network
+import brownie
+
+duration = 86400 * 4
+
+
+@pytest.mark.parametrize('voterCount', [10, 1000, 10000])
+def test_gas_put_vote_voters(voterCount, gasRecorder, pageVoteForCommon, pageCommunity, deployer, accounts):
+    # the gas of putVote must not depend on the number of voters before it
+    scenario = 'vote_voters_{}'.format(voterCount)
+    network.gas_price("1 gwei")
+    pageCommunity.addCommunity('First users')
+    pageVoteForCommon.createVote(1, 'test for vote', duration, 2, [10, 11, 12, 13], ZERO_ADDRESS, {'from': deployer})
+
+    for i in range(voterCount):
+        voter = accounts.add()
+        deployer.transfer(voter, '0.001 ether')
+        pageCommunity.join(1, {'from': voter})
+        tx = pageVoteForCommon.putVote(1, 0, i % 2 == 0, {'from': voter})
+        if i == 0:
+            gasRecorder.record(scenario, 'putVote_first', tx)
+    gasRecorder.record(scenario, 'putVote_last', tx)
+    assert pageVoteForCommon.readVote(1, 0)[8] == voterCount
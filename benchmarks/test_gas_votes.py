@@ -0,0 +1,85 @@
+import pytest
+from brownie import ZERO_ADDRESS, chain, reverts, network
+import brownie
+
+duration = 86400 * 4
+
+
+def test_gas_common_vote(chain, accounts, gasRecorder, pageVoteForCommon, pageCommunity, pageToken, someUser, deployer, treasury):
+    scenario = 'vote_common'
+    network.gas_price("65 gwei")
+    pageCommunity.addCommunity('First users')
+    pageCommunity.join(1, {'from': someUser})
+    pageCommunity.join(1, {'from': deployer})
+    pageToken.transfer(someUser, 1000, {'from': treasury})
+    pageToken.transfer(deployer, 1000, {'from': treasury})
+
+    tx = pageVoteForCommon.createVote(1, 'test for vote', duration, 2, [10, 11, 12, 13], ZERO_ADDRESS, {'from': accounts[0]})
+    gasRecorder.record(scenario, 'createVote', tx)
+    gasRecorder.record(scenario, 'putVote_first', pageVoteForCommon.putVote(1, 0, True, {'from': someUser}))
+    gasRecorder.record(scenario, 'putVote_second', pageVoteForCommon.putVote(1, 0, True, {'from': deployer}))
+
+    chain.sleep(duration + 10)
+    gasRecorder.record(scenario, 'executeVote', pageVoteForCommon.executeVote(1, 0, {'from': someUser}))
+
+
+def test_gas_privacy_price_vote(chain, accounts, gasRecorder, pageVoteForEarn, pageCommunity, pageToken, someUser, deployer, treasury):
+    scenario = 'vote_privacy_price'
+    network.gas_price("65 gwei")
+    pageCommunity.addCommunity('First users')
+    pageCommunity.join(1, {'from': someUser})
+    pageCommunity.join(1, {'from': deployer})
+    pageToken.transfer(someUser, 1000, {'from': treasury})
+    pageToken.transfer(deployer, 1000, {'from': treasury})
+
+    tx = pageVoteForEarn.createPrivacyAccessPriceVote(1, 'test for vote', duration, 10, {'from': accounts[0]})
+    gasRecorder.record(scenario, 'createPrivacyAccessPriceVote', tx)
+    gasRecorder.record(scenario, 'putPrivacyAccessPriceVote', pageVoteForEarn.putPrivacyAccessPriceVote(1, 0, True, {'from': someUser}))
+    pageVoteForEarn.putPrivacyAccessPriceVote(1, 0, True, {'from': deployer})
+
+    chain.sleep(duration + 10)
+    gasRecorder.record(scenario, 'executePrivacyAccessPriceVote', pageVoteForEarn.executePrivacyAccessPriceVote(1, 0, {'from': someUser}))
+
+
+def test_gas_token_transfer_vote(chain, accounts, gasRecorder, pageVoteForEarn, pageCommunity, pageBank, pageToken, someUser, deployer, treasury):
+    scenario = 'vote_token_transfer'
+    network.gas_price("65 gwei")
+    pageCommunity.addCommunity('First users')
+    pageCommunity.join(1, {'from': someUser})
+    pageCommunity.join(1, {'from': deployer})
+    pageToken.transfer(someUser, 100, {'from': treasury})
+    pageToken.transfer(deployer, 100, {'from': treasury})
+
+    pageBank.setPriceForPrivacyAccess(1, 1, {'from': pageVoteForEarn})
+    pageToken.approve(pageBank, 100, {'from': treasury})
+    pageBank.addBalance(100, {'from': treasury})
+    pageBank.payForPrivacyAccess(100, 1, {'from': treasury})
+
+    tx = pageVoteForEarn.createTokenTransferVote(1, 'test for vote', duration, 2, accounts[5], {'from': accounts[0]})
+    gasRecorder.record(scenario, 'createTokenTransferVote', tx)
+    gasRecorder.record(scenario, 'putTokenTransferVote', pageVoteForEarn.putTokenTransferVote(1, 0, True, {'from': someUser}))
+    pageVoteForEarn.putTokenTransferVote(1, 0, True, {'from': deployer})
+
+    chain.sleep(duration + 10)
+    gasRecorder.record(scenario, 'executeTokenTransferVote', pageVoteForEarn.executeTokenTransferVote(1, 0, {'from': someUser}))
+
+
+def test_gas_super_moderator_vote(chain, gasRecorder, pageVoteForSuperModerator, pageCommunity, pageVoteForCommon, pageToken, someUser, deployer, treasury):
+    scenario = 'vote_super_moderator'
+    network.gas_price("65 gwei")
+    pageCommunity.addCommunity('First users')
+    pageCommunity.addCommunity('Second users')
+    pageCommunity.join(1, {'from': someUser})
+    pageCommunity.join(2, {'from': deployer})
+    pageCommunity.addModerator(1, someUser, {'from': pageVoteForCommon})
+    pageCommunity.addModerator(2, deployer, {'from': pageVoteForCommon})
+    pageToken.transfer(someUser, 100, {'from': treasury})
+    pageToken.transfer(deployer, 100, {'from': treasury})
+
+    tx = pageVoteForSuperModerator.createVote(1, 'Vote for superadmin', duration, treasury, {'from': someUser})
+    gasRecorder.record(scenario, 'createVote', tx)
+    gasRecorder.record(scenario, 'putVote_first', pageVoteForSuperModerator.putVote(1, 0, True, {'from': someUser}))
+    gasRecorder.record(scenario, 'putVote_second', pageVoteForSuperModerator.putVote(2, 0, True, {'from': deployer}))
+
+    chain.sleep(duration + 10)
+    gasRecorder.record(scenario, 'executeVote', pageVoteForSuperModerator.executeVote(1, 0, {'from': someUser}))
@@ -0,0 +1,31 @@
+import pytest
+from brownie import ZERO_ADDRESS, chain, reverts, network
+import brownie
+
+IPFS_HASH = 'QmdfTbBqBPQ7VNxZEYEj14VmRuZBkqFbiwReogJgS1zR1n'
+BATCH_SIZES = [1, 10, 100]
+
+
+def test_gas_write_comments_batch(gasRecorder, pageCommunity, deployer):
+    # gas per comment must go down with the batch size,
+    # the checks and the mint are paid once per batch
+    scenario = 'comment_batch_sizes'
+    network.gas_price("65 gwei")
+    pageCommunity.addCommunity('First users')
+    pageCommunity.join(1, {'from': deployer})
+    pageCommunity.writePost(1, IPFS_HASH, deployer, {'from': deployer})
+
+    tx = pageCommunity.writeComment(0, IPFS_HASH, False, False, deployer, {'from': deployer})
+    singleGas = gasRecorder.record(scenario, 'writeComment', tx)
+
+    gasPerComment = []
+    for batchSize in BATCH_SIZES:
+        tx = pageCommunity.writeComments(
+            1, [0] * batchSize, [IPFS_HASH] * batchSize, [False] * batchSize, [False] * batchSize, deployer,
+            {'from': deployer}
+        )
+        gasPerComment.append(gasRecorder.record(scenario, 'writeComments_{}'.format(batchSize), tx) / batchSize)
+
+    assert gasPerComment[0] < singleGas * 1.05
+    assert gasPerComment[1] < gasPerComment[0]
+    assert gasPerComment[2] < gasPerComment[1]
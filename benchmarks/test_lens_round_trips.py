@@ -0,0 +1,76 @@
+import time
+
+import pytest
+from brownie import ZERO_ADDRESS, chain, reverts, network, web3
+import brownie
+
+POSTS_COUNT = 20
+COMMENTS_COUNT = 3
+
+
+@pytest.fixture
+def rpcCounter(monkeypatch):
+    counter = {'calls': 0}
+    makeRequest = web3.provider.make_request
+
+    def counted_request(method, params):
+        if method == 'eth_call':
+            counter['calls'] += 1
+        return makeRequest(method, params)
+
+    monkeypatch.setattr(web3.provider, 'make_request', counted_request)
+    return counter
+
+
+def read_feed_per_item(pageCommunity):
+    posts = []
+    for postId in pageCommunity.getPostsIdsByCommunityId(1):
+        readPost = pageCommunity.readPost(postId)
+        comments = [pageCommunity.readComment(postId, i) for i in range(pageCommunity.getCommentCount(postId))]
+        posts.append((readPost, comments))
+    return posts
+
+
+def read_feed_with_lens(pageLens):
+    posts = pageLens.readFeed(1, 0, POSTS_COUNT)
+    return [(post, pageLens.readCommentsRange(post[0], 0, post[7])) for post in posts]
+
+
+def test_lens_round_trips(pageLens, pageCommunity, someUser, deployer, rpcCounter):
+    pageCommunity.addCommunity('First users')
+    pageCommunity.join(1, {'from': someUser})
+    pageCommunity.join(1, {'from': deployer})
+    for i in range(POSTS_COUNT):
+        pageCommunity.writePost(1, 'post ' + str(i), deployer, {'from': someUser})
+    pageCommunity.writeComments(
+        1,
+        [postId for postId in range(POSTS_COUNT) for j in range(COMMENTS_COUNT)],
+        ['comment'] * POSTS_COUNT * COMMENTS_COUNT,
+        [False] * POSTS_COUNT * COMMENTS_COUNT,
+        [False] * POSTS_COUNT * COMMENTS_COUNT,
+        deployer,
+        {'from': someUser}
+    )
+
+    rpcCounter['calls'] = 0
+    start = time.perf_counter()
+    perItemPosts = read_feed_per_item(pageCommunity)
+    perItemTime = time.perf_counter() - start
+    perItemCalls = rpcCounter['calls']
+
+    rpcCounter['calls'] = 0
+    start = time.perf_counter()
+    lensPosts = read_feed_with_lens(pageLens)
+    lensTime = time.perf_counter() - start
+    lensCalls = rpcCounter['calls']
+
+    print('per item: {} eth_call, {:.3f}s'.format(perItemCalls, perItemTime))
+    print('lens: {} eth_call, {:.3f}s'.format(lensCalls, lensTime))
+    # getPostsIdsByCommunityId + readPost, getCommentCount and readComment for every post
+    assert perItemCalls == 1 + POSTS_COUNT * (2 + COMMENTS_COUNT)
+    # readFeed + readCommentsRange for every post
+    assert lensCalls == 1 + POSTS_COUNT
+    assert len(lensPosts) == len(perItemPosts)
+    for (post, comments), (readPost, readComments) in zip(lensPosts, perItemPosts):
+        assert post[1:] == readPost
+        assert [comment[2:] for comment in comments] == readComments
@@ -6,6 +6,8 @@ import "@uniswap/contracts/interfaces/IUniswapV3Pool.sol";
 import "@openzeppelin/contracts/access/OwnableUpgradeable.sol";
 import "@openzeppelin/contracts/access/AccessControlUpgradeable.sol";
 
+import "./proxy/CryptoPageUUPSUpgradeable.sol";
+
 import "./interfaces/ICryptoPageBank.sol";
 import "./interfaces/ICryptoPageToken.sol";
 import "./interfaces/ICryptoPageCalcUserRate.sol";
@@ -21,12 +23,12 @@ contract PageBank is
     Initializable,
     OwnableUpgradeable,
     AccessControlUpgradeable,
+    PageUUPSUpgradeable,
     IPageBank
 {
     bytes32 public constant MINTER_ROLE = keccak256("MINTER_ROLE");
     bytes32 public constant BURNER_ROLE = keccak256("BURNER_ROLE");
     bytes32 public constant UPDATER_FEE_ROLE = keccak256("UPDATER_FEE_ROLE");
-    bytes32 public constant DEFINE_FEE_ROLE = keccak256("DEFINE_FEE_ROLE");
     bytes32 public constant CHANGE_PRICE_ROLE = keccak256("CHANGE_PRICE_ROLE");
     bytes32 public constant VOTE_FOR_EARN_ROLE = keccak256("VOTE_FOR_EARN_ROLE");
 
@@ -62,9 +64,19 @@ contract PageBank is
         uint64 removeCommentCreatorFee;
     }
 
+    // fees changed by voting for posts or for comments of a community, they take one slot
+    struct FeeOverride {
+        uint32 createOwnerFee;
+        uint32 createCreatorFee;
+        uint32 removeOwnerFee;
+        uint32 removeCreatorFee;
+        bool isDefined;
+    }
+
+    // fees copied for the communities which were created before the fee overrides, see "syncFeeOverrides()"
     mapping(uint256 => CommunityFee) private communityFee;
 
-    // user -> communityId -> finished time
+    // user -> communityId -> finished time, only for the payments made before the packed table
     mapping(address => mapping(uint256 => uint256)) private endPrivacyTime;
     // communityId -> balance of PAGE tokens
     mapping(uint256 => uint256) private communityBalance;
@@ -84,6 +96,21 @@ contract PageBank is
     // Storage balance per address
     mapping(address => uint256) private _balances;
 
+    /// If true, PAGE tokens are accrued in the ledgers and minted in bulk later
+    bool public isAccrualMode;
+    /// Tokens credited to the users balances but not yet minted to the bank
+    uint256 public pendingMint;
+    /// Tokens of the treasury share not yet minted to the treasury
+    uint256 public treasuryAccrued;
+
+    // communityId -> fees for posts, the default fees are used until a vote changes them
+    mapping(uint256 => FeeOverride) private postFeeOverride;
+    // communityId -> fees for comments, the default fees are used until a vote changes them
+    mapping(uint256 => FeeOverride) private commentFeeOverride;
+
+    // user -> communityId / 4 -> four uint64 finished times of privacy access
+    mapping(address => mapping(uint256 => uint256)) private packedEndPrivacyTime;
+
     event Withdraw(address indexed user, uint256 amount);
     event TransferFromCommunity(address indexed user, uint256 amount);
     event AddedBalance(address indexed user, uint256 amount);
@@ -91,11 +118,44 @@ contract PageBank is
     event PaidForPrivacyAccess(address indexed user, uint256 indexed communityId, uint256 amount);
     event SetPriceForPrivacyAccess(uint256 oldValue, uint256 newValue);
 
-    event MintForPost(uint256 indexed communityId, address owner, address creator, uint256 amount);
-    event MintForComment(uint256 indexed communityId, address owner, address creator, uint256 amount);
+    // amount is the calculated value, the other amounts are parts of it for owner, creator and treasury
+    event MintForPost(
+        uint256 indexed communityId,
+        address indexed owner,
+        address indexed creator,
+        uint256 amount,
+        uint256 ownerAmount,
+        uint256 creatorAmount,
+        uint256 treasuryAmount
+    );
+    event MintForComment(
+        uint256 indexed communityId,
+        address indexed owner,
+        address indexed creator,
+        uint256 amount,
+        uint256 ownerAmount,
+        uint256 creatorAmount,
+        uint256 treasuryAmount
+    );
 
-    event BurnForPost(uint256 indexed communityId, address owner, address creator, uint256 amount);
-    event BurnForComment(uint256 indexed communityId, address owner, address creator, uint256 amount);
+    event BurnForPost(
+        uint256 indexed communityId,
+        address indexed owner,
+        address indexed creator,
+        uint256 amount,
+        uint256 ownerAmount,
+        uint256 creatorAmount,
+        uint256 treasuryAmount
+    );
+    event BurnForComment(
+        uint256 indexed communityId,
+        address indexed owner,
+        address indexed creator,
+        uint256 amount,
+        uint256 ownerAmount,
+        uint256 creatorAmount,
+        uint256 treasuryAmount
+    );
 
     event UpdatePostFee(
         uint256 indexed communityId,
@@ -121,6 +181,10 @@ contract PageBank is
     event SetToken(address indexed token);
     event SetTreasuryFee(uint256 treasuryFee, uint256 newTreasuryFee);
 
+    event SetAccrualMode(bool isAccrualMode);
+    event SettledPendingMint(uint256 amount);
+    event SettledTreasury(address indexed treasury, uint256 amount);
+
     /**
      * @dev Makes the initialization of the initial values for the smart contract
      *
@@ -171,39 +235,36 @@ contract PageBank is
     }
 
     /**
-     * @dev Sets the default commission values for creating and removing posts.
-     * These values will be automatically assigned when a new community is created.
-     *
-     * @param communityId An identification number of community
-     */
-    function definePostFeeForNewCommunity(uint256 communityId) external override onlyRole(MINTER_ROLE) returns(bool) {
-        CommunityFee storage fee = communityFee[communityId];
-
-        fee.createPostOwnerFee = defaultCreatePostOwnerFee;
-        fee.createPostCreatorFee = defaultCreatePostCreatorFee;
-        fee.removePostOwnerFee = defaultRemovePostOwnerFee;
-        fee.removePostCreatorFee = defaultRemovePostCreatorFee;
-        return true;
-    }
-
-    /**
-     * @dev Sets the default commission values for creating and removing comments.
-     * These values will be automatically assigned when a new community is created.
+     * @dev Moves the fees which were copied for the communities before the fee overrides
+     * into the overrides and clears the old values. Only the fees which differ from the default fees
+     * are moved, the other communities keep inheriting the default fees.
+     * Until it is called the fees are read from the old values, see "resolvePostFee()".
+     * Used once after the upgrade.
      *
-     * @param communityId An identification number of community
+     * @param fromCommunityId ID of the first community in the range
+     * @param toCommunityId ID of the community after the range
      */
-    function defineCommentFeeForNewCommunity(uint256 communityId) external override onlyRole(MINTER_ROLE) returns(bool) {
-        CommunityFee storage fee = communityFee[communityId];
-
-        fee.createCommentOwnerFee = defaultCreateCommentOwnerFee;
-        fee.createCommentCreatorFee = defaultCreateCommentCreatorFee;
-        fee.removeCommentOwnerFee = defaultRemoveCommentOwnerFee;
-        fee.removeCommentCreatorFee = defaultRemoveCommentCreatorFee;
-        return true;
+    function syncFeeOverrides(uint256 fromCommunityId, uint256 toCommunityId) external override onlyOwner {
+        for (uint256 communityId = fromCommunityId; communityId < toCommunityId; communityId++) {
+            if (!postFeeOverride[communityId].isDefined) {
+                FeeOverride memory postFee = readLegacyPostFee(communityId);
+                if (postFee.isDefined) {
+                    postFeeOverride[communityId] = postFee;
+                }
+            }
+            if (!commentFeeOverride[communityId].isDefined) {
+                FeeOverride memory commentFee = readLegacyCommentFee(communityId);
+                if (commentFee.isDefined) {
+                    commentFeeOverride[communityId] = commentFee;
+                }
+            }
+            delete communityFee[communityId];
+        }
     }
 
     /**
      * @dev Reads the values of commissions from the community for creating and removing posts.
+     * These are the default values until a vote of the community changes them.
      *
      * @param communityId An identification number of community
      */
@@ -213,16 +274,17 @@ contract PageBank is
         uint64 removePostOwnerFee,
         uint64 removePostCreatorFee
     ) {
-        CommunityFee memory fee = communityFee[communityId];
+        FeeOverride memory fee = resolvePostFee(communityId);
 
-        createPostOwnerFee = fee.createPostOwnerFee;
-        createPostCreatorFee = fee.createPostCreatorFee;
-        removePostOwnerFee = fee.removePostOwnerFee;
-        removePostCreatorFee = fee.removePostCreatorFee;
+        createPostOwnerFee = fee.createOwnerFee;
+        createPostCreatorFee = fee.createCreatorFee;
+        removePostOwnerFee = fee.removeOwnerFee;
+        removePostCreatorFee = fee.removeCreatorFee;
     }
 
     /**
      * @dev Reads the values of commissions from the community for creating and removing comments.
+     * These are the default values until a vote of the community changes them.
      *
      * @param communityId An identification number of community
      */
@@ -232,12 +294,12 @@ contract PageBank is
         uint64 removeCommentOwnerFee,
         uint64 removeCommentCreatorFee
     ) {
-        CommunityFee memory fee = communityFee[communityId];
+        FeeOverride memory fee = resolveCommentFee(communityId);
 
-        createCommentOwnerFee = fee.createCommentOwnerFee;
-        createCommentCreatorFee = fee.createCommentCreatorFee;
-        removeCommentOwnerFee = fee.removeCommentOwnerFee;
-        removeCommentCreatorFee = fee.removeCommentCreatorFee;
+        createCommentOwnerFee = fee.createOwnerFee;
+        createCommentCreatorFee = fee.createCreatorFee;
+        removeCommentOwnerFee = fee.removeOwnerFee;
+        removeCommentCreatorFee = fee.removeCreatorFee;
     }
 
     /**
@@ -252,11 +314,9 @@ contract PageBank is
         uint64 newRemovePostOwnerFee,
         uint64 newRemovePostCreatorFee
     ) external override onlyRole(UPDATER_FEE_ROLE) {
-        CommunityFee storage fee = communityFee[communityId];
-        fee.createPostOwnerFee = newCreatePostOwnerFee;
-        fee.createPostCreatorFee = newCreatePostCreatorFee;
-        fee.removePostOwnerFee = newRemovePostOwnerFee;
-        fee.removePostCreatorFee = newRemovePostCreatorFee;
+        postFeeOverride[communityId] = toFeeOverride(
+            newCreatePostOwnerFee, newCreatePostCreatorFee, newRemovePostOwnerFee, newRemovePostCreatorFee
+        );
 
         emit UpdatePostFee(communityId,
             newCreatePostOwnerFee,
@@ -278,11 +338,9 @@ contract PageBank is
         uint64 newRemoveCommentOwnerFee,
         uint64 newRemoveCommentCreatorFee
     ) external override onlyRole(UPDATER_FEE_ROLE) {
-        CommunityFee storage fee = communityFee[communityId];
-        fee.createCommentOwnerFee = newCreateCommentOwnerFee;
-        fee.createCommentCreatorFee = newCreateCommentCreatorFee;
-        fee.removeCommentOwnerFee = newRemoveCommentOwnerFee;
-        fee.removeCommentCreatorFee = newRemoveCommentCreatorFee;
+        commentFeeOverride[communityId] = toFeeOverride(
+            newCreateCommentOwnerFee, newCreateCommentCreatorFee, newRemoveCommentOwnerFee, newRemoveCommentCreatorFee
+        );
 
         emit UpdateCommentFee(communityId,
             newCreateCommentOwnerFee,
@@ -306,16 +364,18 @@ contract PageBank is
         address creator,
         uint256 gas
     ) external override onlyRole(MINTER_ROLE) returns (uint256 amount) {
-        amount = convertGasToTokenAmount(gas + FOR_MINT_GAS_AMOUNT);
-        int256 creatorPercent = calcUserRate.checkCommunityActivity(communityId, creator, DataTypes.ActivityType.POST);
-        amount = correctAmount(amount, creatorPercent);
+        amount = correctAmount(
+            convertGasToTokenAmount(gas + FOR_MINT_GAS_AMOUNT),
+            calcUserRate.checkCommunityActivity(communityId, creator, DataTypes.ActivityType.POST)
+        );
         require(amount > 0, "PageBank: wrong amount");
 
-        mintUserPageToken(owner, amount, communityFee[communityId].createPostOwnerFee);
-        mintUserPageToken(creator, amount, communityFee[communityId].createPostCreatorFee);
-        mintTreasuryPageToken(amount);
-
-        emit MintForPost(communityId, owner, creator, amount);
+        FeeOverride memory fee = resolvePostFee(communityId);
+        emit MintForPost(communityId, owner, creator, amount,
+            mintUserPageToken(owner, amount, fee.createOwnerFee),
+            mintUserPageToken(creator, amount, fee.createCreatorFee),
+            mintTreasuryPageToken(amount)
+        );
     }
 
     /**
@@ -332,16 +392,28 @@ contract PageBank is
         address creator,
         uint256 gas
     ) external override onlyRole(MINTER_ROLE) returns (uint256 amount) {
-        amount = convertGasToTokenAmount(gas + FOR_MINT_GAS_AMOUNT);
-        int256 creatorPercent = calcUserRate.checkCommunityActivity(communityId, creator, DataTypes.ActivityType.MESSAGE);
-        amount = correctAmount(amount, creatorPercent);
-        require(amount > 0, "PageBank: wrong amount");
-
-        mintUserPageToken(owner, amount, communityFee[communityId].createCommentOwnerFee);
-        mintUserPageToken(creator, amount, communityFee[communityId].createCommentCreatorFee);
-        mintTreasuryPageToken(amount);
+        amount = mintTokenForComments(communityId, owner, creator, gas, 1);
+    }
 
-        emit MintForComment(communityId, owner, creator, amount);
+    /**
+     * @dev Calculates the equivalent number of tokens for gas consumption of several comments.
+     * Makes a mint of new tokens once for all comments.
+     *
+     * @param communityId An identification number of community
+     * @param owner The owner address
+     * @param creator The creator address
+     * @param gas Gas used for all comments
+     * @param count Number of comments
+     */
+    function mintTokenForNewComments(
+        uint256 communityId,
+        address owner,
+        address creator,
+        uint256 gas,
+        uint256 count
+    ) external override onlyRole(MINTER_ROLE) returns (uint256 amount) {
+        require(count > 0, "PageBank: wrong count");
+        amount = mintTokenForComments(communityId, owner, creator, gas, count);
     }
 
     function addUpDownActivity(
@@ -372,11 +444,12 @@ contract PageBank is
     ) external override onlyRole(BURNER_ROLE) returns (uint256 amount) {
         amount = convertGasToTokenAmount(gas + FOR_BURN_GAS_AMOUNT);
 
-        burnUserPageToken(owner, amount, communityFee[communityId].removePostOwnerFee);
-        burnUserPageToken(creator, amount, communityFee[communityId].removePostCreatorFee);
-        mintTreasuryPageToken(amount);
-
-        emit BurnForPost(communityId, owner, creator, amount);
+        FeeOverride memory fee = resolvePostFee(communityId);
+        emit BurnForPost(communityId, owner, creator, amount,
+            burnUserPageToken(owner, amount, fee.removeOwnerFee),
+            burnUserPageToken(creator, amount, fee.removeCreatorFee),
+            mintTreasuryPageToken(amount)
+        );
     }
 
     /**
@@ -395,11 +468,12 @@ contract PageBank is
     ) external override onlyRole(BURNER_ROLE) returns (uint256 amount) {
         amount = convertGasToTokenAmount(gas + FOR_BURN_GAS_AMOUNT);
 
-        burnUserPageToken(owner, amount, communityFee[communityId].removeCommentOwnerFee);
-        burnUserPageToken(creator, amount, communityFee[communityId].removeCommentCreatorFee);
-        mintTreasuryPageToken(amount);
-
-        emit BurnForComment(communityId, owner, creator, amount);
+        FeeOverride memory fee = resolveCommentFee(communityId);
+        emit BurnForComment(communityId, owner, creator, amount,
+            burnUserPageToken(owner, amount, fee.removeOwnerFee),
+            burnUserPageToken(creator, amount, fee.removeCreatorFee),
+            mintTreasuryPageToken(amount)
+        );
     }
 
     /**
@@ -410,6 +484,7 @@ contract PageBank is
     function withdraw(uint256 amount) external override {
         require(_balances[_msgSender()] >= amount, "PageBank: not enough balance of tokens");
         _balances[_msgSender()] -= amount;
+        settlePendingMint();
         require(token.transfer(_msgSender(),  amount), "PageBank: wrong transfer of tokens");
         emit Withdraw(_msgSender(), amount);
     }
@@ -426,6 +501,16 @@ contract PageBank is
         emit AddedBalance(_msgSender(), amount);
     }
 
+    /**
+     * @dev Mints the accrued tokens of the treasury share.
+     * Anyone can call it.
+     *
+     */
+    function settleTreasury() external override {
+        require(treasuryAccrued > 0, "PageBank: nothing to settle");
+        settleTreasuryAccrued();
+    }
+
     /**
      * @dev Set the new value of price for privacy access.
      *
@@ -453,6 +538,7 @@ contract PageBank is
     {
         require(communityBalance[communityId] >= amount, "PageBank: not enough balance of tokens");
         communityBalance[communityId] -= amount;
+        settlePendingMint();
         require(token.transfer(wallet,  amount), "PageBank: wrong transfer of tokens");
         emit TransferFromCommunity(wallet, amount);
         return true;
@@ -466,19 +552,27 @@ contract PageBank is
      */
     function payForPrivacyAccess(uint256 amount, uint256 communityId) external override {
         address sender = _msgSender();
-        uint256 price = privacyPrice[communityId];
-        require(amount > 0, "PageBank: wrong amount");
-        require(price > 0, "PageBank: wrong price");
-
-        uint256 daysCount = amount / price;
-        uint256 payAmount = daysCount * price;
+        uint256 payAmount = addPrivacyAccess(sender, amount, communityId);
         require(_balances[sender] >= payAmount, "PageBank: incorrect amount on the user's balance");
-
         _balances[sender] -= payAmount;
-        communityBalance[communityId] += payAmount;
-        endPrivacyTime[sender][communityId] += block.timestamp + (daysCount * 1 days);
+    }
 
-        emit PaidForPrivacyAccess(_msgSender(), communityId, amount);
+    /**
+     * @dev Pay tokens for privacy access to several communities at once.
+     * The balance of the user is checked and changed once for all payments.
+     *
+     * @param communityIds IDs of communities
+     * @param amounts Amounts of tokens for each community
+     */
+    function payForPrivacyAccessBatch(uint256[] memory communityIds, uint256[] memory amounts) external override {
+        require(communityIds.length == amounts.length, "PageBank: wrong length");
+        address sender = _msgSender();
+        uint256 payAmount;
+        for (uint256 i = 0; i < communityIds.length; i++) {
+            payAmount += addPrivacyAccess(sender, amounts[i], communityIds[i]);
+        }
+        require(_balances[sender] >= payAmount, "PageBank: incorrect amount on the user's balance");
+        _balances[sender] -= payAmount;
     }
 
     /**
@@ -500,12 +594,13 @@ contract PageBank is
     }
 
     /**
-     * @dev Changes default commission values for all new communities.
+     * @dev Changes default commission values for all communities which did not change them by voting.
      *
      * @param index Order number of the commission
      * @param newValue New commission value
      */
     function setDefaultFee(uint256 index, uint64 newValue) external override onlyOwner {
+        require(newValue <= type(uint32).max, "PageBank: wrong fee value");
         if (index == 0) {
             emit SetDefaultFee(index, defaultCreatePostOwnerFee, newValue);
             defaultCreatePostOwnerFee = newValue;
@@ -584,6 +679,22 @@ contract PageBank is
         emit SetToken(newToken);
     }
 
+    /**
+     * @dev Turns on or off the accrual mode.
+     * When the mode is turned off, all accrued tokens are minted.
+     *
+     * @param newValue New value for the accrual mode
+     */
+    function setAccrualMode(bool newValue) external override onlyOwner {
+        require(isAccrualMode != newValue, "PageBank: wrong value for accrual mode");
+        isAccrualMode = newValue;
+        if (!newValue) {
+            settlePendingMint();
+            settleTreasuryAccrued();
+        }
+        emit SetAccrualMode(newValue);
+    }
+
     /**
      * @dev Changes the value of the fee for the Treasury.
      *
@@ -602,7 +713,22 @@ contract PageBank is
      * @param communityId ID of community
      */
     function isPrivacyAvailable(address user, uint256 communityId) external view override returns(bool) {
-        return endPrivacyTime[user][communityId] > block.timestamp;
+        return readEndPrivacyTime(user, communityId) > block.timestamp;
+    }
+
+    /**
+     * @dev Returns the finished times of privacy access of the user for several communities.
+     *
+     * @param user Address of user
+     * @param communityIds IDs of communities
+     */
+    function privacyExpiries(address user, uint256[] memory communityIds) external view override returns(
+        uint64[] memory expiries
+    ) {
+        expiries = new uint64[](communityIds.length);
+        for (uint256 i = 0; i < communityIds.length; i++) {
+            expiries[i] = uint64(readEndPrivacyTime(user, communityIds[i]));
+        }
     }
 
     // *** --- Private area --- ***
@@ -613,8 +739,8 @@ contract PageBank is
      * @param gas Gas used
      * @return PAGE token's count
      */
-    function convertGasToTokenAmount(uint256 gas) private view returns (uint256) {
-        return oracle.getFromWethToPageAmount(gas * tx.gasprice);
+    function convertGasToTokenAmount(uint256 gas) private returns (uint256) {
+        return oracle.convertFromWethToPageAmount(gas * tx.gasprice);
     }
 
     /**
@@ -622,9 +748,14 @@ contract PageBank is
      *
      * @param amount Amount of tokens
      */
-    function mintTreasuryPageToken(uint256 amount) private {
+    function mintTreasuryPageToken(uint256 amount) private returns (uint256 treasuryAmount) {
         require(treasury != address(0), "PageBank: wrong treasury address");
-        token.mint(treasury, amount * treasuryFee / ALL_PERCENT);
+        treasuryAmount = amount * treasuryFee / ALL_PERCENT;
+        if (isAccrualMode) {
+            treasuryAccrued += treasuryAmount;
+            return treasuryAmount;
+        }
+        token.mint(treasury, treasuryAmount);
     }
 
     /**
@@ -634,11 +765,15 @@ contract PageBank is
      * @param amount Amount of tokens
      * @param userFee Fee for operation
      */
-    function mintUserPageToken(address user, uint256 amount, uint256 userFee) private {
+    function mintUserPageToken(address user, uint256 amount, uint256 userFee) private returns (uint256 userAmount) {
         require(user != address(0), "PageBank: wrong user address");
 
-        uint256 userAmount = amount * userFee / ALL_PERCENT;
-        token.mint(address(this), userAmount);
+        userAmount = amount * userFee / ALL_PERCENT;
+        if (isAccrualMode) {
+            pendingMint += userAmount;
+        } else {
+            token.mint(address(this), userAmount);
+        }
         _balances[user] += userAmount;
     }
 
@@ -649,14 +784,236 @@ contract PageBank is
      * @param amount Amount of tokens
      * @param userFee Fee for operation
      */
-    function burnUserPageToken(address user, uint256 amount, uint256 userFee) private {
+    function burnUserPageToken(address user, uint256 amount, uint256 userFee) private returns (uint256 userAmount) {
         require(user != address(0), "PageBank: wrong user address");
 
-        uint256 userAmount = amount * userFee / ALL_PERCENT;
-        token.burn(address(this), userAmount);
+        userAmount = amount * userFee / ALL_PERCENT;
+        uint256 pending = pendingMint;
+        if (pending >= userAmount) {
+            pendingMint = pending - userAmount;
+        } else {
+            pendingMint = 0;
+            token.burn(address(this), userAmount - pending);
+        }
         _balances[user] -= userAmount;
     }
 
+    /**
+     * @dev Mints to the bank the tokens already credited to the users balances.
+     *
+     */
+    function settlePendingMint() private {
+        uint256 amount = pendingMint;
+        if (amount > 0) {
+            pendingMint = 0;
+            token.mint(address(this), amount);
+            emit SettledPendingMint(amount);
+        }
+    }
+
+    /**
+     * @dev Mints to the treasury the accrued tokens of the treasury share.
+     *
+     */
+    function settleTreasuryAccrued() private {
+        uint256 amount = treasuryAccrued;
+        if (amount > 0) {
+            require(treasury != address(0), "PageBank: wrong treasury address");
+            treasuryAccrued = 0;
+            token.mint(treasury, amount);
+            emit SettledTreasury(treasury, amount);
+        }
+    }
+
+    /**
+     * @dev Calculates the equivalent number of tokens for gas consumption. Makes a mint of new tokens.
+     *
+     * @param communityId An identification number of community
+     * @param owner The owner address
+     * @param creator The creator address
+     * @param gas Gas used
+     * @param count Number of comments
+     */
+    function mintTokenForComments(
+        uint256 communityId,
+        address owner,
+        address creator,
+        uint256 gas,
+        uint256 count
+    ) private returns (uint256 amount) {
+        amount = correctAmount(
+            convertGasToTokenAmount(gas + FOR_MINT_GAS_AMOUNT),
+            calcUserRate.checkCommunityActivities(communityId, creator, DataTypes.ActivityType.MESSAGE, count)
+        );
+        require(amount > 0, "PageBank: wrong amount");
+
+        FeeOverride memory fee = resolveCommentFee(communityId);
+        emit MintForComment(communityId, owner, creator, amount,
+            mintUserPageToken(owner, amount, fee.createOwnerFee),
+            mintUserPageToken(creator, amount, fee.createCreatorFee),
+            mintTreasuryPageToken(amount)
+        );
+    }
+
+    /**
+     * @dev Returns the fees of the community for posts: the values changed by voting,
+     * the values copied before the fee overrides or the default values.
+     *
+     * @param communityId An identification number of community
+     */
+    function resolvePostFee(uint256 communityId) private view returns(FeeOverride memory fee) {
+        fee = postFeeOverride[communityId];
+        if (!fee.isDefined) {
+            fee = readLegacyPostFee(communityId);
+        }
+        if (!fee.isDefined) {
+            fee = FeeOverride(
+                uint32(defaultCreatePostOwnerFee),
+                uint32(defaultCreatePostCreatorFee),
+                uint32(defaultRemovePostOwnerFee),
+                uint32(defaultRemovePostCreatorFee),
+                false
+            );
+        }
+    }
+
+    /**
+     * @dev Returns the fees of the community for comments: the values changed by voting,
+     * the values copied before the fee overrides or the default values.
+     *
+     * @param communityId An identification number of community
+     */
+    function resolveCommentFee(uint256 communityId) private view returns(FeeOverride memory fee) {
+        fee = commentFeeOverride[communityId];
+        if (!fee.isDefined) {
+            fee = readLegacyCommentFee(communityId);
+        }
+        if (!fee.isDefined) {
+            fee = FeeOverride(
+                uint32(defaultCreateCommentOwnerFee),
+                uint32(defaultCreateCommentCreatorFee),
+                uint32(defaultRemoveCommentOwnerFee),
+                uint32(defaultRemoveCommentCreatorFee),
+                false
+            );
+        }
+    }
+
+    /**
+     * @dev Returns the post fees copied for the community before the fee overrides.
+     * They are not defined if nothing was copied or if they are equal to the default fees.
+     *
+     * @param communityId An identification number of community
+     */
+    function readLegacyPostFee(uint256 communityId) private view returns(FeeOverride memory fee) {
+        CommunityFee storage legacy = communityFee[communityId];
+        uint64 createOwnerFee = legacy.createPostOwnerFee;
+        uint64 createCreatorFee = legacy.createPostCreatorFee;
+        uint64 removeOwnerFee = legacy.removePostOwnerFee;
+        uint64 removeCreatorFee = legacy.removePostCreatorFee;
+        bool isCopied = (createOwnerFee | createCreatorFee | removeOwnerFee | removeCreatorFee) > 0;
+        bool isDefault = createOwnerFee == defaultCreatePostOwnerFee
+            && createCreatorFee == defaultCreatePostCreatorFee
+            && removeOwnerFee == defaultRemovePostOwnerFee
+            && removeCreatorFee == defaultRemovePostCreatorFee;
+        if (isCopied && !isDefault) {
+            fee = toFeeOverride(createOwnerFee, createCreatorFee, removeOwnerFee, removeCreatorFee);
+        }
+    }
+
+    /**
+     * @dev Returns the comment fees copied for the community before the fee overrides.
+     * They are not defined if nothing was copied or if they are equal to the default fees.
+     *
+     * @param communityId An identification number of community
+     */
+    function readLegacyCommentFee(uint256 communityId) private view returns(FeeOverride memory fee) {
+        CommunityFee storage legacy = communityFee[communityId];
+        uint64 createOwnerFee = legacy.createCommentOwnerFee;
+        uint64 createCreatorFee = legacy.createCommentCreatorFee;
+        uint64 removeOwnerFee = legacy.removeCommentOwnerFee;
+        uint64 removeCreatorFee = legacy.removeCommentCreatorFee;
+        bool isCopied = (createOwnerFee | createCreatorFee | removeOwnerFee | removeCreatorFee) > 0;
+        bool isDefault = createOwnerFee == defaultCreateCommentOwnerFee
+            && createCreatorFee == defaultCreateCommentCreatorFee
+            && removeOwnerFee == defaultRemoveCommentOwnerFee
+            && removeCreatorFee == defaultRemoveCommentCreatorFee;
+        if (isCopied && !isDefault) {
+            fee = toFeeOverride(createOwnerFee, createCreatorFee, removeOwnerFee, removeCreatorFee);
+        }
+    }
+
+    /**
+     * @dev Packs the fees into one slot.
+     *
+     * @param createOwnerFee Fee of the owner for creating
+     * @param createCreatorFee Fee of the creator for creating
+     * @param removeOwnerFee Fee of the owner for removing
+     * @param removeCreatorFee Fee of the creator for removing
+     */
+    function toFeeOverride(
+        uint64 createOwnerFee,
+        uint64 createCreatorFee,
+        uint64 removeOwnerFee,
+        uint64 removeCreatorFee
+    ) private pure returns(FeeOverride memory) {
+        require(
+            (createOwnerFee | createCreatorFee | removeOwnerFee | removeCreatorFee) <= type(uint32).max,
+            "PageBank: wrong fee value"
+        );
+        return FeeOverride(
+            uint32(createOwnerFee), uint32(createCreatorFee), uint32(removeOwnerFee), uint32(removeCreatorFee), true
+        );
+    }
+
+    /**
+     * @dev Prolongs the privacy access of the user for the paid days and adds the payment to the community.
+     * The balance of the user is changed by the caller.
+     *
+     * @param user Address of user
+     * @param amount An amount of tokens
+     * @param communityId ID of community
+     */
+    function addPrivacyAccess(address user, uint256 amount, uint256 communityId) private returns(uint256 payAmount) {
+        uint256 price = privacyPrice[communityId];
+        require(amount > 0, "PageBank: wrong amount");
+        require(price > 0, "PageBank: wrong price");
+
+        uint256 daysCount = amount / price;
+        payAmount = daysCount * price;
+        communityBalance[communityId] += payAmount;
+
+        uint256 endTime = readEndPrivacyTime(user, communityId);
+        if (endTime < block.timestamp) {
+            endTime = block.timestamp;
+        }
+        endTime += daysCount * 1 days;
+        require(endTime <= type(uint64).max, "PageBank: wrong privacy time");
+
+        uint256 shift = (communityId % 4) * 64;
+        mapping(uint256 => uint256) storage packed = packedEndPrivacyTime[user];
+        packed[communityId / 4] = packed[communityId / 4] & ~(uint256(type(uint64).max) << shift) | (endTime << shift);
+        if (endPrivacyTime[user][communityId] > 0) {
+            delete endPrivacyTime[user][communityId];
+        }
+
+        emit PaidForPrivacyAccess(user, communityId, amount);
+    }
+
+    /**
+     * @dev Returns the finished time of privacy access from the packed table
+     * or from the payments made before it.
+     *
+     * @param user Address of user
+     * @param communityId ID of community
+     */
+    function readEndPrivacyTime(address user, uint256 communityId) private view returns(uint256 endTime) {
+        endTime = uint64(packedEndPrivacyTime[user][communityId / 4] >> ((communityId % 4) * 64));
+        if (endTime == 0) {
+            endTime = endPrivacyTime[user][communityId];
+        }
+    }
+
     function correctAmount(uint256 currentAmount, int256 percent) private view returns(uint256 newAmount) {
         int256 creatorAmount = int256(currentAmount) * percent / int256(ALL_PERCENT);
         if (creatorAmount > 0) {
@@ -682,4 +1039,10 @@ contract PageBank is
         defaultRemoveCommentOwnerFee = 0;
         defaultRemoveCommentCreatorFee = 9000;
     }
+
+    /**
+     * @dev Only the owner can upgrade the contract behind {PageUUPSProxy}.
+     *
+     */
+    function _authorizeUpgrade(address) internal override onlyOwner {}
 }
@@ -4,6 +4,8 @@ pragma solidity 0.8.12;
 
 import "@openzeppelin/contracts/access/AccessControlUpgradeable.sol";
 
+import "./proxy/CryptoPageUUPSUpgradeable.sol";
+
 import "./interfaces/ICryptoPageCalcUserRate.sol";
 import "./interfaces/ICryptoPageUserRateToken.sol";
 import "./interfaces/ICryptoPageCommunity.sol";
@@ -18,6 +20,7 @@ import {DataTypes} from './libraries/DataTypes.sol';
 contract PageCalcUserRate is
 Initializable,
 AccessControlUpgradeable,
+PageUUPSUpgradeable,
 IPageCalcUserRate
 {
 
@@ -109,15 +112,26 @@ IPageCalcUserRate
         DataTypes.ActivityType activityType
     ) external override onlyRole(BANK_ROLE) returns(int256 resultPercent)
     {
-        addActivity(communityId, user, activityType);
-        uint256 baseTokenId = communityId * TOKEN_ID_MULTIPLYING_FACTOR;
-
-        checkMessages(baseTokenId, communityId, user);
-        checkPosts(baseTokenId, communityId, user);
-        checkUps(baseTokenId, communityId, user);
-        checkDowns(baseTokenId, communityId, user);
+        return checkActivity(communityId, user, activityType, 1);
+    }
 
-        return calcPercent(user, baseTokenId);
+    /**
+     * @dev The main function for users who write several messages at once.
+     * Keeps records of user activities.
+     *
+     * @param communityId ID of community
+     * @param user User wallet address
+     * @param activityType Activity type, taken from enum
+     * @param count Number of activities
+     */
+    function checkCommunityActivities(
+        uint256 communityId,
+        address user,
+        DataTypes.ActivityType activityType,
+        uint256 count
+    ) external override onlyRole(BANK_ROLE) returns(int256 resultPercent)
+    {
+        return checkActivity(communityId, user, activityType, count);
     }
 
     /**
@@ -145,6 +159,8 @@ IPageCalcUserRate
 
     /**
      * @dev Calculates the percentage for accruing tokens when creating a post or message.
+     * The rating tokens minted to the user in the community are taken from the redeemed counters,
+     * so no calls to the rating token are made.
      *
      * @param user User wallet address
      * @param baseTokenId Token ID for rating tokens
@@ -152,29 +168,14 @@ IPageCalcUserRate
     function calcPercent(address user, uint256 baseTokenId) public view returns(int256 resultPercent) {
         resultPercent = 0;
         uint256[10] memory weight = interestAdjustment;
-        uint256[] memory messageAmount = new uint256[](3);
-        uint256[] memory postAmount = new uint256[](3);
-        uint256[] memory upAmount = new uint256[](2);
-        uint256[] memory downAmount = new uint256[](2);
-
-        messageAmount[0] = userRateToken.balanceOf(user, baseTokenId + uint256(UserRatesType.TEN_MESSAGE) + 0);
-        messageAmount[1] = userRateToken.balanceOf(user, baseTokenId + uint256(UserRatesType.TEN_MESSAGE) + 1);
-        messageAmount[2] = userRateToken.balanceOf(user, baseTokenId + uint256(UserRatesType.TEN_MESSAGE) + 2);
-
-        postAmount[0] = userRateToken.balanceOf(user, baseTokenId + uint256(UserRatesType.TEN_POST) + 0);
-        postAmount[1] = userRateToken.balanceOf(user, baseTokenId + uint256(UserRatesType.TEN_POST) + 1);
-        postAmount[2] = userRateToken.balanceOf(user, baseTokenId + uint256(UserRatesType.TEN_POST) + 2);
-
-        upAmount[0] = userRateToken.balanceOf(user, baseTokenId + uint256(UserRatesType.HUNDRED_UP) + 0);
-        upAmount[1] = userRateToken.balanceOf(user, baseTokenId + uint256(UserRatesType.HUNDRED_UP) + 1);
-
-        downAmount[0] = userRateToken.balanceOf(user, baseTokenId + uint256(UserRatesType.HUNDRED_DOWN) + 0);
-        downAmount[1] = userRateToken.balanceOf(user, baseTokenId + uint256(UserRatesType.HUNDRED_DOWN) + 1);
-
-        resultPercent += int256(weight[0] * messageAmount[0] + weight[1] * messageAmount[1] + weight[2] * messageAmount[2]);
-        resultPercent += int256(weight[3] * postAmount[0] + weight[4] * postAmount[1] + weight[5] * postAmount[2]);
-        resultPercent += int256(weight[6] * upAmount[0] + weight[7] * upAmount[1]);
-        resultPercent -= int256(weight[8] * downAmount[0] + weight[9] * downAmount[1]);
+        RedeemedCount memory tiers = redeemedCounter[baseTokenId / TOKEN_ID_MULTIPLYING_FACTOR][user];
+
+        resultPercent += int256(
+            weight[0] * tiers.messageCount[0] + weight[1] * tiers.messageCount[1] + weight[2] * tiers.messageCount[2]
+        );
+        resultPercent += int256(weight[3] * tiers.postCount[0] + weight[4] * tiers.postCount[1] + weight[5] * tiers.postCount[2]);
+        resultPercent += int256(weight[6] * tiers.upCount[0] + weight[7] * tiers.upCount[1]);
+        resultPercent -= int256(weight[8] * tiers.downCount[0] + weight[9] * tiers.downCount[1]);
     }
 
     /**
@@ -236,155 +237,101 @@ IPageCalcUserRate
     // *** --- Private area --- ***
 
     /**
-     * @dev Checking and counting user messages.
-     *
-     * @param tokenId Token ID for rating tokens
-     * @param communityId ID of community
-     * @param user User wallet address
-     */
-    function checkMessages(uint256 tokenId, uint256 communityId, address user) private {
-        uint256 realMessageCount = activityCounter[communityId][user].messageCount;
-
-        checkMessagesByIndex(tokenId, communityId, user, realMessageCount, 0);
-        checkMessagesByIndex(tokenId, communityId, user, realMessageCount, 1);
-        checkMessagesByIndex(tokenId, communityId, user, realMessageCount, 2);
-    }
-
-    /**
-     * @dev Checking and counting user posts.
-     *
-     * @param tokenId Token ID for rating tokens
-     * @param communityId ID of community
-     * @param user User wallet address
-     */
-    function checkPosts(uint256 tokenId, uint256 communityId, address user) private {
-        uint256 realPostCount = activityCounter[communityId][user].postCount;
-
-        checkPostsByIndex(tokenId, communityId, user, realPostCount, 0);
-        checkPostsByIndex(tokenId, communityId, user, realPostCount, 1);
-        checkPostsByIndex(tokenId, communityId, user, realPostCount, 2);
-    }
-
-    /**
-     * @dev Checking and counting user Upvotes.
-     *
-     * @param tokenId Token ID for rating tokens
-     * @param communityId ID of community
-     * @param user User wallet address
-     */
-    function checkUps(uint256 tokenId, uint256 communityId, address user) private {
-        uint256 realUpCount = activityCounter[communityId][user].upCount;
-
-        checkUpsByIndex(tokenId, communityId, user, realUpCount, 0);
-        checkUpsByIndex(tokenId, communityId, user, realUpCount, 1);
-    }
-
-    /**
-     * @dev Checking and counting user Downvotes.
-     *
-     * @param tokenId Token ID for rating tokens
-     * @param communityId ID of community
-     * @param user User wallet address
-     */
-    function checkDowns(uint256 tokenId, uint256 communityId, address user) private {
-        uint256 realDownCount = activityCounter[communityId][user].downCount;
-
-        checkDownsByIndex(tokenId, communityId, user, realDownCount, 0);
-        checkDownsByIndex(tokenId, communityId, user, realDownCount, 1);
-    }
-
-    /**
-     * @dev Checking messages for mint new tokens.
+     * @dev Adds user activities and mints rating tokens for the reached thresholds.
+     * Only the tiers of the changed activity type are checked.
      *
-     * @param tokenId Token ID for rating tokens
      * @param communityId ID of community
      * @param user User wallet address
-     * @param realMessageCount Total user messages
-     * @param index Decimal for count
+     * @param activityType Activity type, taken from enum
+     * @param count Number of activities
      */
-    function checkMessagesByIndex(
-        uint256 tokenId,
+    function checkActivity(
         uint256 communityId,
         address user,
-        uint256 realMessageCount,
-        uint256 index
-    ) private {
+        DataTypes.ActivityType activityType,
+        uint256 count
+    ) private returns(int256 resultPercent)
+    {
+        uint256 realCount = addActivity(communityId, user, activityType, uint64(count));
+        uint256 baseTokenId = communityId * TOKEN_ID_MULTIPLYING_FACTOR;
         RedeemedCount storage redeemCounter = redeemedCounter[communityId][user];
 
-        uint256 number = realMessageCount / (10 * 10**index);
-        uint64 mintNumber = uint64(number) - redeemCounter.messageCount[index];
-        if (mintNumber > 0) {
-            redeemCounter.messageCount[index] += mintNumber;
-            userRateToken.mint(
-                user, tokenId + uint256(UserRatesType.TEN_MESSAGE) + index, mintNumber, FOR_RATE_TOKEN_DATA
-            );
+        if (activityType == DataTypes.ActivityType.MESSAGE) {
+            uint64[3] memory tiers = redeemCounter.messageCount;
+            if (checkTiers(user, baseTokenId + uint256(UserRatesType.TEN_MESSAGE), realCount, 10, 3, tiers)) {
+                redeemCounter.messageCount = tiers;
+            }
         }
-    }
-
-    /**
-     * @dev Checking posts for mint new tokens.
-     *
-     * @param tokenId Token ID for rating tokens
-     * @param communityId ID of community
-     * @param user User wallet address
-     * @param realPostCount Total user posts
-     * @param index Decimal for count
-     */
-    function checkPostsByIndex(uint256 tokenId, uint256 communityId, address user, uint256 realPostCount, uint256 index) private {
-        RedeemedCount storage redeemCounter = redeemedCounter[communityId][user];
-
-        uint256 number = realPostCount / (10 * 10**index);
-        uint256 mintNumber = number - redeemCounter.postCount[index];
-        if (mintNumber > 0) {
-            redeemCounter.postCount[index] += uint64(mintNumber);
-            userRateToken.mint(
-                user, tokenId + uint256(UserRatesType.TEN_POST) + index, mintNumber, FOR_RATE_TOKEN_DATA
-            );
+        if (activityType == DataTypes.ActivityType.POST) {
+            uint64[3] memory tiers = redeemCounter.postCount;
+            if (checkTiers(user, baseTokenId + uint256(UserRatesType.TEN_POST), realCount, 10, 3, tiers)) {
+                redeemCounter.postCount = tiers;
+            }
         }
-    }
-
-    /**
-     * @dev Checking Upvotes for mint new tokens.
-     *
-     * @param tokenId Token ID for rating tokens
-     * @param communityId ID of community
-     * @param user User wallet address
-     * @param realUpCount Total user Upvotes
-     * @param index Decimal for count
-     */
-    function checkUpsByIndex(uint256 tokenId, uint256 communityId, address user, uint256 realUpCount, uint256 index) private {
-        RedeemedCount storage redeemCounter = redeemedCounter[communityId][user];
-
-        uint256 number = realUpCount / (10 * 10**(index+1));
-        uint256 mintNumber = number - redeemCounter.upCount[index];
-        if (mintNumber > 0) {
-            redeemCounter.upCount[index] += uint64(mintNumber);
-            userRateToken.mint(
-                user, tokenId + uint256(UserRatesType.HUNDRED_UP) + index, mintNumber, FOR_RATE_TOKEN_DATA
-            );
+        if (activityType == DataTypes.ActivityType.UP) {
+            uint64[3] memory tiers = [redeemCounter.upCount[0], redeemCounter.upCount[1], 0];
+            if (checkTiers(user, baseTokenId + uint256(UserRatesType.HUNDRED_UP), realCount, 100, 2, tiers)) {
+                redeemCounter.upCount = [tiers[0], tiers[1]];
+            }
+        }
+        if (activityType == DataTypes.ActivityType.DOWN) {
+            uint64[3] memory tiers = [redeemCounter.downCount[0], redeemCounter.downCount[1], 0];
+            if (checkTiers(user, baseTokenId + uint256(UserRatesType.HUNDRED_DOWN), realCount, 100, 2, tiers)) {
+                redeemCounter.downCount = [tiers[0], tiers[1]];
+            }
         }
+
+        return calcPercent(user, baseTokenId);
     }
 
     /**
-     * @dev Checking Downvotes for mint new tokens.
+     * @dev Checks the tiers of one activity type and mints rating tokens for the newly reached tiers.
+     * All new tokens are minted by one call, nothing is called if no tier is reached.
      *
-     * @param tokenId Token ID for rating tokens
-     * @param communityId ID of community
      * @param user User wallet address
-     * @param realDownCount Total user Downvotes
-     * @param index Decimal for count
+     * @param firstTokenId Token ID for rating tokens of the first tier
+     * @param realCount Total user activities of this type
+     * @param firstThreshold Number of activities for the first tier, every next tier is ten times more
+     * @param tiersCount Number of tiers for this type
+     * @param tiers Redeemed counters of tiers, updated in place
+     * @return isChanged True if new rating tokens were minted
      */
-    function checkDownsByIndex(uint256 tokenId, uint256 communityId, address user, uint256 realDownCount, uint256 index) private {
-        RedeemedCount storage redeemCounter = redeemedCounter[communityId][user];
+    function checkTiers(
+        address user,
+        uint256 firstTokenId,
+        uint256 realCount,
+        uint256 firstThreshold,
+        uint256 tiersCount,
+        uint64[3] memory tiers
+    ) private returns(bool isChanged) {
+        uint256[3] memory mintNumbers;
+        uint256 mintCount;
+        uint256 threshold = firstThreshold;
+        for (uint256 index = 0; index < tiersCount; index++) {
+            uint256 number = realCount / threshold;
+            if (number > tiers[index]) {
+                mintNumbers[index] = number - tiers[index];
+                tiers[index] = uint64(number);
+                mintCount++;
+            }
+            threshold *= 10;
+        }
+        if (mintCount == 0) {
+            return false;
+        }
 
-        uint256 number = realDownCount / (10 * 10**(index+1));
-        uint256 mintNumber = number - redeemCounter.downCount[index];
-        if (mintNumber > 0) {
-            redeemCounter.downCount[index] += uint64(mintNumber);
-            userRateToken.mint(
-                user, tokenId + uint256(UserRatesType.HUNDRED_DOWN) + index, mintNumber, FOR_RATE_TOKEN_DATA
-            );
+        uint256[] memory ids = new uint256[](mintCount);
+        uint256[] memory amounts = new uint256[](mintCount);
+        uint256 position;
+        for (uint256 index = 0; index < tiersCount; index++) {
+            if (mintNumbers[index] > 0) {
+                ids[position] = firstTokenId + index;
+                amounts[position] = mintNumbers[index];
+                position++;
+            }
         }
+        userRateToken.mintBatch(user, ids, amounts, FOR_RATE_TOKEN_DATA);
+        return true;
     }
 
     /**
@@ -393,20 +340,37 @@ IPageCalcUserRate
      * @param communityId ID of community
      * @param user User wallet address
      * @param activityType Activity type, taken from enum
+     * @param count Number of activities
+     * @return realCount Total user activities of this type
      */
-    function addActivity(uint256 communityId, address user, DataTypes.ActivityType activityType) private {
+    function addActivity(
+        uint256 communityId,
+        address user,
+        DataTypes.ActivityType activityType,
+        uint64 count
+    ) private returns(uint256 realCount) {
         RateCount storage counter = activityCounter[communityId][user];
         if (activityType == DataTypes.ActivityType.POST) {
-            counter.postCount++;
+            counter.postCount += count;
+            realCount = counter.postCount;
         }
         if (activityType == DataTypes.ActivityType.MESSAGE) {
-            counter.messageCount++;
+            counter.messageCount += count;
+            realCount = counter.messageCount;
         }
         if (activityType == DataTypes.ActivityType.UP) {
-            counter.upCount++;
+            counter.upCount += count;
+            realCount = counter.upCount;
         }
         if (activityType == DataTypes.ActivityType.DOWN) {
-            counter.downCount++;
+            counter.downCount += count;
+            realCount = counter.downCount;
         }
     }
+
+    /**
+     * @dev Only the admin can upgrade the contract behind {PageUUPSProxy}.
+     *
+     */
+    function _authorizeUpgrade(address) internal override onlyRole(DEFAULT_ADMIN_ROLE) {}
 }
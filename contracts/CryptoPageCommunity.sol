@@ -5,10 +5,14 @@ pragma solidity 0.8.12;
 import "@openzeppelin/contracts/access/OwnableUpgradeable.sol";
 import "@openzeppelin/contracts/access/AccessControlUpgradeable.sol";
 import "@openzeppelin/contracts/utils/structs/EnumerableSetUpgradeable.sol";
+import "@openzeppelin/contracts/utils/math/SafeCastUpgradeable.sol";
+
+import "./proxy/CryptoPageUUPSUpgradeable.sol";
 
 import "./interfaces/ICryptoPageNFT.sol";
 import "./interfaces/ICryptoPageBank.sol";
 import "./interfaces/ICryptoPageCommunity.sol";
+import "./libraries/IpfsHash.sol";
 
 
      /**
@@ -19,6 +23,7 @@ contract PageCommunity is
     Initializable,
     OwnableUpgradeable,
     AccessControlUpgradeable,
+    PageUUPSUpgradeable,
     IPageCommunity
 {
     using EnumerableSetUpgradeable for EnumerableSetUpgradeable.AddressSet;
@@ -70,6 +75,34 @@ contract PageCommunity is
         bool isView;
     }
 
+    struct PackedPost {
+        bytes32 digest;
+        address creator;
+        uint32 upCount;
+        uint32 downCount;
+        uint32 commentCount;
+        address owner;
+        uint88 price;
+        bool isView;
+    }
+
+    struct PackedComment {
+        bytes32 digest;
+        address creator;
+        bool isUp;
+        bool isDown;
+        bool isView;
+        address owner;
+        uint88 price;
+    }
+
+    struct MemberStatus {
+        bool isMember;
+        bool isBanned;
+        bool isModerator;
+        uint64 joinedAt;
+    }
+
     mapping(uint256 => Community) private community;
 
     //postId -> Post
@@ -79,6 +112,20 @@ contract PageCommunity is
     //postId -> commentId -> Comment
     mapping(uint256 => mapping(uint256 => Comment)) private comment;
 
+    //postId -> PackedPost
+    mapping(uint256 => PackedPost) private packedPost;
+    //postId -> commentId -> PackedComment
+    mapping(uint256 => mapping(uint256 => PackedComment)) private packedComment;
+
+    //communityId -> user -> MemberStatus
+    mapping(uint256 => mapping(address => MemberStatus)) private memberStatus;
+
+    // The read-aggregation contract, it checks the privacy access of its callers itself
+    address public lens;
+
+    //postId -> IDs of the visible comments which are not burned
+    mapping(uint256 => EnumerableSetUpgradeable.UintSet) private liveCommentIds;
+
 
     event AddedCommunity(address indexed creator, uint256 number, string name);
 
@@ -89,21 +136,47 @@ contract PageCommunity is
     event AddedBannedUser(address indexed admin, uint256 number, address user);
     event RemovedBannedUser(address indexed admin, uint256 number, address user);
 
-    event JoinUser(uint256 indexed communityId, address user);
-    event QuitUser(uint256 indexed communityId, address user);
+    event JoinUser(uint256 indexed communityId, address indexed user);
+    event QuitUser(uint256 indexed communityId, address indexed user);
 
-    event WritePost(uint256 indexed communityId, uint256 postId, address creator, address owner);
-    event BurnPost(uint256 indexed communityId, uint256 postId, address creator, address owner);
-    event ChangePostVisible(uint256 indexed communityId, uint256 postId, bool isVisible);
+    event WritePost(
+        uint256 indexed communityId,
+        uint256 indexed postId,
+        address indexed creator,
+        address owner,
+        string ipfsHash,
+        bytes32 digest,
+        uint256 price
+    );
+    event BurnPost(uint256 indexed communityId, uint256 indexed postId, address indexed creator, address owner);
+    event ChangePostVisible(uint256 indexed communityId, uint256 indexed postId, bool isVisible);
     event ChangeCommunityActive(uint256 indexed communityId, bool isActive);
     event ChangeCommunityPrivate(uint256 indexed communityId, bool isPrivate);
 
-    event WriteComment(uint256 indexed communityId, uint256 postId, uint256 commentId, address creator, address owner);
-    event BurnComment(uint256 indexed communityId, uint256 postId, uint256 commentId, address creator, address owner);
-    event ChangeVisibleComment(uint256 indexed communityId, uint256 postId, uint256 commentId, bool isVisible);
+    event WriteComment(
+        uint256 indexed communityId,
+        uint256 indexed postId,
+        address indexed creator,
+        uint256 commentId,
+        address owner,
+        string ipfsHash,
+        bytes32 digest,
+        bool isUp,
+        bool isDown,
+        uint256 price
+    );
+    event BurnComment(
+        uint256 indexed communityId,
+        uint256 indexed postId,
+        address indexed creator,
+        uint256 commentId,
+        address owner
+    );
+    event ChangeVisibleComment(uint256 indexed communityId, uint256 indexed postId, uint256 commentId, bool isVisible);
 
     event SetMaxModerators(uint256 oldValue, uint256 newValue);
     event ChangeSupervisor(address oldValue, address newValue);
+    event SetLens(address oldValue, address newValue);
 
     modifier validCommunityId(uint256 id) {
         validateCommunity(id);
@@ -111,12 +184,6 @@ contract PageCommunity is
         _;
     }
 
-    modifier onlyCommunityUser(uint256 id) {
-        validateCommunity(id);
-        require(isCommunityActiveUser(id, _msgSender()), "PageCommunity: wrong user");
-        _;
-    }
-
     modifier onlyVoterContract(uint256 id) {
         require(_msgSender() == voterContracts[id], "PageCommunity: wrong user");
         _;
@@ -177,14 +244,13 @@ contract PageCommunity is
         newCommunity.isActive = true;
         newCommunity.name = desc;
 
-        require(bank.definePostFeeForNewCommunity(communityCount), "PageCommunity: wrong define post fee");
-        require(bank.defineCommentFeeForNewCommunity(communityCount), "PageCommunity: wrong define comment fee");
-
         emit AddedCommunity(_msgSender(), communityCount, desc);
     }
 
     /**
      * @dev Returns information about the community.
+     * Users, post IDs and banned users are not returned here,
+     * use the paginated "readCommunityUsers()", "readCommunityPostIds()" and "readCommunityBannedUsers()".
      *
      * @param communityId ID of community
      */
@@ -192,10 +258,9 @@ contract PageCommunity is
         string memory name,
         address creator,
         address[] memory moderators,
-        uint256[] memory postIds,
-        address[] memory users,
-        address[] memory bannedUsers,
+        uint256 postsCount,
         uint256 usersCount,
+        uint256 bannedUsersCount,
         bool isActive,
         bool isPrivate,
         bool isPostOwner
@@ -206,15 +271,96 @@ contract PageCommunity is
         name = currentCommunity.name;
         creator = currentCommunity.creator;
         moderators = currentCommunity.moderators.values();
-        postIds = currentCommunity.postIds.values();
-        users = currentCommunity.users.values();
-        bannedUsers = currentCommunity.bannedUsers.values();
+        postsCount = currentCommunity.postIds.length();
         usersCount = currentCommunity.usersCount;
+        bannedUsersCount = currentCommunity.bannedUsers.length();
         isActive = currentCommunity.isActive;
         isPrivate = currentCommunity.isPrivate;
         isPostOwner = currentCommunity.isPostOwner;
     }
 
+    /**
+     * @dev Returns a range of community users.
+     *
+     * @param communityId ID of community
+     * @param offset Index of the first user in the range
+     * @param limit Maximum number of users in the range
+     */
+    function readCommunityUsers(uint256 communityId, uint256 offset, uint256 limit)
+        external view override validCommunityId(communityId) returns(address[] memory users)
+    {
+        users = readAddressRange(community[communityId].users, offset, limit);
+    }
+
+    /**
+     * @dev Returns a range of community post IDs.
+     *
+     * @param communityId ID of community
+     * @param offset Index of the first post ID in the range
+     * @param limit Maximum number of post IDs in the range
+     */
+    function readCommunityPostIds(uint256 communityId, uint256 offset, uint256 limit)
+        external view override validCommunityId(communityId) returns(uint256[] memory postIds)
+    {
+        EnumerableSetUpgradeable.UintSet storage ids = community[communityId].postIds;
+        uint256 end = getRangeEnd(ids.length(), offset, limit);
+
+        postIds = new uint256[](end - offset);
+        for (uint256 i = offset; i < end; i++) {
+            postIds[i - offset] = ids.at(i);
+        }
+    }
+
+    /**
+     * @dev Returns a range of banned users of the community.
+     *
+     * @param communityId ID of community
+     * @param offset Index of the first banned user in the range
+     * @param limit Maximum number of banned users in the range
+     */
+    function readCommunityBannedUsers(uint256 communityId, uint256 offset, uint256 limit)
+        external view override validCommunityId(communityId) returns(address[] memory bannedUsers)
+    {
+        bannedUsers = readAddressRange(community[communityId].bannedUsers, offset, limit);
+    }
+
+    /**
+     * @dev Returns the status of the user in the community.
+     *
+     * @param communityId ID of community
+     * @param user User address
+     */
+    function readMemberStatus(uint256 communityId, address user) external view override returns(
+        bool isMember,
+        bool isBanned,
+        bool isModerator,
+        uint64 joinedAt
+    ) {
+        MemberStatus memory status = readStatus(communityId, user);
+        return (status.isMember, status.isBanned, status.isModerator, status.joinedAt);
+    }
+
+    /**
+     * @dev Restores the status of users from the community sets.
+     * Used once after the upgrade for users who joined before the status records,
+     * their joining time is the time of the sync.
+     *
+     * @param communityId ID of community
+     * @param users Users addresses
+     */
+    function syncMemberStatus(uint256 communityId, address[] memory users) external override onlyOwner {
+        Community storage currentCommunity = community[communityId];
+        for (uint256 i = 0; i < users.length; i++) {
+            MemberStatus storage status = memberStatus[communityId][users[i]];
+            status.isMember = currentCommunity.users.contains(users[i]);
+            status.isBanned = currentCommunity.bannedUsers.contains(users[i]);
+            status.isModerator = currentCommunity.moderators.contains(users[i]);
+            if (status.isMember && status.joinedAt == 0) {
+                status.joinedAt = uint64(block.timestamp);
+            }
+        }
+    }
+
     /**
      * @dev Adds a moderator for the community.
      * Can only be done by voting.
@@ -230,6 +376,7 @@ contract PageCommunity is
         require(isCommunityActiveUser(communityId, moderator), "PageCommunity: wrong user");
 
         currentCommunity.moderators.add(moderator);
+        memberStatus[communityId][moderator].isModerator = true;
         emit AddedModerator(_msgSender(), communityId, moderator);
     }
 
@@ -246,6 +393,7 @@ contract PageCommunity is
         require(isCommunityModerator(communityId, moderator), "PageCommunity: wrong moderator");
 
         currentCommunity.moderators.remove(moderator);
+        memberStatus[communityId][moderator].isModerator = false;
         emit RemovedModerator(_msgSender(), communityId, moderator);
     }
 
@@ -259,7 +407,7 @@ contract PageCommunity is
         Community storage currentCommunity = community[communityId];
         bool newValue = !currentCommunity.isPostOwner;
         currentCommunity.isPostOwner = newValue;
-        currentCommunity.users.add(address(this));
+        addMember(communityId, address(this));
         currentCommunity.usersCount++;
         emit SetPostOwner(_msgSender(), communityId, newValue);
     }
@@ -274,7 +422,7 @@ contract PageCommunity is
         external override validCommunityId(communityId) onlyVoterContract(1) returns(bool)
     {
         Community storage currentCommunity = community[communityId];
-        address postOwner = post[postId].owner;
+        address postOwner = getPostOwner(postId);
         require(wallet != address(0), "PageCommunity: wrong wallet");
         require(postOwner == address(this), "PageCommunity: wrong owner");
         require(community[communityId].postIds.contains(postId), "PageCommunity: wrong postId");
@@ -298,6 +446,7 @@ contract PageCommunity is
         require(!isBannedUser(communityId, user), "PageCommunity: user is already banned");
 
         currentCommunity.bannedUsers.add(user);
+        memberStatus[communityId][user].isBanned = true;
         emit AddedBannedUser(_msgSender(), communityId, user);
     }
 
@@ -315,6 +464,7 @@ contract PageCommunity is
         require(isBannedUser(communityId, user), "PageCommunity: user is already banned");
 
         currentCommunity.bannedUsers.remove(user);
+        memberStatus[communityId][user].isBanned = false;
         emit RemovedBannedUser(_msgSender(), communityId, user);
     }
 
@@ -324,7 +474,7 @@ contract PageCommunity is
      * @param communityId ID of community
      */
     function join(uint256 communityId) external override validCommunityId(communityId) {
-        community[communityId].users.add(_msgSender());
+        addMember(communityId, _msgSender());
         community[communityId].usersCount++;
         emit JoinUser(communityId, _msgSender());
     }
@@ -336,6 +486,7 @@ contract PageCommunity is
      */
     function quit(uint256 communityId) external override validCommunityId(communityId) {
         community[communityId].users.remove(_msgSender());
+        memberStatus[communityId][_msgSender()].isMember = false;
         community[communityId].usersCount--;
         emit QuitUser(communityId, _msgSender());
     }
@@ -351,28 +502,37 @@ contract PageCommunity is
         uint256 communityId,
         string memory ipfsHash,
         address owner
-    ) external override validCommunityId(communityId) onlyCommunityUser(communityId) {
+    ) external override validCommunityId(communityId) {
         uint256 gasBefore = gasleft();
 
-        if (isCommunityPostOwner(communityId)) {
-            owner = address(this);
-        }
-
-        require(isCommunityActiveUser(communityId, _msgSender()), "PageCommunity: wrong user");
-        require(isCommunityActiveUser(communityId, owner), "PageCommunity: wrong user");
-        require(isPrivacyAccess(_msgSender(), communityId), "PageCommunity: wrong time for privacy access");
-
+        owner = validatePostOwner(communityId, owner);
         uint256 postId = nft.mint(owner);
 
         createPost(postId, owner, ipfsHash);
+        addPost(communityId, postId, owner, ipfsHash, bytes32(0), gasBefore);
+    }
 
-        community[communityId].postIds.add(postId);
-        communityIdByPostId[postId] = communityId;
-        emit WritePost(communityId, postId, _msgSender(), owner);
+    /**
+     * @dev Create a new community post in the packed storage.
+     * The content is stored as the sha2-256 digest of CIDv0.
+     *
+     * @param communityId ID of community
+     * @param digest The sha2-256 digest from the IPFS CIDv0 multihash
+     * @param owner Post owner address
+     */
+    function writePostDigest(
+        uint256 communityId,
+        bytes32 digest,
+        address owner
+    ) external override validCommunityId(communityId) {
+        uint256 gasBefore = gasleft();
+        require(digest != bytes32(0), "PageCommunity: wrong digest");
 
-        uint256 gas = gasBefore - gasleft();
-        uint128 price = uint128(bank.mintTokenForNewPost(communityId, owner, _msgSender(), gas));
-        setPostPrice(postId, price);
+        owner = validatePostOwner(communityId, owner);
+        uint256 postId = nft.mint(owner);
+
+        createPackedPost(postId, owner, digest);
+        addPost(communityId, postId, owner, "", digest, gasBefore);
     }
 
     /**
@@ -392,16 +552,28 @@ contract PageCommunity is
         bool isView
     ) {
         if(isPrivacyAccess(_msgSender(), getCommunityIdByPostId(postId))) {
-            Post storage readed = post[postId];
-            ipfsHash = readed.ipfsHash;
-            creator = readed.creator;
-            owner = readed.owner;
-            upCount = readed.upCount;
-            downCount = readed.downCount;
-            price = readed.price;
-            commentCount = readed.commentCount;
-            upDownUsers = readed.upDownUsers.values();
-            isView = readed.isView;
+            upDownUsers = post[postId].upDownUsers.values();
+            if (isPackedPost(postId)) {
+                PackedPost storage packed = packedPost[postId];
+                ipfsHash = IpfsHash.toCidV0(packed.digest);
+                creator = packed.creator;
+                owner = packed.owner;
+                upCount = packed.upCount;
+                downCount = packed.downCount;
+                price = packed.price;
+                commentCount = packed.commentCount;
+                isView = packed.isView;
+            } else {
+                Post storage readed = post[postId];
+                ipfsHash = readed.ipfsHash;
+                creator = readed.creator;
+                owner = readed.owner;
+                upCount = readed.upCount;
+                downCount = readed.downCount;
+                price = readed.price;
+                commentCount = readed.commentCount;
+                isView = readed.isView;
+            }
         }
     }
 
@@ -413,7 +585,7 @@ contract PageCommunity is
     function burnPost(uint256 postId) external override onlyCommunityActiveByPostId(postId) {
         uint256 gasBefore = gasleft();
         uint256 communityId = getCommunityIdByPostId(postId);
-        address postOwner = post[postId].owner;
+        address postOwner = getPostOwner(postId);
 
         require(isCommunityActiveUser(communityId, _msgSender()) || _msgSender() == supervisor, "PageCommunity: wrong user");
         require(community[communityId].postIds.contains(postId), "PageCommunity: wrong post");
@@ -441,9 +613,13 @@ contract PageCommunity is
         require(community[communityId].postIds.contains(postId), "PageCommunity: wrong post");
         require(isPrivacyAccess(_msgSender(), communityId), "PageCommunity: wrong time for privacy access");
 
-        bool oldVisible = post[postId].isView;
+        bool oldVisible = isPostView(postId);
         require(oldVisible != newVisible, "PageCommunity: wrong new visible");
-        post[postId].isView = newVisible;
+        if (isPackedPost(postId)) {
+            packedPost[postId].isView = newVisible;
+        } else {
+            post[postId].isView = newVisible;
+        }
 
         emit ChangePostVisible(communityId, postId, newVisible);
     }
@@ -486,6 +662,9 @@ contract PageCommunity is
      * @param postId ID of post
      */
     function getPostPrice(uint256 postId) external view override returns (uint256) {
+        if (isPackedPost(postId)) {
+            return packedPost[postId].price;
+        }
         return post[postId].price;
     }
 
@@ -515,23 +694,95 @@ contract PageCommunity is
         address owner
     ) external override onlyCommunityActiveByPostId(postId) {
         uint256 gasBefore = gasleft();
-        uint256 communityId = getCommunityIdByPostId(postId);
+        uint256 communityId = validateCommentOwner(postId, owner);
+
+        uint256 commentId = addComment(postId, isUp, isDown);
+        createComment(postId, commentId, ipfsHash, owner, isUp, isDown);
+
+        uint128 price = SafeCastUpgradeable.toUint128(
+            bank.mintTokenForNewComment(communityId, owner, _msgSender(), gasBefore - gasleft())
+        );
+        finishComment(communityId, postId, commentId, ipfsHash, bytes32(0), isUp, isDown, owner, price);
+    }
+
+    /**
+     * @dev Create a new post comment in the packed storage.
+     * The content is stored as the sha2-256 digest of CIDv0.
+     *
+     * @param postId ID of post
+     * @param digest The sha2-256 digest from the IPFS CIDv0 multihash
+     * @param isUp If true, then adds a rating for the post
+     * @param isDown If true, then removes a rating for the post
+     * @param owner Comment owner address
+     */
+    function writeCommentDigest(
+        uint256 postId,
+        bytes32 digest,
+        bool isUp,
+        bool isDown,
+        address owner
+    ) external override onlyCommunityActiveByPostId(postId) {
+        uint256 gasBefore = gasleft();
+        require(digest != bytes32(0), "PageCommunity: wrong digest");
+        uint256 communityId = validateCommentOwner(postId, owner);
+
+        uint256 commentId = addComment(postId, isUp, isDown);
+        createPackedComment(postId, commentId, digest, owner, isUp, isDown);
 
+        uint128 price = SafeCastUpgradeable.toUint128(
+            bank.mintTokenForNewComment(communityId, owner, _msgSender(), gasBefore - gasleft())
+        );
+        finishComment(communityId, postId, commentId, "", digest, isUp, isDown, owner, price);
+    }
+
+    /**
+     * @dev Create new comments for posts of one community.
+     * Membership and privacy access are checked once for the whole batch,
+     * PAGE tokens are minted for the whole batch by one call to the bank,
+     * the amount is divided equally and the remainder goes to the price of the last comment.
+     *
+     * @param communityId ID of community
+     * @param postIds IDs of posts
+     * @param ipfsHashes Links to the messages in IPFS
+     * @param isUps If true, then adds a rating for the post
+     * @param isDowns If true, then removes a rating for the post
+     * @param owner Comments owner address
+     */
+    function writeComments(
+        uint256 communityId,
+        uint256[] memory postIds,
+        string[] memory ipfsHashes,
+        bool[] memory isUps,
+        bool[] memory isDowns,
+        address owner
+    ) external override validCommunityId(communityId) {
+        uint256 gasBefore = gasleft();
+        uint256 count = postIds.length;
+
+        require(count > 0, "PageCommunity: wrong comments count");
+        require(
+            count == ipfsHashes.length && count == isUps.length && count == isDowns.length,
+            "PageCommunity: wrong arrays length"
+        );
         require(isCommunityActiveUser(communityId, _msgSender()), "PageCommunity: wrong user");
         require(isCommunityActiveUser(communityId, owner), "PageCommunity: wrong user");
-        require(post[postId].isView, "PageCommunity: wrong view post");
         require(isPrivacyAccess(_msgSender(), communityId), "PageCommunity: wrong time for privacy access");
 
-        setPostUpDown(postId, isUp, isDown);
-        createComment(postId, ipfsHash, owner, isUp, isDown);
-        uint256 commentId = getCommentCount(postId);
-
-        emit WriteComment(communityId, postId, commentId, _msgSender(), owner);
-        incCommentCount(postId);
+        uint256[] memory commentIds = new uint256[](count);
+        for (uint256 i = 0; i < count; i++) {
+            require(getCommunityIdByPostId(postIds[i]) == communityId, "PageCommunity: wrong post");
+            require(isPostView(postIds[i]), "PageCommunity: wrong view post");
+            commentIds[i] = addComment(postIds[i], isUps[i], isDowns[i]);
+            createComment(postIds[i], commentIds[i], ipfsHashes[i], owner, isUps[i], isDowns[i]);
+        }
 
-        uint256 gas = gasBefore - gasleft();
-        uint128 price = uint128(bank.mintTokenForNewComment(communityId, owner, _msgSender(), gas));
-        setCommentPrice(postId, commentId, price);
+        uint256 total = bank.mintTokenForNewComments(communityId, owner, _msgSender(), gasBefore - gasleft(), count);
+        for (uint256 i = 0; i < count; i++) {
+            uint128 price = SafeCastUpgradeable.toUint128(i == count - 1 ? total / count + total % count : total / count);
+            finishComment(
+                communityId, postIds[i], commentIds[i], ipfsHashes[i], bytes32(0), isUps[i], isDowns[i], owner, price
+            );
+        }
     }
 
     /**
@@ -550,6 +801,11 @@ contract PageCommunity is
         bool isView
     ) {
         if (isPrivacyAccess(_msgSender(), getCommunityIdByPostId(postId))) {
+            if (isPackedComment(postId, commentId)) {
+                PackedComment memory packed = packedComment[postId][commentId];
+                return (IpfsHash.toCidV0(packed.digest), packed.creator, packed.owner, packed.price,
+                    packed.isUp, packed.isDown, packed.isView);
+            }
             Comment memory readed = comment[postId][commentId];
             ipfsHash = readed.ipfsHash;
             creator = readed.creator;
@@ -571,12 +827,12 @@ contract PageCommunity is
         uint256 gasBefore = gasleft();
         uint256 communityId = getCommunityIdByPostId(postId);
 
-        require(post[postId].isView, "PageCommunity: wrong post");
+        require(isPostView(postId), "PageCommunity: wrong post");
         require(isCommunityModerator(communityId, _msgSender()) || _msgSender() == supervisor, "PageCommunity: access denied");
-        address commentOwner = comment[postId][commentId].owner;
-        address commentCreator = comment[postId][commentId].creator;
+        (address commentCreator, address commentOwner) = getCommentCreatorOwner(postId, commentId);
         eraseComment(postId, commentId);
-        emit BurnComment(communityId, postId, commentId, commentCreator, commentOwner);
+        liveCommentIds[postId].remove(commentId);
+        emit BurnComment(communityId, postId, commentCreator, commentId, commentOwner);
 
         uint256 gas = gasBefore - gasleft();
         bank.burnTokenForComment(communityId, commentOwner, _msgSender(), gas);
@@ -599,9 +855,14 @@ contract PageCommunity is
         require(community[communityId].postIds.contains(postId), "PageCommunity: wrong post");
         require(isPrivacyAccess(_msgSender(), communityId), "PageCommunity: wrong time for privacy access");
 
-        bool oldVisible = comment[postId][commentId].isView;
-        require(oldVisible != newVisible, "PageCommunity: wrong new visible");
-        comment[postId][commentId].isView = newVisible;
+        if (isPackedComment(postId, commentId)) {
+            require(packedComment[postId][commentId].isView != newVisible, "PageCommunity: wrong new visible");
+            packedComment[postId][commentId].isView = newVisible;
+        } else {
+            require(comment[postId][commentId].isView != newVisible, "PageCommunity: wrong new visible");
+            comment[postId][commentId].isView = newVisible;
+        }
+        setLiveComment(postId, commentId, newVisible);
 
         emit ChangeVisibleComment(communityId, postId, commentId, newVisible);
     }
@@ -627,6 +888,16 @@ contract PageCommunity is
         voterContracts.push(newContract);
     }
 
+    /**
+     * @dev Sets the address of the read-aggregation contract.
+     *
+     * @param newLens New lens contract address
+     */
+    function setLens(address newLens) external override onlyOwner {
+        emit SetLens(lens, newLens);
+        lens = newLens;
+    }
+
     /**
      * @dev Changes address for supervisor user
      *
@@ -637,12 +908,68 @@ contract PageCommunity is
         supervisor = newUser;
     }
 
+    /**
+     * @dev Adds the visible comments of the range to the live comment index.
+     * Used once after the upgrade for comments written before the index.
+     *
+     * @param postId ID of post
+     * @param fromCommentId ID of the first comment in the range
+     * @param toCommentId ID of the comment after the range
+     */
+    function syncCommentIds(uint256 postId, uint256 fromCommentId, uint256 toCommentId) external override onlyOwner {
+        uint256 end = toCommentId > getCommentCount(postId) ? getCommentCount(postId) : toCommentId;
+        for (uint256 commentId = fromCommentId; commentId < end; commentId++) {
+            bool isView = isPackedComment(postId, commentId)
+                ? packedComment[postId][commentId].isView
+                : comment[postId][commentId].isView;
+            setLiveComment(postId, commentId, isView);
+        }
+    }
+
+    /**
+     * @dev Returns a range of IDs of the visible comments which are not burned.
+     * The order of IDs changes when a comment is removed from the index.
+     *
+     * @param postId ID of post
+     * @param offset Index of the first comment ID in the range
+     * @param limit Maximum number of comment IDs in the range
+     */
+    function getCommentIds(uint256 postId, uint256 offset, uint256 limit)
+        external view override returns(uint256[] memory commentIds)
+    {
+        if (!isLivePost(postId)) {
+            return commentIds;
+        }
+        EnumerableSetUpgradeable.UintSet storage ids = liveCommentIds[postId];
+        uint256 end = getRangeEnd(ids.length(), offset, limit);
+
+        commentIds = new uint256[](end - offset);
+        for (uint256 i = offset; i < end; i++) {
+            commentIds[i - offset] = ids.at(i);
+        }
+    }
+
+    /**
+     * @dev Returns the number of visible comments which are not burned.
+     *
+     * @param postId ID of post
+     */
+    function getLiveCommentCount(uint256 postId) external view override returns(uint256) {
+        if (!isLivePost(postId)) {
+            return 0;
+        }
+        return liveCommentIds[postId].length();
+    }
+
     /**
      * @dev Returns the number of comments for a post.
      *
      * @param postId ID of post
      */
     function getCommentCount(uint256 postId) public view override returns(uint256) {
+        if (isPackedPost(postId)) {
+            return packedPost[postId].commentCount;
+        }
         return post[postId].commentCount;
     }
 
@@ -663,7 +990,8 @@ contract PageCommunity is
      * @param user Community user address
      */
     function isCommunityActiveUser(uint256 communityId, address user) public view override returns(bool) {
-        return community[communityId].users.contains(user) && !isBannedUser(communityId, user);
+        MemberStatus memory status = readStatus(communityId, user);
+        return status.isMember && !status.isBanned;
     }
 
     /**
@@ -682,7 +1010,7 @@ contract PageCommunity is
      * @param user Community user address
      */
     function isBannedUser(uint256 communityId, address user) public view override returns(bool) {
-        return community[communityId].bannedUsers.contains(user);
+        return readStatus(communityId, user).isBanned;
     }
 
     /**
@@ -692,7 +1020,7 @@ contract PageCommunity is
      * @param user Community moderator address
      */
     function isCommunityModerator(uint256 communityId, address user) public view override returns(bool) {
-        return community[communityId].moderators.contains(user);
+        return readStatus(communityId, user).isModerator;
     }
 
     /**
@@ -742,6 +1070,16 @@ contract PageCommunity is
         return community[communityId].isPrivate;
     }
 
+    /**
+     * @dev Returns a boolean indicating that the user can read the community.
+     *
+     * @param communityId ID of community
+     * @param user Address of user
+     */
+    function hasPrivacyAccess(uint256 communityId, address user) external view override returns(bool) {
+        return isPrivacyAccess(user, communityId);
+    }
+
     // *** --- Private area --- ***
 
     /**
@@ -753,6 +1091,131 @@ contract PageCommunity is
         require(communityId <= communityCount, "PageCommunity: wrong community number");
     }
 
+    /**
+     * @dev Adds the user to the community and sets the joining time.
+     *
+     * @param communityId ID of community
+     * @param user User address
+     */
+    function addMember(uint256 communityId, address user) private {
+        if (community[communityId].users.add(user)) {
+            MemberStatus storage status = memberStatus[communityId][user];
+            status.isMember = true;
+            status.joinedAt = uint64(block.timestamp);
+        }
+    }
+
+    /**
+     * @dev Returns the status of the user in the community. A user who joined before the status records
+     * and was not synced has no joining time, then the status is read from the community sets,
+     * which are still kept for every change of the status.
+     *
+     * @param communityId ID of community
+     * @param user User address
+     */
+    function readStatus(uint256 communityId, address user) private view returns(MemberStatus memory status) {
+        status = memberStatus[communityId][user];
+        if (status.joinedAt == 0) {
+            Community storage currentCommunity = community[communityId];
+            status.isMember = currentCommunity.users.contains(user);
+            status.isBanned = currentCommunity.bannedUsers.contains(user);
+            status.isModerator = currentCommunity.moderators.contains(user);
+        }
+    }
+
+    /**
+     * @dev Returns the end index (exclusive) of the range in a set.
+     * If the offset is out of the set, the range is empty.
+     *
+     * @param length Length of the set
+     * @param offset Index of the first element in the range
+     * @param limit Maximum number of elements in the range
+     */
+    function getRangeEnd(uint256 length, uint256 offset, uint256 limit) private pure returns(uint256) {
+        if (offset >= length) {
+            return offset;
+        }
+        return limit > length - offset ? length : offset + limit;
+    }
+
+    /**
+     * @dev Returns a range of addresses from the set.
+     *
+     * @param set Storage set of addresses
+     * @param offset Index of the first address in the range
+     * @param limit Maximum number of addresses in the range
+     */
+    function readAddressRange(
+        EnumerableSetUpgradeable.AddressSet storage set,
+        uint256 offset,
+        uint256 limit
+    ) private view returns(address[] memory result) {
+        uint256 end = getRangeEnd(set.length(), offset, limit);
+
+        result = new address[](end - offset);
+        for (uint256 i = offset; i < end; i++) {
+            result[i - offset] = set.at(i);
+        }
+    }
+
+    /**
+     * @dev Checks the post writer and returns the post owner.
+     *
+     * @param communityId ID of community
+     * @param owner Post owner address
+     */
+    function validatePostOwner(uint256 communityId, address owner) private view returns(address) {
+        if (isCommunityPostOwner(communityId)) {
+            owner = address(this);
+        }
+
+        require(isCommunityActiveUser(communityId, _msgSender()), "PageCommunity: wrong user");
+        require(isCommunityActiveUser(communityId, owner), "PageCommunity: wrong user");
+        require(isPrivacyAccess(_msgSender(), communityId), "PageCommunity: wrong time for privacy access");
+        return owner;
+    }
+
+    /**
+     * @dev Checks the comment writer and returns the community ID of the post.
+     *
+     * @param postId ID of post
+     * @param owner Comment owner address
+     */
+    function validateCommentOwner(uint256 postId, address owner) private view returns(uint256 communityId) {
+        communityId = getCommunityIdByPostId(postId);
+
+        require(isCommunityActiveUser(communityId, _msgSender()), "PageCommunity: wrong user");
+        require(isCommunityActiveUser(communityId, owner), "PageCommunity: wrong user");
+        require(isPostView(postId), "PageCommunity: wrong view post");
+        require(isPrivacyAccess(_msgSender(), communityId), "PageCommunity: wrong time for privacy access");
+    }
+
+    /**
+     * @dev Adds the post to the community and mints tokens for it.
+     *
+     * @param communityId ID of community
+     * @param postId ID of post
+     * @param owner Post owner address
+     * @param ipfsHash Link to the message in IPFS, empty for the packed post
+     * @param digest The sha2-256 digest of CIDv0, zero for the post with a link
+     * @param gasBefore Gas left at the start of the writing
+     */
+    function addPost(
+        uint256 communityId,
+        uint256 postId,
+        address owner,
+        string memory ipfsHash,
+        bytes32 digest,
+        uint256 gasBefore
+    ) private {
+        community[communityId].postIds.add(postId);
+        communityIdByPostId[postId] = communityId;
+
+        uint128 price = uint128(bank.mintTokenForNewPost(communityId, owner, _msgSender(), gasBefore - gasleft()));
+        setPostPrice(postId, price);
+        emit WritePost(communityId, postId, _msgSender(), owner, ipfsHash, digest, price);
+    }
+
     /**
      * @dev Create a new community post.
      *
@@ -768,12 +1231,31 @@ contract PageCommunity is
         newPost.isView = true;
     }
 
+    /**
+     * @dev Create a new community post in the packed storage.
+     *
+     * @param postId ID of post
+     * @param owner Post owner address
+     * @param digest The sha2-256 digest from the IPFS CIDv0 multihash
+     */
+    function createPackedPost(uint256 postId, address owner, bytes32 digest) private {
+        PackedPost storage newPost = packedPost[postId];
+        newPost.digest = digest;
+        newPost.creator = _msgSender();
+        newPost.owner = owner;
+        newPost.isView = true;
+    }
+
     /**
      * @dev Erase info for the community post.
      *
      * @param postId ID of post
      */
     function erasePost(uint256 postId) private {
+        if (isPackedPost(postId)) {
+            delete packedPost[postId];
+            return;
+        }
         Post storage oldPost = post[postId];
         oldPost.ipfsHash = EMPTY_STRING;
         oldPost.creator = address(0);
@@ -791,6 +1273,10 @@ contract PageCommunity is
      * @param commentId ID of comment
      */
     function eraseComment(uint256 postId, uint256 commentId) private {
+        if (isPackedComment(postId, commentId)) {
+            delete packedComment[postId][commentId];
+            return;
+        }
         Comment storage burned = comment[postId][commentId];
         burned.ipfsHash = EMPTY_STRING;
         burned.creator = address(0);
@@ -808,6 +1294,10 @@ contract PageCommunity is
      * @param price The price value
      */
     function setPostPrice(uint256 postId, uint128 price) private {
+        if (isPackedPost(postId)) {
+            packedPost[postId].price = toPackedPrice(price);
+            return;
+        }
         Post storage curPost = post[postId];
         curPost.price = price;
     }
@@ -818,6 +1308,10 @@ contract PageCommunity is
      * @param postId ID of post
      */
     function incCommentCount(uint256 postId) private {
+        if (isPackedPost(postId)) {
+            packedPost[postId].commentCount++;
+            return;
+        }
         Post storage curPost = post[postId];
         curPost.commentCount++;
     }
@@ -838,13 +1332,23 @@ contract PageCommunity is
 
         Post storage curPost = post[postId];
         uint256 communityId = getCommunityIdByPostId(postId);
-        if (isUp) {
-            curPost.upCount++;
-            bank.addUpDownActivity(communityId, curPost.creator, true);
-        }
-        if (isDown) {
-            curPost.downCount++;
-            bank.addUpDownActivity(communityId, curPost.creator, false);
+        if (isPackedPost(postId)) {
+            PackedPost storage curPacked = packedPost[postId];
+            if (isUp) {
+                curPacked.upCount++;
+            } else {
+                curPacked.downCount++;
+            }
+            bank.addUpDownActivity(communityId, curPacked.creator, isUp);
+        } else {
+            if (isUp) {
+                curPost.upCount++;
+                bank.addUpDownActivity(communityId, curPost.creator, true);
+            }
+            if (isDown) {
+                curPost.downCount++;
+                bank.addUpDownActivity(communityId, curPost.creator, false);
+            }
         }
         curPost.upDownUsers.add(_msgSender());
     }
@@ -853,13 +1357,20 @@ contract PageCommunity is
      * @dev Create a new post comment.
      *
      * @param postId ID of post
+     * @param commentId ID of comment
      * @param ipfsHash Link to the message in IPFS
      * @param owner Post owner address
      * @param isUp If true, then adds a rating for the post
      * @param isDown If true, then removes a rating for the post
      */
-    function createComment(uint256 postId, string memory ipfsHash, address owner, bool isUp, bool isDown) private {
-        uint256 commentId = post[postId].commentCount;
+    function createComment(
+        uint256 postId,
+        uint256 commentId,
+        string memory ipfsHash,
+        address owner,
+        bool isUp,
+        bool isDown
+    ) private {
         Comment storage newComment = comment[postId][commentId];
         newComment.ipfsHash = ipfsHash;
         newComment.creator = _msgSender();
@@ -869,6 +1380,103 @@ contract PageCommunity is
         newComment.isView = true;
     }
 
+    /**
+     * @dev Create a new post comment in the packed storage.
+     *
+     * @param postId ID of post
+     * @param commentId ID of comment
+     * @param digest The sha2-256 digest from the IPFS CIDv0 multihash
+     * @param owner Post owner address
+     * @param isUp If true, then adds a rating for the post
+     * @param isDown If true, then removes a rating for the post
+     */
+    function createPackedComment(
+        uint256 postId,
+        uint256 commentId,
+        bytes32 digest,
+        address owner,
+        bool isUp,
+        bool isDown
+    ) private {
+        PackedComment storage newComment = packedComment[postId][commentId];
+        newComment.digest = digest;
+        newComment.creator = _msgSender();
+        newComment.isUp = isUp;
+        newComment.isDown = isDown;
+        newComment.isView = true;
+        newComment.owner = owner;
+    }
+
+    /**
+     * @dev Reserves an ID for a new comment and updates the post rating.
+     *
+     * @param postId ID of post
+     * @param isUp If true, then adds a rating for the post
+     * @param isDown If true, then removes a rating for the post
+     * @return commentId ID of the new comment
+     */
+    function addComment(uint256 postId, bool isUp, bool isDown) private returns(uint256 commentId) {
+        setPostUpDown(postId, isUp, isDown);
+        commentId = getCommentCount(postId);
+        incCommentCount(postId);
+        liveCommentIds[postId].add(commentId);
+    }
+
+    /**
+     * @dev Adds the comment to the live comment index or removes it from the index.
+     * A burned comment is never added back.
+     *
+     * @param postId ID of post
+     * @param commentId ID of comment
+     * @param isLive If true, then the comment is visible
+     */
+    function setLiveComment(uint256 postId, uint256 commentId, bool isLive) private {
+        (address commentCreator, ) = getCommentCreatorOwner(postId, commentId);
+        if (isLive && commentCreator != address(0)) {
+            liveCommentIds[postId].add(commentId);
+        } else {
+            liveCommentIds[postId].remove(commentId);
+        }
+    }
+
+    /**
+     * @dev Returns a boolean indicating that the post is not burned.
+     * The comment index of a burned post is kept, but is not read.
+     *
+     * @param postId ID of post
+     */
+    function isLivePost(uint256 postId) private view returns(bool) {
+        return community[getCommunityIdByPostId(postId)].postIds.contains(postId);
+    }
+
+    /**
+     * @dev Sets the minted price for the new comment and emits the event with all its data.
+     *
+     * @param communityId ID of community
+     * @param postId ID of post
+     * @param commentId ID of comment
+     * @param ipfsHash Link to the message in IPFS, empty for the packed comment
+     * @param digest The sha2-256 digest of CIDv0, zero for the comment with a link
+     * @param isUp If true, then adds a rating for the post
+     * @param isDown If true, then removes a rating for the post
+     * @param owner Comment owner address
+     * @param price The price value
+     */
+    function finishComment(
+        uint256 communityId,
+        uint256 postId,
+        uint256 commentId,
+        string memory ipfsHash,
+        bytes32 digest,
+        bool isUp,
+        bool isDown,
+        address owner,
+        uint128 price
+    ) private {
+        setCommentPrice(postId, commentId, price);
+        emit WriteComment(communityId, postId, _msgSender(), commentId, owner, ipfsHash, digest, isUp, isDown, price);
+    }
+
     /**
      * @dev Sets price for comment.
      *
@@ -877,10 +1485,82 @@ contract PageCommunity is
      * @param price The price value
      */
     function setCommentPrice(uint256 postId, uint256 commentId, uint128 price) private {
+        if (isPackedComment(postId, commentId)) {
+            packedComment[postId][commentId].price = toPackedPrice(price);
+            return;
+        }
         Comment storage curComment = comment[postId][commentId];
         curComment.price = price;
     }
 
+    /**
+     * @dev Returns a boolean indicating that the post is kept in the packed storage.
+     *
+     * @param postId ID of post
+     */
+    function isPackedPost(uint256 postId) private view returns(bool) {
+        return packedPost[postId].creator != address(0);
+    }
+
+    /**
+     * @dev Returns a boolean indicating that the comment is kept in the packed storage.
+     *
+     * @param postId ID of post
+     * @param commentId ID of comment
+     */
+    function isPackedComment(uint256 postId, uint256 commentId) private view returns(bool) {
+        return packedComment[postId][commentId].creator != address(0);
+    }
+
+    /**
+     * @dev Returns the post owner for both storage layouts.
+     *
+     * @param postId ID of post
+     */
+    function getPostOwner(uint256 postId) private view returns(address) {
+        if (isPackedPost(postId)) {
+            return packedPost[postId].owner;
+        }
+        return post[postId].owner;
+    }
+
+    /**
+     * @dev Returns the post visibility for both storage layouts.
+     *
+     * @param postId ID of post
+     */
+    function isPostView(uint256 postId) private view returns(bool) {
+        if (isPackedPost(postId)) {
+            return packedPost[postId].isView;
+        }
+        return post[postId].isView;
+    }
+
+    /**
+     * @dev Returns the comment creator and owner for both storage layouts.
+     *
+     * @param postId ID of post
+     * @param commentId ID of comment
+     */
+    function getCommentCreatorOwner(uint256 postId, uint256 commentId) private view returns(address, address) {
+        if (isPackedComment(postId, commentId)) {
+            PackedComment storage packed = packedComment[postId][commentId];
+            return (packed.creator, packed.owner);
+        }
+        Comment storage readed = comment[postId][commentId];
+        return (readed.creator, readed.owner);
+    }
+
+    /**
+     * @dev Checks that the price fits into the packed storage.
+     *
+     * @param price The price value
+     */
+    function toPackedPrice(uint128 price) private pure returns(uint88) {
+        require(price <= type(uint88).max, "PageCommunity: wrong price");
+        return uint88(price);
+    }
+
     /**
      * @dev Checks for privacy access.
      *
@@ -888,12 +1568,20 @@ contract PageCommunity is
      * @param communityId ID of community
      */
     function isPrivacyAccess(address user, uint256 communityId) private view returns(bool) {
-        if (!community[communityId].isPrivate || user == supervisor) {
+        if (!community[communityId].isPrivate || user == supervisor || (user == lens && user != address(0))) {
             return true;
         }
+        // the paid times are kept by PageBank together with the payments, so only the users
+        // of private communities who are not the supervisor or the lens reach this call
         if (bank.isPrivacyAvailable(user, communityId)) {
             return true;
         }
         return false;
     }
-}
\ No newline at end of file
+
+    /**
+     * @dev Only the owner can upgrade the contract behind {PageUUPSProxy}.
+     *
+     */
+    function _authorizeUpgrade(address) internal override onlyOwner {}
+}
@@ -0,0 +1,154 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity 0.8.12;
+
+import "@openzeppelin/contracts/utils/ContextUpgradeable.sol";
+
+import "./interfaces/ICryptoPageCommunity.sol";
+import "./interfaces/ICryptoPageLens.sol";
+import {DataTypes} from './libraries/DataTypes.sol';
+
+
+     /**
+     * @dev The contract reads posts and comments of the community in bulk, one call instead of a call per item.
+     * It keeps no state. PageCommunity trusts it for the privacy access, so the access of the caller
+     * is checked here by the same rules, and the posts of a private community are returned empty.
+     *
+     */
+contract PageLens is ContextUpgradeable, IPageLens {
+
+    IPageCommunity public immutable community;
+
+    constructor(address _community) {
+        require(_community != address(0), "PageLens: wrong address");
+        community = IPageCommunity(_community);
+    }
+
+    /**
+     * @dev Returns the smart contract version
+     *
+     */
+    function version() external pure override returns (string memory) {
+        return "1";
+    }
+
+    /**
+     * @dev Returns information about the posts.
+     * Reverts for a post of an inactive community, as PageCommunity.readPost does.
+     *
+     * @param postIds IDs of posts
+     */
+    function readPosts(uint256[] memory postIds) external view override returns(DataTypes.PostView[] memory posts) {
+        posts = new DataTypes.PostView[](postIds.length);
+        for (uint256 i = 0; i < postIds.length; i++) {
+            posts[i] = readPost(postIds[i]);
+        }
+    }
+
+    /**
+     * @dev Returns information about the comments of the post with IDs from `from` to `to` (not included).
+     *
+     * @param postId ID of post
+     * @param from The first comment ID
+     * @param to The comment ID after the last one, it is limited by the comment count
+     */
+    function readCommentsRange(uint256 postId, uint256 from, uint256 to)
+        external view override returns(DataTypes.CommentView[] memory comments)
+    {
+        uint256 count = community.getCommentCount(postId);
+        if (to > count) {
+            to = count;
+        }
+        if (from >= to) {
+            return comments;
+        }
+        comments = new DataTypes.CommentView[](to - from);
+        if (!isAccess(community.getCommunityIdByPostId(postId))) {
+            for (uint256 i = from; i < to; i++) {
+                comments[i - from].postId = postId;
+                comments[i - from].id = i;
+            }
+            return comments;
+        }
+        for (uint256 i = from; i < to; i++) {
+            comments[i - from] = readComment(postId, i);
+        }
+    }
+
+    /**
+     * @dev Returns a range of posts of the community.
+     *
+     * @param communityId ID of community
+     * @param offset Index of the first post
+     * @param limit Maximum number of posts
+     */
+    function readFeed(uint256 communityId, uint256 offset, uint256 limit)
+        external view override returns(DataTypes.PostView[] memory posts)
+    {
+        uint256[] memory postIds = community.readCommunityPostIds(communityId, offset, limit);
+        bool isReadable = isAccess(communityId);
+
+        posts = new DataTypes.PostView[](postIds.length);
+        for (uint256 i = 0; i < postIds.length; i++) {
+            if (isReadable) {
+                posts[i] = readPost(postIds[i]);
+            } else {
+                posts[i].id = postIds[i];
+            }
+        }
+    }
+
+    // *** --- Private area --- ***
+
+    /**
+     * @dev Returns information about the post, empty without the privacy access.
+     *
+     * @param postId ID of post
+     */
+    function readPost(uint256 postId) private view returns(DataTypes.PostView memory result) {
+        result.id = postId;
+        if (!isAccess(community.getCommunityIdByPostId(postId))) {
+            return result;
+        }
+        (
+            result.ipfsHash,
+            result.creator,
+            result.owner,
+            result.upCount,
+            result.downCount,
+            result.price,
+            result.commentCount,
+            result.upDownUsers,
+            result.isView
+        ) = community.readPost(postId);
+    }
+
+    /**
+     * @dev Returns information about the comment.
+     *
+     * @param postId ID of post
+     * @param commentId ID of comment
+     */
+    function readComment(uint256 postId, uint256 commentId) private view returns(DataTypes.CommentView memory result) {
+        result.postId = postId;
+        result.id = commentId;
+        (
+            result.ipfsHash,
+            result.creator,
+            result.owner,
+            result.price,
+            result.isUp,
+            result.isDown,
+            result.isView
+        ) = community.readComment(postId, commentId);
+    }
+
+    /**
+     * @dev Checks the privacy access of the caller.
+     *
+     * @param communityId ID of community
+     */
+    function isAccess(uint256 communityId) private view returns(bool) {
+        return community.hasPrivacyAccess(communityId, _msgSender());
+    }
+}
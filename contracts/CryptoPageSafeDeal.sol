@@ -28,6 +28,9 @@ contract PageSafeDeal is
 
     mapping(uint256 => DataTypes.SafeDeal) private deals;
 
+    /// If true, new deals keep only the hash and the count of their messages, the texts are in the events
+    bool public isMessageHashMode;
+
     event SetToken(address indexed token);
 
     event MakeDeal(address indexed creator, uint256 dealId, bool isEth, uint256 amount);
@@ -37,6 +40,7 @@ contract PageSafeDeal is
     event ChangeDescription(uint256 dealId, string description);
     event ChangeTime(uint256 dealId, uint128 startTime, uint128 endTime);
     event AddMessage(uint256 dealId, address sender, string message);
+    event SetMessageHashMode(bool isMessageHashMode);
 
     event StartApprove(uint256 dealId, address sender);
     event EndApprove(uint256 dealId, address sender);
@@ -45,21 +49,21 @@ contract PageSafeDeal is
 
     modifier onlyDealUser(uint256 dealId) {
         address sender = _msgSender();
-        DataTypes.SafeDeal memory deal = deals[dealId];
+        DataTypes.SafeDeal storage deal = deals[dealId];
         require(sender == deal.seller || sender == deal.buyer, "SafeDeal: wrong deal user");
         _;
     }
 
     modifier onlyGuarantor(uint256 dealId) {
         address sender = _msgSender();
-        DataTypes.SafeDeal memory deal = deals[dealId];
+        DataTypes.SafeDeal storage deal = deals[dealId];
         require(sender == deal.guarantor, "SafeDeal: wrong guarantor");
         _;
     }
 
     modifier onlyGuarantorOrBuyer(uint256 dealId) {
         address sender = _msgSender();
-        DataTypes.SafeDeal memory deal = deals[dealId];
+        DataTypes.SafeDeal storage deal = deals[dealId];
         require(sender == deal.buyer || sender == deal.guarantor, "SafeDeal: wrong deal user");
         _;
     }
@@ -99,6 +103,18 @@ contract PageSafeDeal is
         emit SetToken(newToken);
     }
 
+    /**
+     * @dev Changes the messages mode for new deals.
+     * The deals which are already made keep their mode.
+     *
+     * @param newValue New value for the messages mode
+     */
+    function setMessageHashMode(bool newValue) external override onlyOwner {
+        require(isMessageHashMode != newValue, "SafeDeal: wrong value for message hash mode");
+        isMessageHashMode = newValue;
+        emit SetMessageHashMode(newValue);
+    }
+
     /**
      * @dev Creates a new deal.
      *
@@ -119,33 +135,36 @@ contract PageSafeDeal is
         uint256 amount,
         bool isEth
     ) external payable override {
-        address buyer = _msgSender();
-        require(block.timestamp < startTime && startTime < endTime, "SafeDeal: wrong time");
-        require(seller != address(0) && guarantor != address(0), "SafeDeal: wrong address");
-        require(guarantor != seller && guarantor != buyer, "SafeDeal: wrong guarantor address");
-
-        dealCount++;
-        DataTypes.SafeDeal storage deal = deals[dealCount];
-
-        require(amount > 0, "SafeDeal: wrong amount");
-        if (isEth) {
-            require(msg.value == amount, "SafeDeal: wrong transfer ether");
-            deal.isEth = true;
-        } else {
-            require(msg.value == 0, "SafeDeal: wrong msg.value");
-            require(token.transferFrom(buyer, address(this), amount), "SafeDeal: wrong transfer for seller");
-        }
-        require(token.transferFrom(buyer, guarantor, getGuarantorBonus()), "SafeDeal: wrong transfer for guarantor");
-
-        deal.description = desc;
-        deal.seller = seller;
-        deal.buyer = buyer;
-        deal.guarantor = guarantor;
-        deal.startTime = startTime;
-        deal.endTime = endTime;
-        deal.amount = amount;
+        createDeal(desc, seller, guarantor, startTime, endTime, amount, isEth);
+    }
 
-        emit MakeDeal(_msgSender(), dealCount, isEth, amount);
+    /**
+     * @dev Creates a new deal without a prior approve transaction.
+     * The EIP-2612 permit of the buyer must cover the guarantor bonus and,
+     * for a deal in tokens, the amount of the deal.
+     *
+     * @param desc Description for deal
+     * @param seller Seller's address
+     * @param guarantor Address of the user who guarantees
+     * @param startTime Deal start time in Unix format
+     * @param endTime Deal end time in Unix format
+     * @param amount Amount of tokens or ether
+     * @param isEth Boolean value for tokens or ether
+     * @param permit Value, deadline and signature of the permit for this contract
+     */
+    function makeDealWithPermit(
+        string memory desc,
+        address seller,
+        address guarantor,
+        uint128 startTime,
+        uint128 endTime,
+        uint256 amount,
+        bool isEth,
+        DataTypes.Permit memory permit
+    ) external payable override {
+        // a permit which was sent by someone else before this transaction only makes the allowance ready
+        try token.permit(_msgSender(), address(this), permit.value, permit.deadline, permit.v, permit.r, permit.s) {} catch {}
+        createDeal(desc, seller, guarantor, startTime, endTime, amount, isEth);
     }
 
     /**
@@ -231,6 +250,8 @@ contract PageSafeDeal is
 
     /**
      * @dev Adds a message from a deal participant.
+     * In the message hash mode only the running hash
+     * keccak256(abi.encodePacked(previousHash, sender, block.timestamp, message)) and the count are saved.
      *
      * @param dealId Deal ID
      * @param message Message from user
@@ -238,8 +259,13 @@ contract PageSafeDeal is
     function addMessage(uint256 dealId, string memory message) public override onlyDealUser(dealId) {
         address sender = _msgSender();
         DataTypes.SafeDeal storage deal = deals[dealId];
-        DataTypes.DealMessage memory dealMessage = DataTypes.DealMessage(message, sender, block.timestamp);
-        deal.messages.push(dealMessage);
+        if (deal.isMessageHash) {
+            deal.messagesHash = keccak256(abi.encodePacked(deal.messagesHash, sender, block.timestamp, message));
+            deal.messageCount++;
+        } else {
+            DataTypes.DealMessage memory dealMessage = DataTypes.DealMessage(message, sender, block.timestamp);
+            deal.messages.push(dealMessage);
+        }
 
         emit AddMessage(dealId, sender, message);
     }
@@ -327,7 +353,7 @@ contract PageSafeDeal is
         uint128 startTime,
         uint128 endTime
     ) {
-        DataTypes.SafeDeal memory deal = deals[dealId];
+        DataTypes.SafeDeal storage deal = deals[dealId];
         description = deal.description;
         seller = deal.seller;
         buyer = deal.buyer;
@@ -352,7 +378,7 @@ contract PageSafeDeal is
         bool endSellerApprove,
         bool endBuyerApprove
     ) {
-        DataTypes.SafeDeal memory deal = deals[dealId];
+        DataTypes.SafeDeal storage deal = deals[dealId];
         startSellerApprove = deal.startSellerApprove;
         startBuyerApprove = deal.startBuyerApprove;
         endSellerApprove = deal.endSellerApprove;
@@ -369,7 +395,7 @@ contract PageSafeDeal is
         bool eth,
         bool finished
     ) {
-        DataTypes.SafeDeal memory deal = deals[dealId];
+        DataTypes.SafeDeal storage deal = deals[dealId];
         issue = deal.isIssue;
         eth = deal.isEth;
         finished = deal.isFinished;
@@ -383,17 +409,57 @@ contract PageSafeDeal is
     function readMessagesDeal(uint256 dealId) external view override returns(
         DataTypes.DealMessage[] memory messages
     ) {
-        DataTypes.SafeDeal memory deal = deals[dealId];
+        DataTypes.SafeDeal storage deal = deals[dealId];
         messages = deal.messages;
     }
 
+    /**
+     * @dev Reading a part of the messages of a deal which keeps them in storage.
+     * If the offset is out of the messages, the part is empty, a limit beyond the last message reads the rest.
+     *
+     * @param dealId Deal ID
+     * @param offset Index of the first message
+     * @param limit Maximum number of messages
+     */
+    function readMessagesDeal(uint256 dealId, uint256 offset, uint256 limit) external view override returns(
+        DataTypes.DealMessage[] memory messages
+    ) {
+        DataTypes.DealMessage[] storage dealMessages = deals[dealId].messages;
+        uint256 length = dealMessages.length;
+        if (offset >= length) {
+            return messages;
+        }
+        uint256 end = limit > length - offset ? length : offset + limit;
+
+        messages = new DataTypes.DealMessage[](end - offset);
+        for (uint256 i = offset; i < end; i++) {
+            messages[i - offset] = dealMessages[i];
+        }
+    }
+
+    /**
+     * @dev Reading the count of messages of a deal and their running hash in the message hash mode.
+     *
+     * @param dealId Deal ID
+     */
+    function readMessagesHash(uint256 dealId) external view override returns(
+        bool isMessageHash,
+        bytes32 messagesHash,
+        uint256 messageCount
+    ) {
+        DataTypes.SafeDeal storage deal = deals[dealId];
+        isMessageHash = deal.isMessageHash;
+        messagesHash = deal.messagesHash;
+        messageCount = isMessageHash ? deal.messageCount : deal.messages.length;
+    }
+
     /**
      * @dev Reading start approval data from deal participants.
      *
      * @param dealId Deal ID
      */
     function isStartApproved(uint256 dealId) public view override returns(bool) {
-        DataTypes.SafeDeal memory deal = deals[dealId];
+        DataTypes.SafeDeal storage deal = deals[dealId];
         return deal.startSellerApprove && deal.startBuyerApprove;
     }
 
@@ -403,7 +469,7 @@ contract PageSafeDeal is
      * @param dealId Deal ID
      */
     function isEndApproved(uint256 dealId) public view override returns(bool) {
-        DataTypes.SafeDeal memory deal = deals[dealId];
+        DataTypes.SafeDeal storage deal = deals[dealId];
         return deal.endSellerApprove && deal.endBuyerApprove;
     }
 
@@ -413,7 +479,7 @@ contract PageSafeDeal is
      * @param dealId Deal ID
      */
     function isFinished(uint256 dealId) public view override returns(bool) {
-        DataTypes.SafeDeal memory deal = deals[dealId];
+        DataTypes.SafeDeal storage deal = deals[dealId];
         return deal.isFinished;
     }
 
@@ -423,7 +489,7 @@ contract PageSafeDeal is
      * @param dealId Deal ID
      */
     function isIssue(uint256 dealId) public view override returns(bool) {
-        DataTypes.SafeDeal memory deal = deals[dealId];
+        DataTypes.SafeDeal storage deal = deals[dealId];
         return deal.isIssue;
     }
 
@@ -435,6 +501,56 @@ contract PageSafeDeal is
         return block.timestamp;
     }
 
+    /**
+     * @dev Checks the deal, takes the assets of the buyer and the guarantor bonus and saves the deal.
+     *
+     * @param desc Description for deal
+     * @param seller Seller's address
+     * @param guarantor Address of the user who guarantees
+     * @param startTime Deal start time in Unix format
+     * @param endTime Deal end time in Unix format
+     * @param amount Amount of tokens or ether
+     * @param isEth Boolean value for tokens or ether
+     */
+    function createDeal(
+        string memory desc,
+        address seller,
+        address guarantor,
+        uint128 startTime,
+        uint128 endTime,
+        uint256 amount,
+        bool isEth
+    ) private {
+        address buyer = _msgSender();
+        require(block.timestamp < startTime && startTime < endTime, "SafeDeal: wrong time");
+        require(seller != address(0) && guarantor != address(0), "SafeDeal: wrong address");
+        require(guarantor != seller && guarantor != buyer, "SafeDeal: wrong guarantor address");
+
+        dealCount++;
+        DataTypes.SafeDeal storage deal = deals[dealCount];
+
+        require(amount > 0, "SafeDeal: wrong amount");
+        if (isEth) {
+            require(msg.value == amount, "SafeDeal: wrong transfer ether");
+            deal.isEth = true;
+        } else {
+            require(msg.value == 0, "SafeDeal: wrong msg.value");
+            require(token.transferFrom(buyer, address(this), amount), "SafeDeal: wrong transfer for seller");
+        }
+        require(token.transferFrom(buyer, guarantor, getGuarantorBonus()), "SafeDeal: wrong transfer for guarantor");
+
+        deal.description = desc;
+        deal.seller = seller;
+        deal.buyer = buyer;
+        deal.guarantor = guarantor;
+        deal.startTime = startTime;
+        deal.endTime = endTime;
+        deal.amount = amount;
+        deal.isMessageHash = isMessageHashMode;
+
+        emit MakeDeal(_msgSender(), dealCount, isEth, amount);
+    }
+
     /**
      * @dev Sending assets to the user.
      *
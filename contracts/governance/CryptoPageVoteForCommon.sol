@@ -7,6 +7,7 @@ import "@openzeppelin/contracts/access/AccessControlUpgradeable.sol";
 import "@openzeppelin/contracts/utils/structs/EnumerableSetUpgradeable.sol";
 
 import {DataTypes} from '../libraries/DataTypes.sol';
+import {VoteSignature} from '../libraries/VoteSignature.sol';
 import "../interfaces/ICryptoPageBank.sol";
 import "../interfaces/ICryptoPageCommunity.sol";
 import "../interfaces/ICryptoPageToken.sol";
@@ -19,9 +20,10 @@ contract PageVoteForCommon is
     IPageVoteForCommon
 {
 
-    using EnumerableSetUpgradeable for EnumerableSetUpgradeable.AddressSet;
+    using EnumerableSetUpgradeable for EnumerableSetUpgradeable.UintSet;
 
     bytes32 public constant UPDATER_FEE_ROLE = keccak256("UPDATER_FEE_ROLE");
+    string private constant DOMAIN_NAME = "PageVoteForCommon";
     uint128 public MIN_DURATION = 1 days;
 
     IPageCommunity community;
@@ -31,10 +33,14 @@ contract PageVoteForCommon is
     //communityId -> Vote[]
     mapping(uint256 => DataTypes.AddressUintsVote[]) private votes;
 
+    //communityId -> indexes of the active votes
+    mapping(uint256 => EnumerableSetUpgradeable.UintSet) private activeVotes;
+
     event SetMinDuration(uint256 oldValue, uint256 newValue);
-    event PutVote(address indexed sender, uint256 communityId, uint256 index, bool isYes, uint256 weight);
+    event PutVote(address indexed sender, uint256 indexed communityId, uint256 indexed index, bool isYes, uint256 weight);
     event CreateVote(address indexed sender, uint128 duration, uint128 methodNumber, uint64[4] values, address user);
     event ExecuteVote(address sender, uint256 communityId, uint256 index);
+    event CloseVote(address sender, uint256 communityId, uint256 index);
 
     modifier validMethodId(uint256 id) {
         require(0 < id && id < 7, "PageVote: wrong methodNumber");
@@ -107,6 +113,7 @@ contract PageVoteForCommon is
         vote.newValues = values;
         vote.finishTime = uint128(block.timestamp) + duration;
         vote.active = true;
+        activeVotes[communityId].add(len);
         if (methodNumber == 3 || methodNumber == 4) {
             require(user != address(0), "PageVote: wrong moderator address");
             vote.user = user;
@@ -142,18 +149,50 @@ contract PageVoteForCommon is
         DataTypes.AddressUintsVote storage vote = votes[communityId][index];
 
         require(community.isCommunityActiveUser(communityId, sender), "PageVote: access denied");
-        require(!vote.voteUsers.contains(sender), "PageVote: the user has already voted");
+        require(vote.voterNumber[sender] == 0, "PageVote: the user has already voted");
         require(vote.active, "PageVote: vote not active");
 
-        uint256 weight = bank.balanceOf(sender) + token.balanceOf(sender);
+        addVote(vote, communityId, index, sender, isYes);
+    }
 
-        if (isYes) {
-            vote.yesCount += uint128(weight);
-        } else {
-            vote.noCount += uint128(weight);
+    /**
+     * @dev Puts the votes which were signed by the users off-chain (EIP-712) and sent by a relayer.
+     * The users who have already voted or are not active users of the community are skipped,
+     * as well as the expired and the broken signatures, so they do not revert the whole batch.
+     *
+     * @param communityId ID of community
+     * @param index Voting number for the current community.
+     * The total number of all votes is given by the "readVotesCount()" function.
+     * @param isYes For the implementation of the proposal or against the implementation, for each signature
+     * @param deadlines The last timestamp of each signed vote, a part of the typed Vote message
+     * @param signatures Signatures of the typed Vote message
+     * @return count Number of the counted votes
+     */
+    function putVotesBySig(
+        uint256 communityId,
+        uint256 index,
+        bool[] memory isYes,
+        uint256[] memory deadlines,
+        bytes[] memory signatures
+    ) external override returns(uint256 count) {
+        require(votes[communityId].length > index, "PageVote: wrong index");
+        require(isYes.length == signatures.length && deadlines.length == signatures.length, "PageVote: wrong length");
+
+        DataTypes.AddressUintsVote storage vote = votes[communityId][index];
+        require(vote.active, "PageVote: vote not active");
+
+        bytes32 separator = VoteSignature.domainSeparator(DOMAIN_NAME);
+        for (uint256 i = 0; i < signatures.length; i++) {
+            if (deadlines[i] < block.timestamp) continue;
+            address voter = VoteSignature.recoverVoter(
+                separator, 0, communityId, index, isYes[i], deadlines[i], signatures[i]
+            );
+            if (voter == address(0)) continue;
+            if (vote.voterNumber[voter] == 0 && community.isCommunityActiveUser(communityId, voter)) {
+                addVote(vote, communityId, index, voter, isYes[i]);
+                count++;
+            }
         }
-        vote.voteUsers.add(sender);
-        emit PutVote(sender, communityId, index, isYes, weight);
     }
 
     /**
@@ -164,23 +203,40 @@ contract PageVoteForCommon is
      * The total number of all votes is given by the "readVotesCount()" function.
      */
     function executeVote(uint256 communityId, uint256 index) external override {
-        require(votes[communityId].length > index, "PageVote: wrong index");
+        execute(communityId, index, _msgSender(), false);
+    }
 
+    /**
+     * @dev Starts the execution of several matured Votes of the community in one transaction.
+     * The checks are the same as in "executeVote()" for each Vote with more "yes" than "no".
+     * A matured Vote without more "yes" is closed as inactive, so it leaves the active Votes.
+     *
+     * @param communityId ID of community
+     * @param indexes Voting numbers for the current community, see "readExecutableVotes()"
+     */
+    function executeVotes(uint256 communityId, uint256[] memory indexes) external override {
         address sender = _msgSender();
-        DataTypes.AddressUintsVote storage vote = votes[communityId][index];
-
-        require(community.isCommunityActiveUser(communityId, sender), "PageVote: access denied");
-        require(vote.voteUsers.contains(sender), "PageVote: the user did not vote");
-        require(vote.active, "PageVote: vote not active");
-        require(vote.finishTime < block.timestamp, "PageVote: wrong time");
-        require(vote.yesCount > vote.noCount, "PageVote: wrong yes count");
-        if (vote.yesCount > vote.noCount) {
-            executeScript(communityId, index);
+        for (uint256 i = 0; i < indexes.length; i++) {
+            execute(communityId, indexes[i], sender, true);
         }
+    }
 
-        vote.active = false;
-
-        emit ExecuteVote(sender, communityId, index);
+    /**
+     * @dev Adds the active Votes of the range to the index of active Votes.
+     * Used once after the upgrade for Votes created before the index.
+     *
+     * @param communityId ID of community
+     * @param fromIndex Index of the first Vote in the range
+     * @param toIndex Index of the Vote after the range
+     */
+    function syncActiveVotes(uint256 communityId, uint256 fromIndex, uint256 toIndex) external override onlyOwner {
+        DataTypes.AddressUintsVote[] storage communityVotes = votes[communityId];
+        uint256 end = toIndex > communityVotes.length ? communityVotes.length : toIndex;
+        for (uint256 index = fromIndex; index < end; index++) {
+            if (communityVotes[index].active) {
+                activeVotes[communityId].add(index);
+            }
+        }
     }
 
     /**
@@ -199,7 +255,7 @@ contract PageVoteForCommon is
         uint128 noCount,
         uint64[4] memory newValues,
         address user,
-        address[] memory voteUsers,
+        uint256 voterCount,
         bool active
     ) {
         require(votes[communityId].length > index, "PageVote: wrong index");
@@ -214,10 +270,67 @@ contract PageVoteForCommon is
         noCount = vote.noCount;
         newValues = vote.newValues;
         user = vote.user;
-        voteUsers = vote.voteUsers.values();
+        voterCount = vote.voterCount;
         active = vote.active;
     }
 
+    /**
+     * @dev Returns the indexes and the finish times of a range of the active Votes of the community.
+     *
+     * @param communityId ID of community
+     * @param offset Position of the first Vote in the active Votes
+     * @param limit Maximum number of Votes in the range
+     */
+    function readActiveVotes(uint256 communityId, uint256 offset, uint256 limit) external override view returns(
+        uint256[] memory indexes,
+        uint128[] memory finishTimes
+    ) {
+        EnumerableSetUpgradeable.UintSet storage active = activeVotes[communityId];
+        uint256 end = getRangeEnd(active.length(), offset, limit);
+        indexes = new uint256[](end - offset);
+        finishTimes = new uint128[](end - offset);
+        for (uint256 i = offset; i < end; i++) {
+            indexes[i - offset] = active.at(i);
+            finishTimes[i - offset] = votes[communityId][indexes[i - offset]].finishTime;
+        }
+    }
+
+    /**
+     * @dev Returns the indexes of the matured Votes in a range of the active Votes of the community,
+     * "executeVotes()" executes them if there are more "yes" than "no" and closes the others.
+     *
+     * @param communityId ID of community
+     * @param offset Position of the first Vote in the active Votes
+     * @param limit Maximum number of the active Votes which are checked
+     */
+    function readExecutableVotes(uint256 communityId, uint256 offset, uint256 limit) external override view returns(
+        uint256[] memory indexes
+    ) {
+        EnumerableSetUpgradeable.UintSet storage active = activeVotes[communityId];
+        uint256 end = getRangeEnd(active.length(), offset, limit);
+        uint256[] memory found = new uint256[](end - offset);
+        uint256 count;
+        for (uint256 i = offset; i < end; i++) {
+            uint256 index = active.at(i);
+            if (votes[communityId][index].finishTime < block.timestamp) {
+                found[count++] = index;
+            }
+        }
+
+        indexes = new uint256[](count);
+        for (uint256 i = 0; i < count; i++) {
+            indexes[i] = found[i];
+        }
+    }
+
+    /**
+     * @dev Returns the EIP-712 domain separator for the signed votes.
+     *
+     */
+    function DOMAIN_SEPARATOR() external view override returns(bytes32) {
+        return VoteSignature.domainSeparator(DOMAIN_NAME);
+    }
+
     /**
      * @dev Reading the amount of votes for the community.
      *
@@ -227,6 +340,86 @@ contract PageVoteForCommon is
         return votes[communityId].length;
     }
 
+    /**
+     * @dev Checks and executes the Vote, then removes it from the active Votes.
+     *
+     * @param communityId ID of community
+     * @param index Voting number for the current community
+     * @param sender Address which executes the Vote
+     * @param isClosingFailed True if a matured Vote without more "yes" is closed instead of the revert
+     */
+    function execute(uint256 communityId, uint256 index, address sender, bool isClosingFailed) private {
+        require(votes[communityId].length > index, "PageVote: wrong index");
+
+        DataTypes.AddressUintsVote storage vote = votes[communityId][index];
+
+        if (isClosingFailed && vote.yesCount <= vote.noCount) {
+            require(community.isCommunityActiveUser(communityId, sender), "PageVote: access denied");
+            require(vote.active, "PageVote: vote not active");
+            require(vote.finishTime < block.timestamp, "PageVote: wrong time");
+            vote.active = false;
+            activeVotes[communityId].remove(index);
+            emit CloseVote(sender, communityId, index);
+            return;
+        }
+
+        require(community.isCommunityActiveUser(communityId, sender), "PageVote: access denied");
+        require(vote.voterNumber[sender] != 0, "PageVote: the user did not vote");
+        require(vote.active, "PageVote: vote not active");
+        require(vote.finishTime < block.timestamp, "PageVote: wrong time");
+        require(vote.yesCount > vote.noCount, "PageVote: wrong yes count");
+        if (vote.yesCount > vote.noCount) {
+            executeScript(communityId, index);
+        }
+
+        vote.active = false;
+        activeVotes[communityId].remove(index);
+
+        emit ExecuteVote(sender, communityId, index);
+    }
+
+    /**
+     * @dev Returns the end index (exclusive) of the range in a set.
+     * If the offset is out of the set, the range is empty.
+     *
+     * @param length Length of the set
+     * @param offset Index of the first element in the range
+     * @param limit Maximum number of elements in the range
+     */
+    function getRangeEnd(uint256 length, uint256 offset, uint256 limit) private pure returns(uint256) {
+        if (offset >= length) {
+            return offset;
+        }
+        return limit > length - offset ? length : offset + limit;
+    }
+
+    /**
+     * @dev Adds the weight of the voter to the vote and remembers the voter.
+     *
+     * @param vote Storage variable for vote
+     * @param communityId ID of community
+     * @param index Voting number for the current community
+     * @param voter Address of the voter
+     * @param isYes For the implementation of the proposal or against the implementation
+     */
+    function addVote(
+        DataTypes.AddressUintsVote storage vote,
+        uint256 communityId,
+        uint256 index,
+        address voter,
+        bool isYes
+    ) private {
+        uint256 weight = bank.balanceOf(voter) + token.balanceOf(voter);
+
+        if (isYes) {
+            vote.yesCount += uint128(weight);
+        } else {
+            vote.noCount += uint128(weight);
+        }
+        vote.voterNumber[voter] = ++vote.voterCount;
+        emit PutVote(voter, communityId, index, isYes, weight);
+    }
+
     /**
      * @dev Starts the execution of a method for the community.
      *
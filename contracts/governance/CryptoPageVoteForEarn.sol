@@ -4,9 +4,9 @@ pragma solidity 0.8.12;
 
 import "@openzeppelin/contracts/access/OwnableUpgradeable.sol";
 import "@openzeppelin/contracts/access/AccessControlUpgradeable.sol";
-import "@openzeppelin/contracts/utils/structs/EnumerableSetUpgradeable.sol";
 
 import {DataTypes} from '../libraries/DataTypes.sol';
+import {VoteSignature} from '../libraries/VoteSignature.sol';
 import "../interfaces/ICryptoPageBank.sol";
 import "../interfaces/ICryptoPageCommunity.sol";
 import "../interfaces/ICryptoPageToken.sol";
@@ -19,8 +19,11 @@ contract PageVoteForEarn is
     IPageVoteForEarn
 {
 
-    using EnumerableSetUpgradeable for EnumerableSetUpgradeable.AddressSet;
-    using EnumerableSetUpgradeable for EnumerableSetUpgradeable.UintSet;
+    // kinds of the signed votes
+    uint256 public constant PRIVACY_ACCESS_PRICE_VOTE = 0;
+    uint256 public constant TOKEN_TRANSFER_VOTE = 1;
+    uint256 public constant NFT_TRANSFER_VOTE = 2;
+    string private constant DOMAIN_NAME = "PageVoteForEarn";
 
     uint128 public MIN_DURATION = 1 days;
     uint128 public MIN_MODERATOR_COUNT = 10;
@@ -37,9 +40,9 @@ contract PageVoteForEarn is
 
     event SetMinDuration(uint256 oldValue, uint256 newValue);
 
-    event PutPrivacyAccessPriceVote(address indexed sender, uint256 communityId, uint256 index, bool isYes, uint256 weight);
-    event PutTokenTransferVote(address indexed sender, uint256 communityId, uint256 index, bool isYes, uint256 weight);
-    event PutNftTransferVote(address indexed sender, uint256 communityId, uint256 index, bool isYes, uint256 weight);
+    event PutPrivacyAccessPriceVote(address indexed sender, uint256 indexed communityId, uint256 indexed index, bool isYes, uint256 weight);
+    event PutTokenTransferVote(address indexed sender, uint256 indexed communityId, uint256 indexed index, bool isYes, uint256 weight);
+    event PutNftTransferVote(address indexed sender, uint256 indexed communityId, uint256 indexed index, bool isYes, uint256 weight);
 
     event CreatePrivacyAccessPriceVote(address indexed sender, uint128 duration, uint128 newPrice);
     event CreateTokenTransferVote(address indexed sender, uint128 duration, uint128 amount, address wallet);
@@ -207,19 +210,10 @@ contract PageVoteForEarn is
         DataTypes.UintVote storage vote = privacyAccessPriceVotes[communityId][index];
 
         require(community.isCommunityActiveUser(communityId, sender), "PageVote: access denied");
-        require(!vote.voteUsers.contains(sender), "PageVote: the user has already voted");
+        require(vote.voterNumber[sender] == 0, "PageVote: the user has already voted");
         require(vote.active, "PageVote: vote not active");
 
-        uint256 weight = bank.balanceOf(sender) + token.balanceOf(sender);
-
-        if (isYes) {
-            vote.yesCount += uint128(weight);
-        } else {
-            vote.noCount += uint128(weight);
-        }
-        vote.voteUsers.add(sender);
-
-        emit PutPrivacyAccessPriceVote(sender, communityId, index, isYes, weight);
+        addPrivacyAccessPriceVote(vote, communityId, index, sender, isYes);
     }
 
     /**
@@ -254,6 +248,43 @@ contract PageVoteForEarn is
         emit PutNftTransferVote(_msgSender(), communityId, index, isYes, weight);
     }
 
+    /**
+     * @dev Puts the votes which were signed by the users off-chain (EIP-712) and sent by a relayer.
+     * The users who have already voted or are not active users of the community are skipped,
+     * as well as the expired and the broken signatures, so they do not revert the whole batch.
+     *
+     * @param kind PRIVACY_ACCESS_PRICE_VOTE, TOKEN_TRANSFER_VOTE or NFT_TRANSFER_VOTE
+     * @param communityId ID of community
+     * @param index Voting number of this kind for the current community
+     * @param isYes For the implementation of the proposal or against the implementation, for each signature
+     * @param deadlines The last timestamp of each signed vote, a part of the typed Vote message
+     * @param signatures Signatures of the typed Vote message
+     * @return count Number of the counted votes
+     */
+    function putVotesBySig(
+        uint256 kind,
+        uint256 communityId,
+        uint256 index,
+        bool[] memory isYes,
+        uint256[] memory deadlines,
+        bytes[] memory signatures
+    ) external override returns(uint256 count) {
+        require(kind <= NFT_TRANSFER_VOTE, "PageVote: wrong kind");
+        require(isYes.length == signatures.length && deadlines.length == signatures.length, "PageVote: wrong length");
+
+        bytes32 separator = VoteSignature.domainSeparator(DOMAIN_NAME);
+        for (uint256 i = 0; i < signatures.length; i++) {
+            if (deadlines[i] < block.timestamp) continue;
+            address voter = VoteSignature.recoverVoter(
+                separator, kind, communityId, index, isYes[i], deadlines[i], signatures[i]
+            );
+            if (voter == address(0)) continue;
+            if (putSignedVote(kind, communityId, index, voter, isYes[i])) {
+                count++;
+            }
+        }
+    }
+
     /**
      * @dev Starts the execution of a Vote.
      *
@@ -261,14 +292,14 @@ contract PageVoteForEarn is
      * @param index Voting number for the current community.
      * The total number of all votes is given by the "readVotesCount()" function.
      */
-    function executePrivacyAccessPriceVote(uint256 communityId, uint256 index) external override {
+    function executePrivacyAccessPriceVote(uint256 communityId, uint256 index) public override {
         require(privacyAccessPriceVotes[communityId].length > index, "PageVote: wrong index");
 
         address sender = _msgSender();
         DataTypes.UintVote storage vote = privacyAccessPriceVotes[communityId][index];
 
         require(community.isCommunityActiveUser(communityId, sender), "PageVote: access denied");
-        require(vote.voteUsers.contains(sender), "PageVote: the user did not vote");
+        require(vote.voterNumber[sender] != 0, "PageVote: the user did not vote");
         require(vote.active, "PageVote: vote not active");
         require(vote.finishTime < block.timestamp, "PageVote: wrong time");
 
@@ -288,7 +319,7 @@ contract PageVoteForEarn is
      * @param index Voting number for the current community.
      * The total number of all votes is given by the "readVotesCount()" function.
      */
-    function executeTokenTransferVote(uint256 communityId, uint256 index) external override {
+    function executeTokenTransferVote(uint256 communityId, uint256 index) public override {
         require(tokenTransferVotes[communityId].length > index, "PageVote: wrong index");
         DataTypes.AddressUintVote storage vote = tokenTransferVotes[communityId][index];
         checkTransferVote(communityId, vote);
@@ -308,7 +339,7 @@ contract PageVoteForEarn is
      * @param index Voting number for the current community.
      * The total number of all votes is given by the "readVotesCount()" function.
      */
-    function executeNftTransferVote(uint256 communityId, uint256 index) external override {
+    function executeNftTransferVote(uint256 communityId, uint256 index) public override {
         require(nftTransferVotes[communityId].length > index, "PageVote: wrong index");
         DataTypes.AddressUintVote storage vote = nftTransferVotes[communityId][index];
         checkTransferVote(communityId, vote);
@@ -321,6 +352,29 @@ contract PageVoteForEarn is
         emit ExecuteNftTransferVote(_msgSender(), communityId, index);
     }
 
+    /**
+     * @dev Starts the execution of several matured Votes of the community in one transaction.
+     * The checks are the same as in the execute function of each kind,
+     * a Vote without more "yes" than "no" is closed as inactive without the execution.
+     *
+     * @param communityId ID of community
+     * @param kinds PRIVACY_ACCESS_PRICE_VOTE, TOKEN_TRANSFER_VOTE or NFT_TRANSFER_VOTE for each Vote
+     * @param indexes Voting numbers of these kinds, see "readExecutableVotes()"
+     */
+    function executeVotes(uint256 communityId, uint256[] memory kinds, uint256[] memory indexes) external override {
+        require(kinds.length == indexes.length, "PageVote: wrong length");
+        for (uint256 i = 0; i < kinds.length; i++) {
+            if (kinds[i] == PRIVACY_ACCESS_PRICE_VOTE) {
+                executePrivacyAccessPriceVote(communityId, indexes[i]);
+            } else if (kinds[i] == TOKEN_TRANSFER_VOTE) {
+                executeTokenTransferVote(communityId, indexes[i]);
+            } else {
+                require(kinds[i] == NFT_TRANSFER_VOTE, "PageVote: wrong kind");
+                executeNftTransferVote(communityId, indexes[i]);
+            }
+        }
+    }
+
     /**
      * @dev Reading information about a Vote.
      *
@@ -335,7 +389,7 @@ contract PageVoteForEarn is
         uint128 yesCount,
         uint128 noCount,
         uint128 newPrice,
-        address[] memory voteUsers,
+        uint256 voterCount,
         bool active
     ) {
         require(privacyAccessPriceVotes[communityId].length > index, "PageVote: wrong index");
@@ -348,7 +402,7 @@ contract PageVoteForEarn is
         yesCount = vote.yesCount;
         noCount = vote.noCount;
         newPrice = vote.newValue;
-        voteUsers = vote.voteUsers.values();
+        voterCount = vote.voterCount;
         active = vote.active;
     }
 
@@ -367,7 +421,7 @@ contract PageVoteForEarn is
         uint128,
         uint128,
         address,
-        address[] memory,
+        uint256,
         bool
     ) {
         require(tokenTransferVotes[communityId].length > index, "PageVote: wrong index");
@@ -391,7 +445,7 @@ contract PageVoteForEarn is
         uint128,
         uint128,
         address,
-        address[] memory,
+        uint256,
         bool
     ) {
         require(nftTransferVotes[communityId].length > index, "PageVote: wrong index");
@@ -400,6 +454,50 @@ contract PageVoteForEarn is
         return readTransferVote(communityId, vote);
     }
 
+    /**
+     * @dev Returns the kinds and the indexes of the active Votes of the community whose voting time is over,
+     * "executeVotes()" executes them if there are more "yes" than "no" and closes the others.
+     * Only the last Vote of each kind can be active, so no index of active Votes is kept.
+     *
+     * @param communityId ID of community
+     */
+    function readExecutableVotes(uint256 communityId) external override view returns(
+        uint256[] memory kinds,
+        uint256[] memory indexes
+    ) {
+        uint256[3] memory lengths = [
+            privacyAccessPriceVotes[communityId].length,
+            tokenTransferVotes[communityId].length,
+            nftTransferVotes[communityId].length
+        ];
+        bool[3] memory executable;
+        if (lengths[0] > 0) {
+            DataTypes.UintVote storage priceVote = privacyAccessPriceVotes[communityId][lengths[0] - 1];
+            executable[0] = priceVote.active && priceVote.finishTime < block.timestamp;
+        }
+        if (lengths[1] > 0) {
+            executable[1] = isMaturedTransferVote(tokenTransferVotes[communityId][lengths[1] - 1]);
+        }
+        if (lengths[2] > 0) {
+            executable[2] = isMaturedTransferVote(nftTransferVotes[communityId][lengths[2] - 1]);
+        }
+
+        uint256 count;
+        for (uint256 kind = 0; kind < 3; kind++) {
+            if (executable[kind]) count++;
+        }
+        kinds = new uint256[](count);
+        indexes = new uint256[](count);
+        count = 0;
+        for (uint256 kind = 0; kind < 3; kind++) {
+            if (executable[kind]) {
+                kinds[count] = kind;
+                indexes[count] = lengths[kind] - 1;
+                count++;
+            }
+        }
+    }
+
     /**
      * @dev Reading the amount of votes for the community.
      *
@@ -428,6 +526,14 @@ contract PageVoteForEarn is
     }
 
 
+    /**
+     * @dev Returns the EIP-712 domain separator for the signed votes.
+     *
+     */
+    function DOMAIN_SEPARATOR() external view override returns(bytes32) {
+        return VoteSignature.domainSeparator(DOMAIN_NAME);
+    }
+
     // *** --- Private area --- ***
 
     /**
@@ -444,7 +550,7 @@ contract PageVoteForEarn is
         uint128 noCount,
         uint128 amount,
         address wallet,
-        address[] memory voteUsers,
+        uint256 voterCount,
         bool active
     ) {
         description = vote.description;
@@ -454,10 +560,19 @@ contract PageVoteForEarn is
         noCount = vote.noCount;
         amount = vote.value;
         wallet = vote.user;
-        voteUsers = vote.voteUsers.values();
+        voterCount = vote.voterCount;
         active = vote.active;
     }
 
+    /**
+     * @dev Returns a boolean indicating that the transfer Vote is active and its voting time is over.
+     *
+     * @param vote Storage variable for vote
+     */
+    function isMaturedTransferVote(DataTypes.AddressUintVote storage vote) private view returns(bool) {
+        return vote.active && vote.finishTime < block.timestamp;
+    }
+
     /**
      * @dev Starts the execution for change price.
      *
@@ -530,20 +645,106 @@ contract PageVoteForEarn is
         address sender = _msgSender();
 
         require(community.isCommunityActiveUser(communityId, sender), "PageVote: access denied");
-        require(!vote.voteUsers.contains(sender), "PageVote: the user has already voted");
+        require(vote.voterNumber[sender] == 0, "PageVote: the user has already voted");
         require(vote.active, "PageVote: vote not active");
 
-        uint256 weight = bank.balanceOf(sender) + token.balanceOf(sender);
+        return addTransferVote(vote, communityId, sender, isYes);
+    }
+
+    /**
+     * @dev Adds the weight of the voter to the transfer vote and remembers the voter.
+     *
+     * @param vote Storage variable for vote
+     * @param communityId ID of community
+     * @param voter Address of the voter
+     * @param isYes For the implementation of the proposal or against the implementation
+     * @return weight The weight of the voter
+     */
+    function addTransferVote(
+        DataTypes.AddressUintVote storage vote,
+        uint256 communityId,
+        address voter,
+        bool isYes
+    ) private returns(uint256 weight) {
+        weight = bank.balanceOf(voter) + token.balanceOf(voter);
 
         if (isYes) {
             vote.yesCount += uint128(weight);
         } else {
             vote.noCount += uint128(weight);
         }
-        vote.voteUsers.add(sender);
+        vote.voterNumber[voter] = ++vote.voterCount;
         lastVoteBlock[communityId] = block.number;
+    }
+
+    /**
+     * @dev Adds the weight of the voter to the privacy access price vote and remembers the voter.
+     *
+     * @param vote Storage variable for vote
+     * @param communityId ID of community
+     * @param index Voting number for the current community
+     * @param voter Address of the voter
+     * @param isYes For the implementation of the proposal or against the implementation
+     */
+    function addPrivacyAccessPriceVote(
+        DataTypes.UintVote storage vote,
+        uint256 communityId,
+        uint256 index,
+        address voter,
+        bool isYes
+    ) private {
+        uint256 weight = bank.balanceOf(voter) + token.balanceOf(voter);
 
-        return weight;
+        if (isYes) {
+            vote.yesCount += uint128(weight);
+        } else {
+            vote.noCount += uint128(weight);
+        }
+        vote.voterNumber[voter] = ++vote.voterCount;
+
+        emit PutPrivacyAccessPriceVote(voter, communityId, index, isYes, weight);
+    }
+
+    /**
+     * @dev Adds the signed vote of the kind, if the voter is an active user who has not voted yet.
+     *
+     * @param kind PRIVACY_ACCESS_PRICE_VOTE, TOKEN_TRANSFER_VOTE or NFT_TRANSFER_VOTE
+     * @param communityId ID of community
+     * @param index Voting number of this kind for the current community
+     * @param voter Address which signed the vote
+     * @param isYes For the implementation of the proposal or against the implementation
+     * @return Boolean value that the vote is counted
+     */
+    function putSignedVote(uint256 kind, uint256 communityId, uint256 index, address voter, bool isYes) private returns(bool) {
+        if (kind == PRIVACY_ACCESS_PRICE_VOTE) {
+            require(privacyAccessPriceVotes[communityId].length > index, "PageVote: wrong index");
+            DataTypes.UintVote storage priceVote = privacyAccessPriceVotes[communityId][index];
+            require(priceVote.active, "PageVote: vote not active");
+            if (priceVote.voterNumber[voter] != 0 || !community.isCommunityActiveUser(communityId, voter)) {
+                return false;
+            }
+            addPrivacyAccessPriceVote(priceVote, communityId, index, voter, isYes);
+            return true;
+        }
+
+        DataTypes.AddressUintVote[] storage transferVotes = tokenTransferVotes[communityId];
+        if (kind == NFT_TRANSFER_VOTE) {
+            transferVotes = nftTransferVotes[communityId];
+        }
+        require(transferVotes.length > index, "PageVote: wrong index");
+        DataTypes.AddressUintVote storage vote = transferVotes[index];
+        require(vote.active, "PageVote: vote not active");
+        if (vote.voterNumber[voter] != 0 || !community.isCommunityActiveUser(communityId, voter)) {
+            return false;
+        }
+
+        uint256 weight = addTransferVote(vote, communityId, voter, isYes);
+        if (kind == TOKEN_TRANSFER_VOTE) {
+            emit PutTokenTransferVote(voter, communityId, index, isYes, weight);
+        } else {
+            emit PutNftTransferVote(voter, communityId, index, isYes, weight);
+        }
+        return true;
     }
 
     /**
@@ -555,7 +756,7 @@ contract PageVoteForEarn is
     function checkTransferVote(uint256 communityId, DataTypes.AddressUintVote storage vote) private {
         address sender = _msgSender();
         require(community.isCommunityActiveUser(communityId, sender), "PageVote: access denied");
-        require(vote.voteUsers.contains(sender), "PageVote: the user did not vote");
+        require(vote.voterNumber[sender] != 0, "PageVote: the user did not vote");
         require(vote.active, "PageVote: vote not active");
         require(vote.finishTime < block.timestamp, "PageVote: wrong time");
         preventSameBlock(communityId);
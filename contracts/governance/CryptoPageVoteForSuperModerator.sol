@@ -4,7 +4,6 @@ pragma solidity 0.8.12;
 
 import "@openzeppelin/contracts/access/OwnableUpgradeable.sol";
 import "@openzeppelin/contracts/access/AccessControlUpgradeable.sol";
-import "@openzeppelin/contracts/utils/structs/EnumerableSetUpgradeable.sol";
 
 import {DataTypes} from '../libraries/DataTypes.sol';
 import "../interfaces/ICryptoPageBank.sol";
@@ -19,9 +18,6 @@ contract PageVoteForSuperModerator is
     IPageVoteForSuperModerator
 {
 
-    using EnumerableSetUpgradeable for EnumerableSetUpgradeable.AddressSet;
-    using EnumerableSetUpgradeable for EnumerableSetUpgradeable.UintSet;
-
     uint128 public MIN_DURATION = 1 days;
     uint128 public MIN_MODERATOR_COUNT = 2;
 
@@ -32,7 +28,7 @@ contract PageVoteForSuperModerator is
     DataTypes.AddressVote[] private votes;
 
     event SetMinDuration(uint256 oldValue, uint256 newValue);
-    event PutVote(address indexed sender, uint256 communityId, uint256 index, bool isYes, uint256 weight);
+    event PutVote(address indexed sender, uint256 indexed communityId, uint256 indexed index, bool isYes, uint256 weight);
     event CreateVote(address indexed sender, uint128 duration, address user);
     event ExecuteVote(address sender, uint256 communityId, uint256 index);
 
@@ -133,8 +129,8 @@ contract PageVoteForSuperModerator is
         DataTypes.AddressVote storage vote = votes[index];
 
         require(community.isCommunityModerator(communityId, sender), "PageVote: access denied");
-        require(!vote.voteUsers.contains(sender), "PageVote: the user has already voted");
-        require(!vote.voteCommunities.contains(communityId), "PageVote: the community has already voted");
+        require(vote.voterNumber[sender] == 0, "PageVote: the user has already voted");
+        require(vote.communityNumber[communityId] == 0, "PageVote: the community has already voted");
         require(vote.active, "PageVote: vote not active");
 
         uint256 weight = bank.balanceOf(sender) + token.balanceOf(sender);
@@ -144,8 +140,8 @@ contract PageVoteForSuperModerator is
         } else {
             vote.noCount += uint128(weight);
         }
-        vote.voteUsers.add(sender);
-        vote.voteCommunities.add(communityId);
+        vote.voterNumber[sender] = ++vote.voterCount;
+        vote.communityNumber[communityId] = ++vote.communityCount;
         emit PutVote(sender, communityId, index, isYes, weight);
     }
 
@@ -163,12 +159,12 @@ contract PageVoteForSuperModerator is
         DataTypes.AddressVote storage vote = votes[index];
 
         require(community.isCommunityModerator(communityId, sender), "PageVote: access denied");
-        require(vote.voteUsers.contains(sender), "PageVote: the user did not vote");
+        require(vote.voterNumber[sender] != 0, "PageVote: the user did not vote");
         require(vote.active, "PageVote: vote not active");
         require(vote.finishTime < block.timestamp, "PageVote: wrong time");
-        require(MIN_MODERATOR_COUNT <= vote.voteCommunities.length(), "PageVote: wrong communities count");
 
-        if (vote.yesCount > vote.noCount) {
+        // without enough communities the Vote is closed as failed, so a new one can be created
+        if (MIN_MODERATOR_COUNT <= vote.communityCount && vote.yesCount > vote.noCount) {
             executeScript(vote.user);
         }
 
@@ -190,8 +186,8 @@ contract PageVoteForSuperModerator is
         uint128 yesCount,
         uint128 noCount,
         address user,
-        address[] memory voteUsers,
-        uint256[] memory voteCommunities,
+        uint256 voterCount,
+        uint256 communityCount,
         bool active
     ) {
         require(votes.length > index, "PageVote: wrong index");
@@ -204,8 +200,8 @@ contract PageVoteForSuperModerator is
         yesCount = vote.yesCount;
         noCount = vote.noCount;
         user = vote.user;
-        voteUsers = vote.voteUsers.values();
-        voteCommunities = vote.voteCommunities.values();
+        voterCount = vote.voterCount;
+        communityCount = vote.communityCount;
         active = vote.active;
     }
 
@@ -217,6 +213,22 @@ contract PageVoteForSuperModerator is
         return votes.length;
     }
 
+    /**
+     * @dev Returns the index of the last Vote if it is active and its voting time is over,
+     * "executeVote()" executes it if enough communities have voted with more "yes" than "no"
+     * and closes it otherwise. Only one Vote can be active, so the result has no more than one element.
+     *
+     */
+    function readExecutableVotes() external override view returns(uint256[] memory indexes) {
+        if (votes.length == 0) return indexes;
+
+        DataTypes.AddressVote storage vote = votes[votes.length - 1];
+        if (vote.active && vote.finishTime < block.timestamp) {
+            indexes = new uint256[](1);
+            indexes[0] = votes.length - 1;
+        }
+    }
+
     /**
      * @dev Starts the execution of a method for the community.
      *
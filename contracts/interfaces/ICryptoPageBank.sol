@@ -6,7 +6,7 @@ interface IPageBank {
 
     function version() external pure returns (string memory);
 
-    function definePostFeeForNewCommunity(uint256 communityId) external returns(bool);
+    function syncFeeOverrides(uint256 fromCommunityId, uint256 toCommunityId) external;
 
     function readPostFee(uint256 communityId) external view returns(
         uint64 createPostOwnerFee,
@@ -15,8 +15,6 @@ interface IPageBank {
         uint64 removePostCreatorFee
     );
 
-    function defineCommentFeeForNewCommunity(uint256 communityId) external returns(bool);
-
     function readCommentFee(uint256 communityId) external view returns(
         uint64 createCommentOwnerFee,
         uint64 createCommentCreatorFee,
@@ -55,6 +53,14 @@ interface IPageBank {
         uint256 gas
     ) external returns (uint256 amount);
 
+    function mintTokenForNewComments(
+        uint256 communityId,
+        address owner,
+        address creator,
+        uint256 gas,
+        uint256 count
+    ) external returns (uint256 amount);
+
     function addUpDownActivity(
         uint256 communityId,
         address postCreator,
@@ -79,12 +85,16 @@ interface IPageBank {
 
     function addBalance(uint256 amount) external;
 
+    function settleTreasury() external;
+
     function setPriceForPrivacyAccess(uint256 communityId, uint256 newValue) external;
 
     function transferFromCommunity(uint256 communityId, uint256 amount, address wallet) external returns(bool);
 
     function payForPrivacyAccess(uint256 amount, uint256 communityId) external;
 
+    function payForPrivacyAccessBatch(uint256[] memory communityIds, uint256[] memory amounts) external;
+
     function balanceOf(address user) external view returns (uint256);
 
     function balanceOfCommunity(uint256 communityId) external view returns (uint256);
@@ -101,6 +111,10 @@ interface IPageBank {
 
     function setTreasuryFee(uint256 newTreasuryFee ) external;
 
+    function setAccrualMode(bool newValue) external;
+
     function isPrivacyAvailable(address user, uint256 communityId) external view returns(bool);
 
+    function privacyExpiries(address user, uint256[] memory communityIds) external view returns(uint64[] memory expiries);
+
 }
@@ -14,6 +14,13 @@ interface IPageCalcUserRate {
         DataTypes.ActivityType activityType
     ) external returns(int256 resultPercent);
 
+    function checkCommunityActivities(
+        uint256 communityId,
+        address user,
+        DataTypes.ActivityType activityType,
+        uint256 count
+    ) external returns(int256 resultPercent);
+
     function addDealActivity(address user, DataTypes.ActivityType activityType) external;
 
     function calcPercent(address user, uint256 baseTokenId) external view returns(int256 resultPercent);
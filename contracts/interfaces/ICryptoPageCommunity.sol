@@ -12,15 +12,32 @@ interface IPageCommunity {
         string memory name,
         address creator,
         address[] memory moderators,
-        uint256[] memory postIds,
-        address[] memory users,
-        address[] memory bannedUsers,
+        uint256 postsCount,
         uint256 usersCount,
+        uint256 bannedUsersCount,
         bool isActive,
         bool isPrivate,
         bool isPostOwner
     );
 
+    function readCommunityUsers(uint256 communityId, uint256 offset, uint256 limit)
+        external view returns(address[] memory users);
+
+    function readCommunityPostIds(uint256 communityId, uint256 offset, uint256 limit)
+        external view returns(uint256[] memory postIds);
+
+    function readCommunityBannedUsers(uint256 communityId, uint256 offset, uint256 limit)
+        external view returns(address[] memory bannedUsers);
+
+    function readMemberStatus(uint256 communityId, address user) external view returns(
+        bool isMember,
+        bool isBanned,
+        bool isModerator,
+        uint64 joinedAt
+    );
+
+    function syncMemberStatus(uint256 communityId, address[] memory users) external;
+
     function addModerator(uint256 communityId, address moderator) external;
 
     function removeModerator(uint256 communityId, address moderator) external;
@@ -43,7 +60,13 @@ interface IPageCommunity {
         address owner
     ) external;
 
-    function readPost(uint256 postId) external returns(
+    function writePostDigest(
+        uint256 communityId,
+        bytes32 digest,
+        address owner
+    ) external;
+
+    function readPost(uint256 postId) external view returns(
         string memory ipfsHash,
         address creator,
         address owner,
@@ -75,7 +98,24 @@ interface IPageCommunity {
         address owner
     ) external;
 
-    function readComment(uint256 postId, uint256 commentId) external returns(
+    function writeCommentDigest(
+        uint256 postId,
+        bytes32 digest,
+        bool isUp,
+        bool isDown,
+        address owner
+    ) external;
+
+    function writeComments(
+        uint256 communityId,
+        uint256[] memory postIds,
+        string[] memory ipfsHashes,
+        bool[] memory isUps,
+        bool[] memory isDowns,
+        address owner
+    ) external;
+
+    function readComment(uint256 postId, uint256 commentId) external view returns(
         string memory ipfsHash,
         address creator,
         address owner,
@@ -97,9 +137,17 @@ interface IPageCommunity {
 
     function addVoterContract(address newContract) external;
 
+    function setLens(address newLens) external;
+
     function changeSupervisor(address newUser) external;
 
-    function getCommentCount(uint256 postId) external returns(uint256);
+    function syncCommentIds(uint256 postId, uint256 fromCommentId, uint256 toCommentId) external;
+
+    function getCommentIds(uint256 postId, uint256 offset, uint256 limit) external view returns(uint256[] memory commentIds);
+
+    function getLiveCommentCount(uint256 postId) external view returns(uint256);
+
+    function getCommentCount(uint256 postId) external view returns(uint256);
 
     function isCommunityCreator(uint256 communityId, address user) external returns(bool);
 
@@ -111,7 +159,7 @@ interface IPageCommunity {
 
     function isCommunityModerator(uint256 communityId, address user) external returns(bool);
 
-    function getCommunityIdByPostId(uint256 postId) external returns(uint256);
+    function getCommunityIdByPostId(uint256 postId) external view returns(uint256);
 
     function isUpDownUser(uint256 postId, address user) external returns(bool);
 
@@ -121,4 +169,6 @@ interface IPageCommunity {
 
     function isPrivateCommunity(uint256 communityId) external view returns(bool);
 
+    function hasPrivacyAccess(uint256 communityId, address user) external view returns(bool);
+
 }
\ No newline at end of file
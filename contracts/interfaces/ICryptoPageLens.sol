@@ -0,0 +1,19 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity 0.8.12;
+
+import {DataTypes} from '../libraries/DataTypes.sol';
+
+interface IPageLens {
+
+    function version() external pure returns (string memory);
+
+    function readPosts(uint256[] memory postIds) external view returns(DataTypes.PostView[] memory posts);
+
+    function readCommentsRange(uint256 postId, uint256 from, uint256 to)
+        external view returns(DataTypes.CommentView[] memory comments);
+
+    function readFeed(uint256 communityId, uint256 offset, uint256 limit)
+        external view returns(DataTypes.PostView[] memory posts);
+
+}
@@ -2,9 +2,9 @@
 
 pragma solidity 0.8.12;
 
-import "@openzeppelin/contracts/token/ERC721/extensions/IERC721EnumerableUpgradeable.sol";
+import "@openzeppelin/contracts/token/ERC721/IERC721Upgradeable.sol";
 
-interface IPageNFT is IERC721EnumerableUpgradeable {
+interface IPageNFT is IERC721Upgradeable {
 
     function version() external pure returns (string memory);
 
@@ -16,6 +16,4 @@ interface IPageNFT is IERC721EnumerableUpgradeable {
 
     function burn(uint256 tokenId) external;
 
-    function tokensOfOwner(address user) external view returns (uint256[] memory);
-
 }
@@ -0,0 +1,15 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity 0.8.12;
+
+import "@openzeppelin/contracts/token/ERC721/extensions/IERC721EnumerableUpgradeable.sol";
+
+import "./ICryptoPageNFT.sol";
+
+interface IPageNFTEnumerable is IPageNFT, IERC721EnumerableUpgradeable {
+
+    function tokensOfOwner(address user) external view returns (uint256[] memory);
+
+    function tokensOfOwner(address user, uint256 offset, uint256 limit) external view returns (uint256[] memory);
+
+}
@@ -12,8 +12,16 @@ interface IPageOracle {
 
     function setStablePrice(uint256 newPrice) external;
 
+    function setPool(address newPool) external;
+
+    function changeCachedPriceStatus() external;
+
+    function setMaxPriceAge(uint32 newValue) external;
+
     function getFromPageToWethPrice() external view returns (uint256 price);
 
     function getFromWethToPageAmount(uint256 wethAmountIn) external view returns (uint256 pageAmountOut);
 
+    function convertFromWethToPageAmount(uint256 wethAmountIn) external returns (uint256 pageAmountOut);
+
 }
@@ -10,6 +10,8 @@ interface IPageSafeDeal {
 
     function setToken(address newToken) external;
 
+    function setMessageHashMode(bool newValue) external;
+
     function makeDeal(
         string memory desc,
         address seller,
@@ -20,6 +22,17 @@ interface IPageSafeDeal {
         bool isEth
     ) external payable;
 
+    function makeDealWithPermit(
+        string memory desc,
+        address seller,
+        address guarantor,
+        uint128 startTime,
+        uint128 endTime,
+        uint256 amount,
+        bool isEth,
+        DataTypes.Permit memory permit
+    ) external payable;
+
     function changeDescription(uint256 dealId, string memory desc) external;
 
     function changeTime(uint256 dealId, uint128 startTime, uint128 endTime) external;
@@ -67,6 +80,16 @@ interface IPageSafeDeal {
         DataTypes.DealMessage[] memory messages
     );
 
+    function readMessagesDeal(uint256 dealId, uint256 offset, uint256 limit) external view returns(
+        DataTypes.DealMessage[] memory messages
+    );
+
+    function readMessagesHash(uint256 dealId) external view returns(
+        bool isMessageHash,
+        bytes32 messagesHash,
+        uint256 messageCount
+    );
+
     function isStartApproved(uint256 dealId) external view returns(bool);
 
     function isEndApproved(uint256 dealId) external view returns(bool);
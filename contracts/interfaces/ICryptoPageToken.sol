@@ -3,8 +3,9 @@
 pragma solidity 0.8.12;
 
 import "@openzeppelin/contracts/token/ERC20/IERC20Upgradeable.sol";
+import "@openzeppelin/contracts/token/ERC20/extensions/draft-IERC20PermitUpgradeable.sol";
 
-interface IPageToken is IERC20Upgradeable {
+interface IPageToken is IERC20Upgradeable, IERC20PermitUpgradeable {
 
     function version() external pure returns (string memory);
 
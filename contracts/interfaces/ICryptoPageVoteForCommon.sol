@@ -20,8 +20,20 @@ interface IPageVoteForCommon {
 
     function putVote(uint256 communityId, uint256 index, bool isYes) external;
 
+    function putVotesBySig(
+        uint256 communityId,
+        uint256 index,
+        bool[] memory isYes,
+        uint256[] memory deadlines,
+        bytes[] memory signatures
+    ) external returns(uint256 count);
+
     function executeVote(uint256 communityId, uint256 index) external;
 
+    function executeVotes(uint256 communityId, uint256[] memory indexes) external;
+
+    function syncActiveVotes(uint256 communityId, uint256 fromIndex, uint256 toIndex) external;
+
     function readVote(uint256 communityId, uint256 index) external view returns(
         string memory description,
         address creator,
@@ -31,9 +43,20 @@ interface IPageVoteForCommon {
         uint128 noCount,
         uint64[4] memory newValues,
         address user,
-        address[] memory voteUsers,
+        uint256 voterCount,
         bool active
     );
 
+    function readActiveVotes(uint256 communityId, uint256 offset, uint256 limit) external view returns(
+        uint256[] memory indexes,
+        uint128[] memory finishTimes
+    );
+
+    function readExecutableVotes(uint256 communityId, uint256 offset, uint256 limit) external view returns(
+        uint256[] memory indexes
+    );
+
+    function DOMAIN_SEPARATOR() external view returns(bytes32);
+
     function readVotesCount(uint256 communityId) external view returns(uint256 count);
 }
@@ -38,12 +38,23 @@ interface IPageVoteForEarn {
 
     function putNftTransferVote(uint256 communityId, uint256 index, bool isYes) external;
 
+    function putVotesBySig(
+        uint256 kind,
+        uint256 communityId,
+        uint256 index,
+        bool[] memory isYes,
+        uint256[] memory deadlines,
+        bytes[] memory signatures
+    ) external returns(uint256 count);
+
     function executePrivacyAccessPriceVote(uint256 communityId, uint256 index) external;
 
     function executeTokenTransferVote(uint256 communityId, uint256 index) external;
 
     function executeNftTransferVote(uint256 communityId, uint256 index) external;
 
+    function executeVotes(uint256 communityId, uint256[] memory kinds, uint256[] memory indexes) external;
+
     function readPrivacyAccessPriceVote(uint256 communityId, uint256 index) external view returns(
         string memory description,
         address creator,
@@ -51,7 +62,7 @@ interface IPageVoteForEarn {
         uint128 yesCount,
         uint128 noCount,
         uint128 newPrice,
-        address[] memory voteUsers,
+        uint256 voterCount,
         bool active
     );
 
@@ -63,7 +74,7 @@ interface IPageVoteForEarn {
         uint128 noCount,
         uint128 amount,
         address wallet,
-        address[] memory voteUsers,
+        uint256 voterCount,
         bool active
     );
 
@@ -75,10 +86,17 @@ interface IPageVoteForEarn {
         uint128 noCount,
         uint128 amount,
         address wallet,
-        address[] memory voteUsers,
+        uint256 voterCount,
         bool active
     );
 
+    function readExecutableVotes(uint256 communityId) external view returns(
+        uint256[] memory kinds,
+        uint256[] memory indexes
+    );
+
+    function DOMAIN_SEPARATOR() external view returns(bytes32);
+
     function readPrivacyAccessPriceVotesCount(uint256 communityId) external view returns(uint256 count);
 
     function readTokenTransferVotesCount(uint256 communityId) external view returns(uint256 count);
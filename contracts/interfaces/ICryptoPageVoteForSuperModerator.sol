@@ -27,10 +27,12 @@ interface IPageVoteForSuperModerator {
         uint128 yesCount,
         uint128 noCount,
         address user,
-        address[] memory voteUsers,
-        uint256[] memory voteCommunities,
+        uint256 voterCount,
+        uint256 communityCount,
         bool active
     );
 
     function readVotesCount() external view returns(uint256 count);
+
+    function readExecutableVotes() external view returns(uint256[] memory indexes);
 }
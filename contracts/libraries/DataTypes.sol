@@ -2,8 +2,6 @@
 
 pragma solidity 0.8.12;
 
-import "@openzeppelin/contracts/utils/structs/EnumerableSetUpgradeable.sol";
-
 library DataTypes {
 
     enum ActivityType { POST, MESSAGE, UP, DOWN, DEAL_GUARANTOR, DEAL_SELLER, DEAL_BUYER }
@@ -14,6 +12,14 @@ library DataTypes {
         uint256 writeTime;
     }
 
+    struct Permit {
+        uint256 value;
+        uint256 deadline;
+        uint8 v;
+        bytes32 r;
+        bytes32 s;
+    }
+
     struct SafeDeal {
         string description;
         address seller;
@@ -30,8 +36,42 @@ library DataTypes {
         bool isEth;
         bool isFinished;
         DealMessage[] messages;
+        // running hash of the messages which are kept only in the events
+        bytes32 messagesHash;
+        uint128 messageCount;
+        bool isMessageHash;
+    }
+
+    struct PostView {
+        uint256 id;
+        string ipfsHash;
+        address creator;
+        address owner;
+        uint64 upCount;
+        uint64 downCount;
+        uint128 price;
+        uint256 commentCount;
+        address[] upDownUsers;
+        bool isView;
+    }
+
+    struct CommentView {
+        uint256 postId;
+        uint256 id;
+        string ipfsHash;
+        address creator;
+        address owner;
+        uint128 price;
+        bool isUp;
+        bool isDown;
+        bool isView;
     }
 
+    // voterCount and voterNumber take the two slots of the former EnumerableSet of voters
+    // (its length and its 1-based indexes), so the votes written before the upgrade are still read.
+    // voterNumber is the 1-based number of the voter, zero if the user did not vote.
+    // communityCount and communityNumber replace the EnumerableSet of communities in the same way.
+    // The voters themselves are read from the Put*Vote events.
     struct AddressUintsVote {
         string description;
         address creator;
@@ -41,7 +81,8 @@ library DataTypes {
         uint128 noCount;
         uint64[4] newValues;
         address user;
-        EnumerableSetUpgradeable.AddressSet voteUsers;
+        uint256 voterCount;
+        mapping(address => uint256) voterNumber;
         bool active;
     }
 
@@ -53,7 +94,8 @@ library DataTypes {
         uint128 noCount;
         uint128 value;
         address user;
-        EnumerableSetUpgradeable.AddressSet voteUsers;
+        uint256 voterCount;
+        mapping(address => uint256) voterNumber;
         bool active;
     }
 
@@ -64,7 +106,8 @@ library DataTypes {
         uint128 yesCount;
         uint128 noCount;
         uint128 newValue;
-        EnumerableSetUpgradeable.AddressSet voteUsers;
+        uint256 voterCount;
+        mapping(address => uint256) voterNumber;
         bool active;
     }
 
@@ -75,7 +118,8 @@ library DataTypes {
         uint128 yesCount;
         uint128 noCount;
         bool newValue;
-        EnumerableSetUpgradeable.AddressSet voteUsers;
+        uint256 voterCount;
+        mapping(address => uint256) voterNumber;
         bool active;
     }
 
@@ -86,8 +130,10 @@ library DataTypes {
         uint128 yesCount;
         uint128 noCount;
         address user;
-        EnumerableSetUpgradeable.AddressSet voteUsers;
-        EnumerableSetUpgradeable.UintSet voteCommunities;
+        uint256 voterCount;
+        mapping(address => uint256) voterNumber;
+        uint256 communityCount;
+        mapping(uint256 => uint256) communityNumber;
         bool active;
     }
 }
@@ -0,0 +1,39 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity 0.8.12;
+
+library IpfsHash {
+
+    bytes internal constant ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz";
+
+    uint256 internal constant CID_V0_LENGTH = 46;
+    // sha2-256 code and digest length of the multihash
+    uint256 internal constant SHA256_PREFIX = 0x1220;
+
+    /**
+     * @dev Returns the base58 CIDv0 ("Qm...") for the sha2-256 digest of the content.
+     * The multihash (0x1220 + digest) is split into three limbs of 128 bits
+     * and divided by 58 with a long division for each digit.
+     *
+     * @param digest The sha2-256 digest of the content
+     */
+    function toCidV0(bytes32 digest) internal pure returns(string memory) {
+        uint256 high = SHA256_PREFIX;
+        uint256 middle = uint256(digest) >> 128;
+        uint256 low = uint256(digest) & type(uint128).max;
+
+        bytes memory result = new bytes(CID_V0_LENGTH);
+        for (uint256 i = CID_V0_LENGTH; i > 0; i--) {
+            uint256 remainder = high % 58;
+            high /= 58;
+            middle += remainder << 128;
+            remainder = middle % 58;
+            middle /= 58;
+            low += remainder << 128;
+            remainder = low % 58;
+            low /= 58;
+            result[i - 1] = ALPHABET[remainder];
+        }
+        return string(result);
+    }
+}
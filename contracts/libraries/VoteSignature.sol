@@ -0,0 +1,58 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity 0.8.12;
+
+import "@openzeppelin/contracts/utils/cryptography/ECDSAUpgradeable.sol";
+
+library VoteSignature {
+
+    bytes32 internal constant DOMAIN_TYPEHASH = keccak256(
+        "EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)"
+    );
+    // kind is the vote type of the contract, it is always 0 for PageVoteForCommon
+    bytes32 internal constant VOTE_TYPEHASH = keccak256(
+        "Vote(uint256 kind,uint256 communityId,uint256 index,bool isYes,uint256 deadline)"
+    );
+    bytes32 internal constant VERSION_HASH = keccak256("1");
+
+    /**
+     * @dev Returns the EIP-712 domain separator of the calling contract.
+     * It is computed on every call, so the voting contracts keep no new storage for it.
+     *
+     * @param name Name of the voting contract in the domain
+     */
+    function domainSeparator(string memory name) internal view returns(bytes32) {
+        return keccak256(abi.encode(DOMAIN_TYPEHASH, keccak256(bytes(name)), VERSION_HASH, block.chainid, address(this)));
+    }
+
+    /**
+     * @dev Returns the address which signed the typed vote, or zero address for a broken signature,
+     * so one bad signature does not revert the whole batch.
+     *
+     * @param separator The domain separator of the voting contract
+     * @param kind The vote type of the contract
+     * @param communityId ID of community
+     * @param index Voting number for the community
+     * @param isYes For the implementation of the proposal or against the implementation
+     * @param deadline The last timestamp when the signed vote can be put
+     * @param signature The 65 bytes signature of the voter
+     */
+    function recoverVoter(
+        bytes32 separator,
+        uint256 kind,
+        uint256 communityId,
+        uint256 index,
+        bool isYes,
+        uint256 deadline,
+        bytes memory signature
+    ) internal pure returns(address) {
+        bytes32 structHash = keccak256(abi.encode(VOTE_TYPEHASH, kind, communityId, index, isYes, deadline));
+        (address voter, ECDSAUpgradeable.RecoverError error) = ECDSAUpgradeable.tryRecover(
+            ECDSAUpgradeable.toTypedDataHash(separator, structHash), signature
+        );
+        if (error != ECDSAUpgradeable.RecoverError.NoError) {
+            return address(0);
+        }
+        return voter;
+    }
+}
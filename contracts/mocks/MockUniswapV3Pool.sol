@@ -0,0 +1,88 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity 0.8.12;
+
+
+     /**
+     * @dev The local pool for tests of the oracle.
+     * Keeps a history of ticks, each change of the tick starts a new checkpoint
+     * so the tick cumulatives grow the same way as in a real pool.
+     *
+     */
+contract MockUniswapV3Pool {
+
+    address public token0;
+    address public token1;
+    int24 public tick;
+
+    struct Checkpoint {
+        uint32 timestamp;
+        int24 tick;
+        int56 tickCumulative;
+    }
+
+    Checkpoint[] public checkpoints;
+
+    event SetTick(int24 oldTick, int24 newTick);
+
+    constructor(address _token0, address _token1, int24 _tick) {
+        token0 = _token0;
+        token1 = _token1;
+        tick = _tick;
+        // the first tick is counted from the zero timestamp
+        checkpoints.push(Checkpoint(0, _tick, 0));
+    }
+
+    /**
+     * @dev Changes the tick of the pool from the current block.
+     * The TWAP moves to the new tick gradually, as in a real pool.
+     *
+     * @param newTick The new tick value
+     */
+    function setTick(int24 newTick) external {
+        uint32 timestamp = uint32(block.timestamp);
+        checkpoints.push(Checkpoint(timestamp, newTick, tickCumulativeAt(timestamp)));
+        emit SetTick(tick, newTick);
+        tick = newTick;
+    }
+
+    /**
+     * @dev Returns the tick cumulatives for the history of ticks.
+     *
+     * @param secondsAgos From how long ago each cumulative value should be returned
+     */
+    function observe(uint32[] calldata secondsAgos) external view returns (
+        int56[] memory tickCumulatives,
+        uint160[] memory secondsPerLiquidityCumulativeX128s
+    ) {
+        tickCumulatives = new int56[](secondsAgos.length);
+        secondsPerLiquidityCumulativeX128s = new uint160[](secondsAgos.length);
+        for (uint256 i = 0; i < secondsAgos.length; i++) {
+            tickCumulatives[i] = tickCumulativeAt(uint32(block.timestamp - secondsAgos[i]));
+        }
+    }
+
+    /**
+     * @dev Returns the count of tick changes including the initial tick.
+     *
+     */
+    function checkpointsCount() external view returns (uint256) {
+        return checkpoints.length;
+    }
+
+    // *** --- Private area --- ***
+
+    /**
+     * @dev Returns the tick cumulative from the last checkpoint before the timestamp.
+     *
+     * @param timestamp Time of the observation
+     */
+    function tickCumulativeAt(uint32 timestamp) private view returns (int56) {
+        uint256 i = checkpoints.length - 1;
+        while (i > 0 && checkpoints[i].timestamp > timestamp) {
+            i--;
+        }
+        Checkpoint storage checkpoint = checkpoints[i];
+        return checkpoint.tickCumulative + int56(checkpoint.tick) * int56(uint56(timestamp - checkpoint.timestamp));
+    }
+}
@@ -0,0 +1,30 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity 0.8.12;
+
+import "./CryptoPageProxy.sol";
+
+/**
+ * @dev The storage slot which marks a {PageUUPSProxy}, equals `bytes32(uint256(keccak256("page.proxy.uups")) - 1)`.
+ * {PageUUPSUpgradeable} upgrades only the proxies with this mark, so the implementations behind {PageProxy}
+ * are upgraded by its admin only.
+ */
+bytes32 constant UUPS_PROXY_SLOT = bytes32(uint256(keccak256("page.proxy.uups")) - 1);
+
+/**
+ * @dev A minimal ERC1967 proxy for implementations based on {PageUUPSUpgradeable}.
+ * It has no functions of its own, so every call goes to the fallback and is delegated
+ * without the selector checks of the admin functions of {PageProxy}.
+ * The upgrades are made by the implementation.
+ */
+contract PageUUPSProxy is ERC1967Proxy {
+    /**
+     * @dev Initializes the proxy with the initial implementation.
+     * If `_data` is nonempty, it is used as data in a delegate call to the implementation.
+     */
+    constructor(address _implementation, bytes memory _data)
+        ERC1967Proxy(_implementation, _data)
+    {
+        StorageSlot.getBooleanSlot(UUPS_PROXY_SLOT).value = true;
+    }
+}
@@ -0,0 +1,65 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity 0.8.12;
+
+import "./CryptoPageUUPSProxy.sol";
+
+/**
+ * @dev The upgrade functions for the implementations behind {PageUUPSProxy}.
+ * Unlike UUPSUpgradeable of OpenZeppelin it has no storage gaps, so it can be added
+ * to the contracts which are already deployed behind {PageProxy} without changing their storage layout.
+ * The upgrade functions work only through {PageUUPSProxy}: behind {PageProxy} they revert,
+ * so the implementations there are upgraded only by the proxy admin and an ossified proxy stays locked.
+ */
+abstract contract PageUUPSUpgradeable is IERC1822Proxiable, ERC1967Upgrade {
+    address private immutable self = address(this);
+
+    modifier onlyProxy() {
+        require(address(this) != self, "proxy: must be called through delegatecall");
+        require(_getImplementation() == self, "proxy: must be called through active proxy");
+        require(StorageSlot.getBooleanSlot(UUPS_PROXY_SLOT).value, "proxy: not a UUPS proxy");
+        require(_getAdmin() == address(0), "proxy: upgraded by the proxy admin");
+        _;
+    }
+
+    modifier notDelegated() {
+        require(address(this) == self, "proxy: must not be called through delegatecall");
+        _;
+    }
+
+    /**
+     * @dev Returns the implementation slot for the upgrade check of {ERC1967Upgrade}.
+     * Reverts when it is called through a proxy, so a proxy can not be an implementation.
+     */
+    function proxiableUUID() external view virtual override notDelegated returns (bytes32) {
+        return _IMPLEMENTATION_SLOT;
+    }
+
+    /**
+     * @dev Upgrades the implementation of the proxy.
+     *
+     * @param newImplementation Address of the new implementation
+     */
+    function upgradeTo(address newImplementation) external virtual onlyProxy {
+        _authorizeUpgrade(newImplementation);
+        _upgradeToAndCallUUPS(newImplementation, new bytes(0), false);
+    }
+
+    /**
+     * @dev Upgrades the implementation of the proxy and calls the new implementation with `data`.
+     *
+     * @param newImplementation Address of the new implementation
+     * @param data Calldata for the setup of the new implementation
+     */
+    function upgradeToAndCall(address newImplementation, bytes memory data) external payable virtual onlyProxy {
+        _authorizeUpgrade(newImplementation);
+        _upgradeToAndCallUUPS(newImplementation, data, true);
+    }
+
+    /**
+     * @dev Reverts when the sender can not upgrade the contract.
+     *
+     * @param newImplementation Address of the new implementation
+     */
+    function _authorizeUpgrade(address newImplementation) internal virtual;
+}
@@ -9,14 +9,16 @@ import "@openzeppelin/contracts/token/ERC721/IERC721Upgradeable.sol";
 import "@openzeppelin/contracts/utils/CountersUpgradeable.sol";
 import "@openzeppelin/contracts/access/OwnableUpgradeable.sol";
 
-import "../interfaces/ICryptoPageNFT.sol";
+import "../proxy/CryptoPageUUPSUpgradeable.sol";
+
+import "../interfaces/ICryptoPageNFTEnumerable.sol";
 import "../interfaces/ICryptoPageBank.sol";
 
 /// @title Contract of PAGE.NFT token
 /// @author Crypto.Page Team
 /// @notice
 /// @dev //https://github.com/OpenZeppelin/openzeppelin-contracts-upgradeable/tree/master/contracts
-contract PageNFT is OwnableUpgradeable, ERC721EnumerableUpgradeable, IPageNFT {
+contract PageNFT is OwnableUpgradeable, ERC721EnumerableUpgradeable, PageUUPSUpgradeable, IPageNFTEnumerable {
     using CountersUpgradeable for CountersUpgradeable.Counter;
 
     CountersUpgradeable.Counter public _tokenIdCounter;
@@ -149,6 +151,27 @@ contract PageNFT is OwnableUpgradeable, ERC721EnumerableUpgradeable, IPageNFT {
         }
     }
 
+    /**
+     * @dev Returns a range of token IDs owned by the user.
+     * If the offset is out of the user tokens, the range is empty.
+     *
+     * @param user Address of the owner of the tokens
+     * @param offset Index of the first token in the range
+     * @param limit Maximum number of tokens in the range
+     */
+    function tokensOfOwner(address user, uint256 offset, uint256 limit) external override view returns (uint256[] memory) {
+        uint256 tokenCount = balanceOf(user);
+        if (offset >= tokenCount) {
+            return new uint256[](0);
+        }
+        uint256 end = limit > tokenCount - offset ? tokenCount : offset + limit;
+        uint256[] memory output = new uint256[](end - offset);
+        for (uint256 index = offset; index < end; index++) {
+            output[index - offset] = tokenOfOwnerByIndex(user, index);
+        }
+        return output;
+    }
+
     /**
      * @dev Mint NFT token.
      *
@@ -169,4 +192,10 @@ contract PageNFT is OwnableUpgradeable, ERC721EnumerableUpgradeable, IPageNFT {
     function _baseURI() internal view virtual override returns (string memory) {
         return _baseTokenURI;
     }
+
+    /**
+     * @dev Only the owner can upgrade the contract behind {PageUUPSProxy}.
+     *
+     */
+    function _authorizeUpgrade(address) internal override onlyOwner {}
 }
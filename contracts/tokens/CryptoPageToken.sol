@@ -3,6 +3,10 @@
 pragma solidity 0.8.12;
 
 import "@openzeppelin/contracts/token/ERC20/ERC20Upgradeable.sol";
+import "@openzeppelin/contracts/utils/cryptography/ECDSAUpgradeable.sol";
+import "@openzeppelin/contracts/access/OwnableUpgradeable.sol";
+
+import "../proxy/CryptoPageUUPSUpgradeable.sol";
 
 import "../interfaces/ICryptoPageToken.sol";
 
@@ -10,9 +14,19 @@ import "../interfaces/ICryptoPageToken.sol";
      * @dev Only bank can mint and burn tokens
      *
      */
-contract PageToken is ERC20Upgradeable, IPageToken {
+contract PageToken is ERC20Upgradeable, PageUUPSUpgradeable, IPageToken {
     address public bank;
 
+    bytes32 private constant DOMAIN_TYPEHASH = keccak256(
+        "EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)"
+    );
+    bytes32 private constant PERMIT_TYPEHASH = keccak256(
+        "Permit(address owner,address spender,uint256 value,uint256 nonce,uint256 deadline)"
+    );
+
+    /// EIP-2612 nonces, the next permit of the owner must be signed with this value
+    mapping(address => uint256) public override nonces;
+
     modifier onlyBank() {
         require(
             _msgSender() == bank,
@@ -43,6 +57,44 @@ contract PageToken is ERC20Upgradeable, IPageToken {
         return "1";
     }
 
+    /**
+     * @dev Sets the allowance of the spender by the EIP-2612 signature of the owner.
+     *
+     * @param owner Address of token holder
+     * @param spender Address which can spend the tokens
+     * @param value Allowance value
+     * @param deadline Time in Unix format after which the signature is not valid
+     * @param v Part of the signature
+     * @param r Part of the signature
+     * @param s Part of the signature
+     */
+    function permit(
+        address owner,
+        address spender,
+        uint256 value,
+        uint256 deadline,
+        uint8 v,
+        bytes32 r,
+        bytes32 s
+    ) external override {
+        require(block.timestamp <= deadline, "PageToken: expired deadline");
+
+        bytes32 structHash = keccak256(abi.encode(PERMIT_TYPEHASH, owner, spender, value, nonces[owner]++, deadline));
+        address signer = ECDSAUpgradeable.recover(ECDSAUpgradeable.toTypedDataHash(DOMAIN_SEPARATOR(), structHash), v, r, s);
+        require(signer == owner, "PageToken: invalid signature");
+
+        _approve(owner, spender, value);
+    }
+
+    /**
+     * @dev Returns the EIP-712 domain separator for the permits.
+     * It is computed on every call, so the proxy keeps no new storage for it.
+     *
+     */
+    function DOMAIN_SEPARATOR() public view override returns (bytes32) {
+        return keccak256(abi.encode(DOMAIN_TYPEHASH, keccak256(bytes(name())), keccak256("1"), block.chainid, address(this)));
+    }
+
     /**
      * @dev Mint PAGE tokens.
      *
@@ -62,4 +114,12 @@ contract PageToken is ERC20Upgradeable, IPageToken {
     function burn(address to, uint256 amount) public override onlyBank {
         _burn(to, amount);
     }
+
+    /**
+     * @dev Only the owner of the bank can upgrade the token behind {PageUUPSProxy}.
+     *
+     */
+    function _authorizeUpgrade(address) internal view override {
+        require(_msgSender() == OwnableUpgradeable(bank).owner(), "PageToken: only the owner of the bank can upgrade");
+    }
 }
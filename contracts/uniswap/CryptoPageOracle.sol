@@ -6,11 +6,13 @@ import "@openzeppelin/contracts/access/OwnableUpgradeable.sol";
 import "@uniswap/contracts/interfaces/IUniswapV3Pool.sol";
 import "@uniswap/contracts/libraries/FixedPoint96.sol";
 
+import "../proxy/CryptoPageUUPSUpgradeable.sol";
+
 import "../interfaces/ICryptoPageOracle.sol";
 import "../libraries/FullMath.sol";
 import "../libraries/TickMath.sol";
 
-contract PageOracle is Initializable, OwnableUpgradeable, IPageOracle {
+contract PageOracle is Initializable, OwnableUpgradeable, PageUUPSUpgradeable, IPageOracle {
 
     using FullMath for uint256;
 
@@ -22,9 +24,24 @@ contract PageOracle is Initializable, OwnableUpgradeable, IPageOracle {
     bool public isStablePrice;
     uint256 public stablePrice;
 
+    struct PriceCache {
+        uint128 price;
+        uint64 blockNumber;
+        uint64 timestamp;
+    }
+
+    // The position of PAGE token in the pool: 0 - not resolved (a proxy initialized before it), 1 - token0, 2 - token1.
+    uint8 private pageTokenOrder;
+    bool public isCachedPrice;
+    uint32 public maxPriceAge; // How many seconds the cached price can be used.
+    PriceCache public priceCache;
+
     event SetTwapIntervals(uint32 oldTwapInterval, uint32 newTwapInterval);
     event ChangeStablePriceStatus(bool newStatus);
     event SetStablePrice(uint256 oldPrice, uint256 newPrice);
+    event ChangeCachedPriceStatus(bool newStatus);
+    event SetMaxPriceAge(uint32 oldValue, uint32 newValue);
+    event SetPool(address indexed newPool);
 
     /**
      * @dev Makes the initialization of the initial values for the smart contract
@@ -39,6 +56,7 @@ contract PageOracle is Initializable, OwnableUpgradeable, IPageOracle {
 
         PAGE_TOKEN = _token;
         pool = IUniswapV3Pool(_pool);
+        pageTokenOrder = readPageTokenOrder();
         pageTwapInterval = 15 minutes;
     }
 
@@ -81,11 +99,67 @@ contract PageOracle is Initializable, OwnableUpgradeable, IPageOracle {
         stablePrice = newPrice;
     }
 
+    /**
+     * @dev Changes the pool and resolves the position of PAGE token in it.
+     *
+     * @param newPool The new pool address.
+     */
+    function setPool(address newPool) external override onlyOwner {
+        require(newPool != address(0), "PageOracle: wrong address");
+        pool = IUniswapV3Pool(newPool);
+        pageTokenOrder = readPageTokenOrder();
+        delete priceCache;
+        emit SetPool(newPool);
+    }
+
+    /**
+     * @dev Returns true if PAGE token is token0 of the pool
+     *
+     */
+    function isPageToken0() public view returns (bool) {
+        uint8 order = pageTokenOrder;
+        if (order == 0) {
+            order = readPageTokenOrder();
+        }
+        return order == 1;
+    }
+
+    /**
+     * @dev Changes status for the cached price
+     *
+     */
+    function changeCachedPriceStatus() external override onlyOwner {
+        isCachedPrice = !isCachedPrice;
+        delete priceCache;
+        emit ChangeCachedPriceStatus(isCachedPrice);
+    }
+
+    /**
+     * @dev Sets how many seconds the cached price can be used.
+     * With zero value the cached price is used only in the same block.
+     *
+     * @param newValue The new `maxPriceAge`.
+     */
+    function setMaxPriceAge(uint32 newValue) external override onlyOwner {
+        require(newValue <= pageTwapInterval, "PageOracle: price age too long");
+        emit SetMaxPriceAge(maxPriceAge, newValue);
+        maxPriceAge = newValue;
+    }
+
     /**
      * @dev Returns PAGE / WETH price from UniswapV3
      */
     function getFromPageToWethPrice() public view override returns (uint256 price) {
-        price = isStablePrice ? stablePrice : getAmountWETHFromPage(1e18);
+        if (isStablePrice) {
+            return stablePrice;
+        }
+        if (isCachedPrice) {
+            PriceCache memory cache = priceCache;
+            if (isFreshPrice(cache)) {
+                return cache.price;
+            }
+        }
+        price = getAmountWETHFromPage(1e18);
     }
 
     /**
@@ -97,6 +171,50 @@ contract PageOracle is Initializable, OwnableUpgradeable, IPageOracle {
         pageAmountOut = wethAmountIn * 1e18 / price;
     }
 
+    /**
+     * @dev Returns WETH / Page amount.
+     * In the cached price mode a stale price is requested from the pool and saved.
+     *
+     * @param wethAmountIn Amount of WETH tokens
+     */
+    function convertFromWethToPageAmount(uint256 wethAmountIn) external override returns (uint256 pageAmountOut) {
+        uint256 price = updatePrice();
+        require(price > 0, "PageOracle: wrong price");
+        pageAmountOut = wethAmountIn * 1e18 / price;
+    }
+
+    /**
+     * @dev Returns PAGE / WETH price and updates the cached price if it is stale.
+     */
+    function updatePrice() internal returns (uint256 price) {
+        if (isStablePrice) {
+            return stablePrice;
+        }
+        if (pageTokenOrder == 0) {
+            // the proxy was initialized before the order was saved
+            pageTokenOrder = readPageTokenOrder();
+        }
+        if (!isCachedPrice) {
+            return getAmountWETHFromPage(1e18);
+        }
+        PriceCache memory cache = priceCache;
+        if (isFreshPrice(cache)) {
+            return cache.price;
+        }
+        price = getAmountWETHFromPage(1e18);
+        priceCache = PriceCache(uint128(price), uint64(block.number), uint64(block.timestamp));
+    }
+
+    /**
+     * @dev Returns true if the cached price can be used.
+     *
+     * @param cache The cached price
+     */
+    function isFreshPrice(PriceCache memory cache) internal view returns (bool) {
+        return cache.blockNumber == block.number
+            || (cache.blockNumber > 0 && block.timestamp - cache.timestamp <= maxPriceAge);
+    }
+
     /**
      * @dev Makes TWAP a request to the pool and calculates the amount of ether
      *
@@ -116,7 +234,7 @@ contract PageOracle is Initializable, OwnableUpgradeable, IPageOracle {
         );
 
         // Computation depends on the position of token in pool.
-        if (pool.token0() == PAGE_TOKEN) {
+        if (isPageToken0()) {
             wethAmountOut = pageAmountIn.mulDiv(
                 _getPriceX96FromSqrtPriceX96(sqrtPriceX961),
                 FixedPoint96.Q96
@@ -129,6 +247,14 @@ contract PageOracle is Initializable, OwnableUpgradeable, IPageOracle {
         }
     }
 
+    /**
+     * @dev Returns the position of PAGE token in the pool, 1 for token0 and 2 for token1
+     *
+     */
+    function readPageTokenOrder() internal view returns (uint8) {
+        return pool.token0() == PAGE_TOKEN ? 1 : 2;
+    }
+
     /**
      * @dev Returns the price in fixed point 96 from the square of the price in fixed point 96
      *
@@ -138,4 +264,10 @@ contract PageOracle is Initializable, OwnableUpgradeable, IPageOracle {
     function _getPriceX96FromSqrtPriceX96(uint160 _sqrtPriceX96) internal pure returns (uint256 priceX96) {
         return FullMath.mulDiv(_sqrtPriceX96, _sqrtPriceX96, FixedPoint96.Q96);
     }
+
+    /**
+     * @dev Only the owner can upgrade the contract behind {PageUUPSProxy}.
+     *
+     */
+    function _authorizeUpgrade(address) internal override onlyOwner {}
 }
@@ -1,6 +1,7 @@
 import os
 import sys
-from brownie import network, accounts, Contract, PageCalcUserRate
+from brownie import network, accounts, project
+from deploy.registry import Registry
 #before <export ETHERSCAN_TOKEN=AKTI...4HZ>
 
 #========= main addreses ============
@@ -13,29 +14,11 @@ admin = '0x0000000000000000000000000000000000000000'
 treasury = '0x0000000000000000000000000000000000000000'
 page_token_pool = '0x0000000000000000000000000000000000000000'
 
-user_rate_token = '0x0000000000000000000000000000000000000000' #It will be known after the installation of the PageUserRateToken
-proxy_user_rate_token = '0x0000000000000000000000000000000000000000' #It will be known after the installation of the PageUserRateToken
-
-calc_user_rate = '0x0000000000000000000000000000000000000000'
-proxy_calc_user_rate = '0x0000000000000000000000000000000000000000'
-
-bank = '0x0000000000000000000000000000000000000000'
-proxy_bank = '0x0000000000000000000000000000000000000000'
-
-token = '0x0000000000000000000000000000000000000000'
-proxy_token = '0x0000000000000000000000000000000000000000'
-
-oracle = '0x0000000000000000000000000000000000000000'
-proxy_oracle = '0x0000000000000000000000000000000000000000'
-
-nft = '0x0000000000000000000000000000000000000000'
-proxy_nft = '0x0000000000000000000000000000000000000000'
-
-community = '0x0000000000000000000000000000000000000000'
-proxy_community = '0x0000000000000000000000000000000000000000'
-
 #========= proxy contracts ============
+# the addresses are kept for each network in deploy/registry/<network>.json,
+# scripts/deploy_system.py writes them and the contracts are built from the local artifacts
 
+_registry = None
 
 
 def get_is_live():
@@ -56,26 +39,32 @@ def get_rate_token_url():
 def get_nft_url():
     return nft_url
 
+def get_registry():
+    global _registry
+    if _registry is None:
+        _registry = Registry(project.get_loaded_projects()[0], network.show_active())
+    return _registry
+
 def get_proxy_user_rate_token():
-    return Contract.from_explorer(proxy_user_rate_token, as_proxy_for=user_rate_token)
+    return get_registry().contract('pageUserRateToken')
 
 def get_proxy_calc_user_rate():
-    return Contract.from_explorer(proxy_calc_user_rate, as_proxy_for=calc_user_rate)
+    return get_registry().contract('pageCalcUserRate')
 
 def get_proxy_bank():
-    return Contract.from_explorer(proxy_bank, as_proxy_for=bank)
+    return get_registry().contract('pageBank')
 
 def get_proxy_token():
-    return Contract.from_explorer(proxy_token, as_proxy_for=token)
+    return get_registry().contract('pageToken')
 
 def get_proxy_oracle():
-    return Contract.from_explorer(proxy_oracle, as_proxy_for=oracle)
+    return get_registry().contract('pageOracle')
 
 def get_proxy_nft():
-    return Contract.from_explorer(proxy_nft, as_proxy_for=nft)
+    return get_registry().contract('pageNFT')
 
 def get_proxy_community():
-    return Contract.from_explorer(proxy_community, as_proxy_for=community)
+    return get_registry().contract('pageCommunity')
 
 
 def get_deployer_account(is_live):
@@ -0,0 +1,250 @@
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from brownie import Contract, web3
+from web3.exceptions import TransactionNotFound
+
+RECEIPT_TIMEOUT = 600
+
+
+class DeployError(Exception):
+    pass
+
+
+class Ref:
+    """The address of the contract deployed by the step `name`."""
+
+    def __init__(self, name):
+        self.name = name
+
+
+class AccountRef:
+    """The address of the named account (deployer, admin, treasury)."""
+
+    def __init__(self, name):
+        self.name = name
+
+
+class Role:
+    """The role constant (BANK_ROLE, MINTER_ROLE...) read from the target contract of the call."""
+
+    def __init__(self, name):
+        self.name = name
+
+
+class Step:
+
+    def __init__(self, name, args=(), sender='deployer', after=()):
+        self.name = name
+        self.args = tuple(args)
+        self.sender = sender
+        self.after = tuple(after)
+
+    def references(self):
+        return [arg.name for arg in self.args if isinstance(arg, Ref)]
+
+
+class Deploy(Step):
+    """Deploys the brownie container `container` with the constructor args."""
+
+    def __init__(self, name, container, args=(), sender='deployer', after=()):
+        super().__init__(name, args, sender, after)
+        self.container = container
+        self.abi = container
+
+
+class Proxy(Deploy):
+    """Deploys the proxy container (PageProxy or PageUUPSProxy), the other steps use it with the abi of `abi`."""
+
+    def __init__(self, name, container, abi, args=(), sender='deployer', after=()):
+        super().__init__(name, container, args, sender, after)
+        self.abi = abi
+
+
+class Call(Step):
+    """Sends `method(*args)` to the contract of the step `target`."""
+
+    def __init__(self, name, target, method, args=(), sender='deployer', after=()):
+        super().__init__(name, args, sender, after)
+        self.target = target
+        self.method = method
+
+    def references(self):
+        return [self.target] + super().references()
+
+
+class Orchestrator:
+    """
+    Deploys a graph of Deploy, Proxy and Call steps.
+
+    A step is sent when the steps it refers to (Ref, the target of a Call and `after`) are confirmed,
+    and a contract with a `<name>.initialize` step is used by the other steps only after this call.
+    The steps which are ready together are sent as one wave with the nonces counted here
+    (the transactions do not wait for each other), then the receipts of the wave are waited for in parallel.
+
+    The transaction and the address of every step are saved in the state file after each wave,
+    so a new run skips the confirmed steps and waits for the sent ones.
+    """
+
+    def __init__(self, steps, accounts, containers, statePath, publishSource=False, txParams=None):
+        """
+        accounts maps the names of the senders and AccountRef to the brownie accounts (or addresses),
+        containers is the brownie project, txParams are added to every transaction (e.g. gas_price).
+        """
+        self.steps = {}
+        for step in steps:
+            if step.name in self.steps:
+                raise DeployError('duplicate step {}'.format(step.name))
+            self.steps[step.name] = step
+        self.accounts = accounts
+        self.containers = containers
+        self.statePath = statePath
+        self.publishSource = publishSource
+        self.txParams = txParams or {}
+        self.state = None
+        self.sent = 0
+        self.waves = 0
+        self.elapsed = None
+        self.dependencies = {name: self.step_dependencies(step) for name, step in self.steps.items()}
+
+    def step_dependencies(self, step):
+        names = set(step.after)
+        for name in step.references():
+            if name not in self.steps:
+                raise DeployError('{} refers to the unknown step {}'.format(step.name, name))
+            names.add(name)
+            initialize = name + '.initialize'
+            if initialize in self.steps and initialize != step.name:
+                names.add(initialize)
+        return names
+
+    def run(self):
+        """Deploys the steps which are not confirmed yet and returns the wall-clock time in seconds."""
+        started = time.perf_counter()
+        self.state = self.load_state()
+        done = self.resume()
+        while len(done) < len(self.steps):
+            wave = [
+                step for name, step in self.steps.items() if name not in done and self.dependencies[name] <= done
+            ]
+            if not wave:
+                raise DeployError('circular dependencies: {}'.format(', '.join(sorted(set(self.steps) - done))))
+            self.send_wave(wave)
+            done.update(step.name for step in wave)
+        self.elapsed = time.perf_counter() - started
+        return self.elapsed
+
+    def report(self):
+        return '{} steps, {} transactions in {} waves, {:.2f} s'.format(len(self.steps), self.sent, self.waves, self.elapsed)
+
+    def address(self, name):
+        return self.state['steps'][name]['address']
+
+    def contract(self, name):
+        """Returns the brownie Contract of the deployed step with the abi of its container."""
+        container = getattr(self.containers, self.steps[name].abi)
+        return Contract.from_abi(container._name, self.address(name), container.abi)
+
+    def register(self, registry):
+        """Saves the proxies (with their implementations) and the other deployed contracts in the Registry."""
+        implementations = {step.args[0].name for step in self.steps.values() if isinstance(step, Proxy)}
+        for name, step in self.steps.items():
+            if isinstance(step, Proxy):
+                registry.register(name, step.abi, self.address(name), step.container, self.address(step.args[0].name))
+            elif isinstance(step, Deploy) and name not in implementations:
+                registry.register(name, step.container, self.address(name))
+
+    def load_state(self):
+        chainId = web3.eth.chain_id
+        if not os.path.exists(self.statePath):
+            return {'chainId': chainId, 'steps': {}}
+        with open(self.statePath) as file:
+            state = json.load(file)
+        if state['chainId'] != chainId:
+            raise DeployError('{} is saved for the chain {}, not {}'.format(self.statePath, state['chainId'], chainId))
+        return state
+
+    def save_state(self):
+        directory = os.path.dirname(self.statePath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # the file is replaced at once, so an interrupted run never leaves a broken state
+        with open(self.statePath + '.tmp', 'w') as file:
+            json.dump(self.state, file, indent=2, sort_keys=True)
+        os.replace(self.statePath + '.tmp', self.statePath)
+
+    def resume(self):
+        """Returns the names of the confirmed steps, the receipts of the sent ones are waited for."""
+        done = set()
+        waiting = []
+        for name, item in list(self.state['steps'].items()):
+            if name not in self.steps:
+                continue
+            if item.get('done'):
+                if 'address' in item and web3.eth.get_code(item['address']) in (b'', '0x'):
+                    raise DeployError('{} is not on the chain, remove {} to deploy again'.format(name, self.statePath))
+                done.add(name)
+                continue
+            try:
+                web3.eth.get_transaction(item['tx'])
+                waiting.append(self.steps[name])
+            except TransactionNotFound:
+                # the transaction was dropped, the step is sent again
+                del self.state['steps'][name]
+        if waiting:
+            self.wait(waiting)
+            done.update(step.name for step in waiting)
+        return done
+
+    def send_wave(self, wave):
+        nonces = {}
+        for step in wave:
+            sender = self.accounts[step.sender]
+            if sender.address not in nonces:
+                nonces[sender.address] = web3.eth.get_transaction_count(sender.address, 'pending')
+            params = dict(self.txParams, **{'from': sender, 'nonce': nonces[sender.address], 'required_confs': 0})
+            nonces[sender.address] += 1
+            tx = self.send(step, params)
+            self.state['steps'][step.name] = {'tx': tx.txid}
+            self.sent += 1
+        # the hashes are saved before the receipts, so an interrupted run waits for them instead of sending again
+        self.save_state()
+        self.waves += 1
+        self.wait(wave)
+
+    def send(self, step, params):
+        args = [self.resolve(arg, step) for arg in step.args]
+        if isinstance(step, Deploy):
+            return getattr(self.containers, step.container).deploy(*args, params)
+        return getattr(self.contract(step.target), step.method)(*args, params)
+
+    def resolve(self, arg, step):
+        if isinstance(arg, Ref):
+            return self.address(arg.name)
+        if isinstance(arg, AccountRef):
+            account = self.accounts[arg.name]
+            return getattr(account, 'address', account)
+        if isinstance(arg, Role):
+            return getattr(self.contract(step.target), arg.name)()
+        return arg
+
+    def wait(self, steps):
+        hashes = [self.state['steps'][step.name]['tx'] for step in steps]
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            receipts = list(executor.map(
+                lambda txid: web3.eth.wait_for_transaction_receipt(txid, timeout=RECEIPT_TIMEOUT), hashes
+            ))
+        for step, receipt in zip(steps, receipts):
+            if receipt['status'] != 1:
+                self.save_state()
+                raise DeployError('{} reverted in {}'.format(step.name, self.state['steps'][step.name]['tx']))
+            item = self.state['steps'][step.name]
+            if isinstance(step, Deploy):
+                item['address'] = receipt['contractAddress']
+                if self.publishSource:
+                    container = getattr(self.containers, step.container)
+                    container.publish_source(Contract.from_abi(container._name, item['address'], container.abi))
+            item['done'] = True
+        self.save_state()
@@ -0,0 +1,110 @@
+import json
+import os
+
+from brownie import Contract, web3
+from eth_utils import encode_hex, keccak, to_checksum_address
+
+REGISTRY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'registry')
+# bytes32(uint256(keccak256("eip1967.proxy.implementation")) - 1)
+IMPLEMENTATION_SLOT = 0x360894a13ba1a3210667c828492db98dca3e2076cc3735a920a3ca505d382bbc
+
+
+class RegistryError(Exception):
+    pass
+
+
+def abi_hash(abi):
+    return encode_hex(keccak(text=json.dumps(abi, sort_keys=True, separators=(',', ':'))))
+
+
+def code_hash(code, artifact):
+    """
+    Returns the hash of the deployed code with the immutable variables as zeros, as they are in the artifact,
+    so it is equal to the hash of the artifact when the code is compiled from it.
+    """
+    if len(code) == len(artifact):
+        code = bytes(byte if artifactByte else 0 for byte, artifactByte in zip(code, artifact))
+    return encode_hex(keccak(code))
+
+
+class Registry:
+    """
+    Keeps the deployed contracts of one network in deploy/registry/<network>.json:
+    the address, the contract and the hash of its abi, and for a proxy the proxy contract and the implementation.
+
+    The handles are built with Contract.from_abi from the local build artifacts, without the explorer.
+    The deployed code (of the proxy and of its implementation) is compared with the artifacts once per name,
+    and a contract which is not compiled from the local sources is refused.
+    """
+
+    def __init__(self, containers, network, directory=REGISTRY_DIR):
+        self.containers = containers
+        self.path = os.path.join(directory, network + '.json')
+        self.entries = {}
+        self.verified = set()
+        if os.path.exists(self.path):
+            with open(self.path) as file:
+                self.entries = json.load(file)
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, 'w') as file:
+            json.dump(self.entries, file, indent=2, sort_keys=True)
+
+    def register(self, name, contract, address, proxy=None, implementation=None):
+        """Saves the contract (the name of a brownie container), the proxy and the implementation are for proxies."""
+        entry = {
+            'contract': contract,
+            'address': str(address),
+            'abiHash': abi_hash(self.container(contract).abi),
+        }
+        if proxy is not None:
+            entry['proxy'] = proxy
+            entry['implementation'] = str(implementation)
+        self.entries[name] = entry
+        self.verified.discard(name)
+        self.save()
+
+    def address(self, name):
+        return self.entry(name)['address']
+
+    def contract(self, name):
+        """Returns the brownie Contract of the registered name with the abi of the local artifact."""
+        entry = self.entry(name)
+        self.verify(name)
+        container = self.container(entry['contract'])
+        return Contract.from_abi(entry['contract'], entry['address'], container.abi)
+
+    def verify(self, name):
+        if name in self.verified:
+            return
+        entry = self.entry(name)
+        container = self.container(entry['contract'])
+        if abi_hash(container.abi) != entry['abiHash']:
+            raise RegistryError('the abi of {} was changed since it was registered for {}'.format(entry['contract'], name))
+
+        if 'proxy' in entry:
+            self.check_code(name, entry['address'], entry['proxy'])
+            slot = web3.eth.get_storage_at(entry['address'], IMPLEMENTATION_SLOT)
+            implementation = to_checksum_address(bytes(slot)[-20:])
+            if implementation != to_checksum_address(entry['implementation']):
+                raise RegistryError('the implementation of {} is {}, not {}'.format(name, implementation, entry['implementation']))
+            self.check_code(name, implementation, entry['contract'])
+        else:
+            self.check_code(name, entry['address'], entry['contract'])
+        self.verified.add(name)
+
+    def check_code(self, name, address, contract):
+        artifact = self.container(contract)._build['deployedBytecode']
+        artifact = bytes.fromhex(artifact[2:] if artifact.startswith('0x') else artifact)
+        code = bytes(web3.eth.get_code(address))
+        if code_hash(code, artifact) != encode_hex(keccak(artifact)):
+            raise RegistryError('the code at {} ({}) is not compiled from the local {}'.format(address, name, contract))
+
+    def entry(self, name):
+        if name not in self.entries:
+            raise RegistryError('{} is not registered in {}'.format(name, self.path))
+        return self.entries[name]
+
+    def container(self, contract):
+        return getattr(self.containers, contract)
@@ -0,0 +1,79 @@
+from deploy.orchestrator import AccountRef, Call, Deploy, Proxy, Ref, Role
+
+# the oracle of a local chain reads MockUniswapV3Pool with a constant tick
+FTM_TOKEN = '0x4e15361fd6b4bb609fa63c81a2be19d873717870'
+WETH_TOKEN = '0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2'
+FTM_ETH_TICK = -85325
+
+# the contracts with PageUUPSUpgradeable, the others are always behind PageProxy
+UUPS_CONTRACTS = {'PageCalcUserRate', 'PageBank', 'PageToken', 'PageOracle', 'PageNFT', 'PageNFTLean', 'PageCommunity'}
+
+
+def upgradeable(name, container, initialize, proxy):
+    """The implementation, its proxy and the initialize call of the proxy."""
+    implementation = name + 'Implementation'
+    if proxy == 'uups' and container in UUPS_CONTRACTS:
+        proxyStep = Proxy(name, 'PageUUPSProxy', container, (Ref(implementation), b''))
+    else:
+        proxyStep = Proxy(name, 'PageProxy', container, (Ref(implementation), AccountRef('admin')))
+    return [
+        Deploy(implementation, container),
+        proxyStep,
+        Call(name + '.initialize', name, 'initialize', initialize),
+    ]
+
+
+def page_system(proxy='page', nft='PageNFT', pool=None, rateTokenUrl='https://', nftUrl='https://'):
+    """
+    Returns the steps of the whole system, from the implementations to the voter contracts of PageCommunity.
+    proxy is 'page' or 'uups', nft is 'PageNFT' or 'PageNFTLean',
+    without the pool a MockUniswapV3Pool is deployed for the oracle.
+    """
+    steps = []
+    steps += upgradeable('pageUserRateToken', 'PageUserRateToken', (rateTokenUrl,), proxy)
+    steps += upgradeable('pageCalcUserRate', 'PageCalcUserRate', (AccountRef('admin'), Ref('pageUserRateToken')), proxy)
+    steps.append(Call('pageUserRateToken.setCalcRateContract', 'pageUserRateToken', 'setCalcRateContract', (Ref('pageCalcUserRate'),)))
+
+    steps += upgradeable('pageBank', 'PageBank', (AccountRef('treasury'), AccountRef('admin'), Ref('pageCalcUserRate')), proxy)
+    steps.append(Call('pageCalcUserRate.grantBankRole', 'pageCalcUserRate', 'grantRole', (Role('BANK_ROLE'), Ref('pageBank')), sender='admin'))
+
+    steps += upgradeable('pageToken', 'PageToken', (AccountRef('treasury'), Ref('pageBank')), proxy)
+    steps.append(Call('pageBank.setToken', 'pageBank', 'setToken', (Ref('pageToken'),)))
+
+    if pool is None:
+        steps.append(Deploy('uniswapPool', 'MockUniswapV3Pool', (FTM_TOKEN, WETH_TOKEN, FTM_ETH_TICK)))
+        oracle = (FTM_TOKEN, Ref('uniswapPool'))
+    else:
+        oracle = (Ref('pageToken'), pool)
+    steps += upgradeable('pageOracle', 'PageOracle', oracle, proxy)
+    steps.append(Call('pageBank.setOracle', 'pageBank', 'setOracle', (Ref('pageOracle'),)))
+
+    steps += upgradeable('pageSafeDeal', 'PageSafeDeal', (AccountRef('admin'), Ref('pageCalcUserRate'), Ref('pageOracle')), proxy)
+    steps.append(Call('pageSafeDeal.setToken', 'pageSafeDeal', 'setToken', (Ref('pageToken'),)))
+    steps.append(Call('pageCalcUserRate.grantDealRole', 'pageCalcUserRate', 'grantRole', (Role('DEAL_ROLE'), Ref('pageSafeDeal')), sender='admin'))
+
+    steps += upgradeable('pageNFT', nft, (Ref('pageBank'), nftUrl), proxy)
+    steps += upgradeable('pageCommunity', 'PageCommunity', (Ref('pageNFT'), Ref('pageBank'), AccountRef('admin')), proxy)
+    steps.append(Call('pageNFT.setCommunity', 'pageNFT', 'setCommunity', (Ref('pageCommunity'),)))
+    steps.append(Call('pageBank.grantMinterRole', 'pageBank', 'grantRole', (Role('MINTER_ROLE'), Ref('pageCommunity')), sender='admin'))
+    steps.append(Call('pageBank.grantBurnerRole', 'pageBank', 'grantRole', (Role('BURNER_ROLE'), Ref('pageCommunity')), sender='admin'))
+
+    # the lens keeps no state, so it is deployed without a proxy
+    steps.append(Deploy('pageLens', 'PageLens', (Ref('pageCommunity'),)))
+    steps.append(Call('pageCommunity.setLens', 'pageCommunity', 'setLens', (Ref('pageLens'),)))
+
+    votes = (AccountRef('admin'), Ref('pageToken'), Ref('pageCommunity'), Ref('pageBank'))
+    steps += upgradeable('pageVoteForCommon', 'PageVoteForCommon', votes, proxy)
+    steps.append(Call('pageBank.grantUpdaterFeeRole', 'pageBank', 'grantRole', (Role('UPDATER_FEE_ROLE'), Ref('pageVoteForCommon')), sender='admin'))
+    steps += upgradeable('pageVoteForEarn', 'PageVoteForEarn', votes, proxy)
+    steps.append(Call('pageBank.grantVoteForEarnRole', 'pageBank', 'grantRole', (Role('VOTE_FOR_EARN_ROLE'), Ref('pageVoteForEarn')), sender='admin'))
+    steps += upgradeable('pageVoteForSuperModerator', 'PageVoteForSuperModerator', votes, proxy)
+
+    # the order of PageCommunity.voterContracts is Common, Earn, SuperModerator
+    previous = ()
+    for name in ('pageVoteForCommon', 'pageVoteForEarn', 'pageVoteForSuperModerator'):
+        stepName = 'pageCommunity.addVoterContract.' + name
+        steps.append(Call(stepName, 'pageCommunity', 'addVoterContract', (Ref(name),), after=previous))
+        previous = (stepName,)
+
+    return steps
@@ -0,0 +1,2 @@
+from indexer.indexer import Indexer, ReorgTooDeepError, COMMUNITY_EVENTS, BANK_EVENTS, NFT_EVENTS, VOTE_EVENTS
+from indexer.store import Store
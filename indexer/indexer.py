@@ -0,0 +1,108 @@
+from eth_utils import encode_hex, event_abi_to_log_topic, to_checksum_address
+from hexbytes import HexBytes
+from web3._utils.events import get_event_data
+from web3.exceptions import BlockNotFound
+
+COMMUNITY_EVENTS = (
+    'AddedCommunity', 'JoinUser', 'QuitUser',
+    'WritePost', 'BurnPost', 'ChangePostVisible',
+    'WriteComment', 'BurnComment', 'ChangeVisibleComment',
+)
+BANK_EVENTS = ('MintForPost', 'MintForComment', 'BurnForPost', 'BurnForComment')
+NFT_EVENTS = ('Transfer',)
+VOTE_EVENTS = ('PutVote', 'PutPrivacyAccessPriceVote', 'PutTokenTransferVote', 'PutNftTransferVote')
+
+DEFAULT_BATCH_SIZE = 2000
+DEFAULT_REORG_DEPTH = 12
+
+
+class ReorgTooDeepError(Exception):
+    pass
+
+
+class Indexer:
+    """
+    Reads the events of PageCommunity, PageBank, PageNFT and the voting contracts with eth_getLogs over block ranges
+    and writes them into the Store.
+
+    The checkpoint is the last indexed block, so a new run continues from it.
+    Hashes of the last `reorgDepth` blocks are saved, and when one of them is changed
+    on the chain, the store is rolled back to the last block which is still the same.
+    """
+
+    def __init__(self, web3, store, contracts, startBlock=0, batchSize=DEFAULT_BATCH_SIZE, reorgDepth=DEFAULT_REORG_DEPTH):
+        """
+        contracts is a list of (address, abi),
+        COMMUNITY_EVENTS, BANK_EVENTS, NFT_EVENTS and VOTE_EVENTS are taken from each abi.
+        """
+        self.web3 = web3
+        self.store = store
+        self.startBlock = startBlock
+        self.batchSize = batchSize
+        self.reorgDepth = reorgDepth
+        self.addresses = []
+        self.eventsByTopic = {}
+        for address, abi in contracts:
+            self.addresses.append(to_checksum_address(address))
+            for item in abi:
+                if item.get('type') == 'event' and item['name'] in COMMUNITY_EVENTS + BANK_EVENTS + NFT_EVENTS + VOTE_EVENTS:
+                    self.eventsByTopic[HexBytes(event_abi_to_log_topic(item))] = item
+
+    def sync(self, toBlock=None):
+        """Indexes the blocks from the checkpoint up to toBlock (the head of the chain by default)."""
+        head = self.web3.eth.block_number
+        toBlock = head if toBlock is None else min(toBlock, head)
+        self.check_reorg()
+
+        checkpoint = self.store.get_checkpoint()
+        fromBlock = self.startBlock if checkpoint is None else checkpoint + 1
+        while fromBlock <= toBlock:
+            endBlock = min(fromBlock + self.batchSize - 1, toBlock)
+            logs = self.web3.eth.get_logs({
+                'fromBlock': fromBlock,
+                'toBlock': endBlock,
+                'address': self.addresses,
+                'topics': [[encode_hex(topic) for topic in self.eventsByTopic]],
+            })
+            with self.store.transaction():
+                for log in sorted(logs, key=lambda log: (log['blockNumber'], log['logIndex'])):
+                    self.add_log(log)
+                # only the blocks which can still be reorganized are kept
+                for number in range(max(fromBlock, head - self.reorgDepth + 1), endBlock + 1):
+                    self.store.save_block(number, self.block_hash(number))
+                self.store.prune_blocks(head - self.reorgDepth + 1)
+                self.store.set_checkpoint(endBlock)
+            fromBlock = endBlock + 1
+        return toBlock
+
+    def check_reorg(self):
+        """Rolls the store back to the newest saved block which is still on the chain."""
+        blocks = self.store.recent_blocks()
+        for i, (number, blockHash) in enumerate(blocks):
+            if self.block_hash(number) == blockHash:
+                if i > 0:
+                    with self.store.transaction():
+                        self.store.rollback(number)
+                return number
+        if blocks:
+            raise ReorgTooDeepError('reorganization is deeper than {} blocks'.format(self.reorgDepth))
+        return None
+
+    def add_log(self, log):
+        event = get_event_data(self.web3.codec, self.eventsByTopic[HexBytes(log['topics'][0])], log)
+        args = {
+            name: encode_hex(value) if isinstance(value, bytes) else value for name, value in event['args'].items()
+        }
+        self.store.add_event(event['event'], args, {
+            'blockNumber': log['blockNumber'],
+            'logIndex': log['logIndex'],
+            'transactionHash': encode_hex(log['transactionHash']),
+            'address': log['address'],
+        })
+
+    def block_hash(self, number):
+        try:
+            return encode_hex(self.web3.eth.get_block(number)['hash'])
+        except BlockNotFound:
+            # the block is not on the chain after the reorganization
+            return None
@@ -0,0 +1,482 @@
+import json
+import sqlite3
+from contextlib import contextmanager
+
+BASE58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+ZERO_DIGEST = '0x' + '00' * 32
+ZERO_ADDRESS = '0x' + '00' * 20
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS checkpoints (
+    name TEXT PRIMARY KEY,
+    block_number INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS blocks (
+    number INTEGER PRIMARY KEY,
+    hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    tx_hash TEXT NOT NULL,
+    address TEXT NOT NULL,
+    name TEXT NOT NULL,
+    community_id INTEGER,
+    post_id INTEGER,
+    comment_id INTEGER,
+    args TEXT NOT NULL,
+    PRIMARY KEY (block_number, log_index)
+);
+CREATE INDEX IF NOT EXISTS events_name ON events (name, post_id, comment_id);
+CREATE INDEX IF NOT EXISTS events_community ON events (community_id);
+
+CREATE TABLE IF NOT EXISTS communities (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    creator TEXT NOT NULL,
+    block_number INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS member_events (
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    community_id INTEGER NOT NULL,
+    user TEXT NOT NULL,
+    is_member INTEGER NOT NULL,
+    PRIMARY KEY (block_number, log_index)
+);
+CREATE INDEX IF NOT EXISTS member_events_user ON member_events (community_id, user, block_number, log_index);
+CREATE TABLE IF NOT EXISTS posts (
+    id INTEGER PRIMARY KEY,
+    community_id INTEGER NOT NULL,
+    creator TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    ipfs_hash TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    price TEXT NOT NULL,
+    is_view INTEGER NOT NULL DEFAULT 1,
+    block_number INTEGER NOT NULL,
+    burned_block INTEGER
+);
+CREATE INDEX IF NOT EXISTS posts_community ON posts (community_id);
+CREATE INDEX IF NOT EXISTS posts_creator ON posts (creator);
+CREATE INDEX IF NOT EXISTS posts_owner ON posts (owner);
+CREATE TABLE IF NOT EXISTS comments (
+    post_id INTEGER NOT NULL,
+    id INTEGER NOT NULL,
+    community_id INTEGER NOT NULL,
+    creator TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    ipfs_hash TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    is_up INTEGER NOT NULL,
+    is_down INTEGER NOT NULL,
+    price TEXT NOT NULL,
+    is_view INTEGER NOT NULL DEFAULT 1,
+    block_number INTEGER NOT NULL,
+    burned_block INTEGER,
+    PRIMARY KEY (post_id, id)
+);
+CREATE INDEX IF NOT EXISTS comments_community ON comments (community_id);
+CREATE INDEX IF NOT EXISTS comments_creator ON comments (creator);
+CREATE TABLE IF NOT EXISTS bank_flows (
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    community_id INTEGER NOT NULL,
+    owner TEXT NOT NULL,
+    creator TEXT NOT NULL,
+    amount TEXT NOT NULL,
+    owner_amount TEXT NOT NULL,
+    creator_amount TEXT NOT NULL,
+    treasury_amount TEXT NOT NULL,
+    PRIMARY KEY (block_number, log_index)
+);
+CREATE INDEX IF NOT EXISTS bank_flows_community ON bank_flows (community_id);
+CREATE INDEX IF NOT EXISTS bank_flows_owner ON bank_flows (owner);
+CREATE INDEX IF NOT EXISTS bank_flows_creator ON bank_flows (creator);
+CREATE TABLE IF NOT EXISTS nft_transfers (
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    token_id INTEGER NOT NULL,
+    sender TEXT NOT NULL,
+    receiver TEXT NOT NULL,
+    PRIMARY KEY (block_number, log_index)
+);
+CREATE INDEX IF NOT EXISTS nft_transfers_token ON nft_transfers (token_id, block_number, log_index);
+CREATE INDEX IF NOT EXISTS nft_transfers_receiver ON nft_transfers (receiver);
+CREATE TABLE IF NOT EXISTS voters (
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    community_id INTEGER NOT NULL,
+    vote_index INTEGER NOT NULL,
+    voter TEXT NOT NULL,
+    is_yes INTEGER NOT NULL,
+    weight TEXT NOT NULL,
+    PRIMARY KEY (block_number, log_index)
+);
+CREATE INDEX IF NOT EXISTS voters_vote ON voters (name, community_id, vote_index);
+'''
+
+LAST_BLOCK = 'last_block'
+
+
+def to_cid_v0(digest):
+    """Returns the base58 CIDv0 for the sha2-256 digest, the same as IpfsHash.toCidV0."""
+    value = int.from_bytes(bytes.fromhex('1220') + bytes.fromhex(digest[2:]), 'big')
+    result = ''
+    while value:
+        value, remainder = divmod(value, 58)
+        result = BASE58_ALPHABET[remainder] + result
+    return result
+
+
+class Store:
+    """
+    SQLite storage of the indexed events.
+    The raw events are kept next to the materialized tables, so a rollback
+    can restore the state which was changed by the removed blocks.
+    """
+
+    def __init__(self, path=':memory:'):
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(SCHEMA)
+        self.rebuild_member_events()
+
+    def rebuild_member_events(self):
+        """Fills the membership history from the raw events of a database which was indexed before it."""
+        with self.transaction():
+            if self.connection.execute('SELECT 1 FROM member_events LIMIT 1').fetchone():
+                return
+            for row in self.connection.execute(
+                'SELECT block_number, log_index, name, args FROM events WHERE name IN (?, ?)', ('JoinUser', 'QuitUser')
+            ).fetchall():
+                isMember = row['name'] == 'JoinUser'
+                self.add_member_event(json.loads(row['args']), row['block_number'], row['log_index'], isMember)
+
+    @contextmanager
+    def transaction(self):
+        with self.connection:
+            yield self.connection
+
+    def close(self):
+        self.connection.close()
+
+    # *** --- Checkpoints and blocks --- ***
+
+    def get_checkpoint(self):
+        row = self.connection.execute(
+            'SELECT block_number FROM checkpoints WHERE name = ?', (LAST_BLOCK,)
+        ).fetchone()
+        return row['block_number'] if row else None
+
+    def set_checkpoint(self, blockNumber):
+        self.connection.execute(
+            'INSERT OR REPLACE INTO checkpoints (name, block_number) VALUES (?, ?)', (LAST_BLOCK, blockNumber)
+        )
+
+    def save_block(self, number, blockHash):
+        self.connection.execute('INSERT OR REPLACE INTO blocks (number, hash) VALUES (?, ?)', (number, blockHash))
+
+    def prune_blocks(self, beforeNumber):
+        self.connection.execute('DELETE FROM blocks WHERE number < ?', (beforeNumber,))
+
+    def recent_blocks(self):
+        """Returns (number, hash) of the saved blocks from the newest one."""
+        rows = self.connection.execute('SELECT number, hash FROM blocks ORDER BY number DESC').fetchall()
+        return [(row['number'], row['hash']) for row in rows]
+
+    # *** --- Events --- ***
+
+    def add_event(self, name, args, log):
+        self.connection.execute(
+            'INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (
+                log['blockNumber'], log['logIndex'], log['transactionHash'], log['address'], name,
+                args.get('communityId', args.get('number')), args.get('postId'), args.get('commentId'),
+                json.dumps(args, default=str),
+            )
+        )
+        handler = getattr(self, 'on_' + name, None)
+        if handler:
+            handler(args, log['blockNumber'], log['logIndex'])
+
+    def on_AddedCommunity(self, args, blockNumber, logIndex):
+        self.connection.execute(
+            'INSERT OR REPLACE INTO communities (id, name, creator, block_number) VALUES (?, ?, ?, ?)',
+            (args['number'], args['name'], args['creator'], blockNumber)
+        )
+
+    def add_member_event(self, args, blockNumber, logIndex, isMember):
+        # the membership is an append-only history, the last event of the user is the current state
+        self.connection.execute(
+            'INSERT OR REPLACE INTO member_events VALUES (?, ?, ?, ?, ?)',
+            (blockNumber, logIndex, args['communityId'], args['user'], isMember)
+        )
+
+    def on_JoinUser(self, args, blockNumber, logIndex):
+        self.add_member_event(args, blockNumber, logIndex, True)
+
+    def on_QuitUser(self, args, blockNumber, logIndex):
+        self.add_member_event(args, blockNumber, logIndex, False)
+
+    def on_WritePost(self, args, blockNumber, logIndex):
+        self.connection.execute(
+            'INSERT OR REPLACE INTO posts (id, community_id, creator, owner, ipfs_hash, digest, price, block_number)'
+            ' VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (
+                args['postId'], args['communityId'], args['creator'], args['owner'],
+                args['ipfsHash'], args['digest'], str(args['price']), blockNumber,
+            )
+        )
+
+    def on_BurnPost(self, args, blockNumber, logIndex):
+        self.connection.execute('UPDATE posts SET burned_block = ? WHERE id = ?', (blockNumber, args['postId']))
+
+    def on_ChangePostVisible(self, args, blockNumber, logIndex):
+        self.connection.execute('UPDATE posts SET is_view = ? WHERE id = ?', (args['isVisible'], args['postId']))
+
+    def on_WriteComment(self, args, blockNumber, logIndex):
+        self.connection.execute(
+            'INSERT OR REPLACE INTO comments'
+            ' (post_id, id, community_id, creator, owner, ipfs_hash, digest, is_up, is_down, price, block_number)'
+            ' VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (
+                args['postId'], args['commentId'], args['communityId'], args['creator'], args['owner'],
+                args['ipfsHash'], args['digest'], args['isUp'], args['isDown'], str(args['price']), blockNumber,
+            )
+        )
+
+    def on_BurnComment(self, args, blockNumber, logIndex):
+        self.connection.execute(
+            'UPDATE comments SET burned_block = ? WHERE post_id = ? AND id = ?',
+            (blockNumber, args['postId'], args['commentId'])
+        )
+
+    def on_ChangeVisibleComment(self, args, blockNumber, logIndex):
+        self.connection.execute(
+            'UPDATE comments SET is_view = ? WHERE post_id = ? AND id = ?',
+            (args['isVisible'], args['postId'], args['commentId'])
+        )
+
+    def add_bank_flow(self, args, blockNumber, logIndex, name):
+        self.connection.execute(
+            'INSERT OR REPLACE INTO bank_flows VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (
+                blockNumber, logIndex, name, args['communityId'], args['owner'], args['creator'], str(args['amount']),
+                str(args['ownerAmount']), str(args['creatorAmount']), str(args['treasuryAmount']),
+            )
+        )
+
+    def on_MintForPost(self, args, blockNumber, logIndex):
+        self.add_bank_flow(args, blockNumber, logIndex, 'MintForPost')
+
+    def on_MintForComment(self, args, blockNumber, logIndex):
+        self.add_bank_flow(args, blockNumber, logIndex, 'MintForComment')
+
+    def on_BurnForPost(self, args, blockNumber, logIndex):
+        self.add_bank_flow(args, blockNumber, logIndex, 'BurnForPost')
+
+    def on_BurnForComment(self, args, blockNumber, logIndex):
+        self.add_bank_flow(args, blockNumber, logIndex, 'BurnForComment')
+
+    def on_Transfer(self, args, blockNumber, logIndex):
+        if 'tokenId' not in args:
+            # the Transfer of an ERC20 token has the same topic
+            return
+        self.connection.execute(
+            'INSERT OR REPLACE INTO nft_transfers VALUES (?, ?, ?, ?, ?)',
+            (blockNumber, logIndex, args['tokenId'], args['from'], args['to'])
+        )
+
+    def add_voter(self, args, blockNumber, logIndex, name):
+        self.connection.execute(
+            'INSERT OR REPLACE INTO voters VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (
+                blockNumber, logIndex, name, args['communityId'], args['index'], args['sender'], args['isYes'],
+                str(args['weight']),
+            )
+        )
+
+    def on_PutVote(self, args, blockNumber, logIndex):
+        self.add_voter(args, blockNumber, logIndex, 'PutVote')
+
+    def on_PutPrivacyAccessPriceVote(self, args, blockNumber, logIndex):
+        self.add_voter(args, blockNumber, logIndex, 'PutPrivacyAccessPriceVote')
+
+    def on_PutTokenTransferVote(self, args, blockNumber, logIndex):
+        self.add_voter(args, blockNumber, logIndex, 'PutTokenTransferVote')
+
+    def on_PutNftTransferVote(self, args, blockNumber, logIndex):
+        self.add_voter(args, blockNumber, logIndex, 'PutNftTransferVote')
+
+    # *** --- Rollback --- ***
+
+    def rollback(self, blockNumber):
+        """Removes everything which was indexed after the block and restores the changed state."""
+        execute = self.connection.execute
+        changedPosts = [row['post_id'] for row in execute(
+            'SELECT DISTINCT post_id FROM events WHERE block_number > ? AND name = ?',
+            (blockNumber, 'ChangePostVisible')
+        )]
+        changedComments = [(row['post_id'], row['comment_id']) for row in execute(
+            'SELECT DISTINCT post_id, comment_id FROM events WHERE block_number > ? AND name = ?',
+            (blockNumber, 'ChangeVisibleComment')
+        )]
+
+        execute('DELETE FROM events WHERE block_number > ?', (blockNumber,))
+        execute('DELETE FROM communities WHERE block_number > ?', (blockNumber,))
+        execute('DELETE FROM member_events WHERE block_number > ?', (blockNumber,))
+        execute('DELETE FROM posts WHERE block_number > ?', (blockNumber,))
+        execute('UPDATE posts SET burned_block = NULL WHERE burned_block > ?', (blockNumber,))
+        execute('DELETE FROM comments WHERE block_number > ?', (blockNumber,))
+        execute('UPDATE comments SET burned_block = NULL WHERE burned_block > ?', (blockNumber,))
+        execute('DELETE FROM bank_flows WHERE block_number > ?', (blockNumber,))
+        execute('DELETE FROM nft_transfers WHERE block_number > ?', (blockNumber,))
+        execute('DELETE FROM voters WHERE block_number > ?', (blockNumber,))
+        execute('DELETE FROM blocks WHERE number > ?', (blockNumber,))
+
+        for postId in changedPosts:
+            execute('UPDATE posts SET is_view = ? WHERE id = ?', (self.last_visible(postId, None), postId))
+        for postId, commentId in changedComments:
+            execute(
+                'UPDATE comments SET is_view = ? WHERE post_id = ? AND id = ?',
+                (self.last_visible(postId, commentId), postId, commentId)
+            )
+        self.set_checkpoint(blockNumber)
+
+    def last_visible(self, postId, commentId):
+        if commentId is None:
+            row = self.connection.execute(
+                'SELECT args FROM events WHERE name = ? AND post_id = ?'
+                ' ORDER BY block_number DESC, log_index DESC LIMIT 1',
+                ('ChangePostVisible', postId)
+            ).fetchone()
+        else:
+            row = self.connection.execute(
+                'SELECT args FROM events WHERE name = ? AND post_id = ? AND comment_id = ?'
+                ' ORDER BY block_number DESC, log_index DESC LIMIT 1',
+                ('ChangeVisibleComment', postId, commentId)
+            ).fetchone()
+        return json.loads(row['args'])['isVisible'] if row else True
+
+    # *** --- Queries --- ***
+
+    def read_post(self, postId):
+        """Returns the post in the same form as PageCommunity.readPost, None for an unknown post."""
+        row = self.connection.execute('SELECT * FROM posts WHERE id = ?', (postId,)).fetchone()
+        if row is None:
+            return None
+        if row['burned_block'] is not None:
+            # only the fields which are erased by burnPost
+            return {
+                'ipfsHash': '', 'creator': ZERO_ADDRESS, 'owner': ZERO_ADDRESS, 'upCount': 0, 'downCount': 0,
+                'commentCount': 0, 'isView': False,
+            }
+        comments = self.connection.execute(
+            'SELECT creator, is_up, is_down FROM comments WHERE post_id = ? ORDER BY id', (postId,)
+        ).fetchall()
+        upDownUsers = [comment['creator'] for comment in comments if comment['is_up'] or comment['is_down']]
+        return {
+            'ipfsHash': self.content_hash(row),
+            'creator': row['creator'],
+            'owner': row['owner'],
+            'upCount': sum(comment['is_up'] for comment in comments),
+            'downCount': sum(comment['is_down'] for comment in comments),
+            'price': int(row['price']),
+            'commentCount': len(comments),
+            'upDownUsers': list(dict.fromkeys(upDownUsers)),
+            'isView': bool(row['is_view']),
+        }
+
+    def read_comment(self, postId, commentId):
+        """Returns the comment in the same form as PageCommunity.readComment, None for an unknown comment."""
+        row = self.connection.execute(
+            'SELECT * FROM comments WHERE post_id = ? AND id = ?', (postId, commentId)
+        ).fetchone()
+        if row is None:
+            return None
+        if row['burned_block'] is not None:
+            return {
+                'ipfsHash': '', 'creator': ZERO_ADDRESS, 'owner': ZERO_ADDRESS, 'price': 0,
+                'isUp': False, 'isDown': False, 'isView': False,
+            }
+        return {
+            'ipfsHash': self.content_hash(row),
+            'creator': row['creator'],
+            'owner': row['owner'],
+            'price': int(row['price']),
+            'isUp': bool(row['is_up']),
+            'isDown': bool(row['is_down']),
+            'isView': bool(row['is_view']),
+        }
+
+    @staticmethod
+    def content_hash(row):
+        if row['digest'] and row['digest'] != ZERO_DIGEST:
+            return to_cid_v0(row['digest'])
+        return row['ipfs_hash']
+
+    def read_posts(self, communityId, offset=0, limit=100):
+        return [dict(row) for row in self.connection.execute(
+            'SELECT * FROM posts WHERE community_id = ? AND burned_block IS NULL ORDER BY id LIMIT ? OFFSET ?',
+            (communityId, limit, offset)
+        )]
+
+    def read_comments(self, postId, offset=0, limit=100):
+        return [dict(row) for row in self.connection.execute(
+            'SELECT * FROM comments WHERE post_id = ? AND burned_block IS NULL ORDER BY id LIMIT ? OFFSET ?',
+            (postId, limit, offset)
+        )]
+
+    def read_members(self, communityId):
+        """Returns the users whose last JoinUser or QuitUser event in the community is JoinUser, by that event."""
+        return [row['user'] for row in self.connection.execute(
+            'SELECT user FROM member_events AS event WHERE community_id = ? AND is_member = 1 AND NOT EXISTS ('
+            ' SELECT 1 FROM member_events AS later WHERE later.community_id = event.community_id'
+            ' AND later.user = event.user'
+            ' AND (later.block_number, later.log_index) > (event.block_number, event.log_index)'
+            ') ORDER BY block_number, log_index',
+            (communityId,)
+        )]
+
+    def read_bank_flows(self, communityId):
+        return [dict(row) for row in self.connection.execute(
+            'SELECT * FROM bank_flows WHERE community_id = ? ORDER BY block_number, log_index', (communityId,)
+        )]
+
+    def read_tokens_of_owner(self, user, offset=0, limit=100):
+        """Returns the IDs of PageNFT tokens owned by the user, the lean PageNFT has no on-chain enumeration."""
+        return [row['token_id'] for row in self.connection.execute(
+            'SELECT token_id FROM nft_transfers AS transfer WHERE receiver = ? AND NOT EXISTS ('
+            ' SELECT 1 FROM nft_transfers AS later WHERE later.token_id = transfer.token_id'
+            ' AND (later.block_number, later.log_index) > (transfer.block_number, transfer.log_index)'
+            ') ORDER BY token_id LIMIT ? OFFSET ?',
+            (user, limit, offset)
+        )]
+
+    def read_owner_of(self, tokenId):
+        """Returns the owner of the token, ZERO_ADDRESS for a burned token and None for an unknown one."""
+        row = self.connection.execute(
+            'SELECT receiver FROM nft_transfers WHERE token_id = ? ORDER BY block_number DESC, log_index DESC LIMIT 1',
+            (tokenId,)
+        ).fetchone()
+        return row['receiver'] if row else None
+
+    def read_voters(self, address, name, index, communityId=None, offset=0, limit=100):
+        """
+        Returns the voters of the proposal in the order of voting, the voting contracts keep only their number.
+        address is the voting contract and name is its Put*Vote event. The proposals of PageVoteForSuperModerator
+        are numbered for all communities, so communityId is None there to read the voters of every community.
+        """
+        query = (
+            'SELECT voters.* FROM voters JOIN events USING (block_number, log_index)'
+            ' WHERE events.address = ? AND voters.name = ? AND voters.vote_index = ?'
+        )
+        params = [address, name, index]
+        if communityId is not None:
+            query += ' AND voters.community_id = ?'
+            params.append(communityId)
+        query += ' ORDER BY block_number, log_index LIMIT ? OFFSET ?'
+        return [dict(row) for row in self.connection.execute(query, params + [limit, offset])]
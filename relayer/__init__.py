@@ -0,0 +1,2 @@
+from relayer.relayer import VoteRelayer, vote_typed_data, sign_vote
+from relayer.permit import permit_typed_data, sign_permit
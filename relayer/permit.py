@@ -0,0 +1,42 @@
+from eth_account import Account
+from eth_utils import encode_hex
+
+from relayer.typed_data import EIP712_DOMAIN, encode_typed_data
+
+PERMIT_TYPES = {
+    'EIP712Domain': EIP712_DOMAIN,
+    'Permit': [
+        {'name': 'owner', 'type': 'address'},
+        {'name': 'spender', 'type': 'address'},
+        {'name': 'value', 'type': 'uint256'},
+        {'name': 'nonce', 'type': 'uint256'},
+        {'name': 'deadline', 'type': 'uint256'},
+    ],
+}
+
+
+def permit_typed_data(chainId, token, owner, spender, value, nonce, deadline):
+    """Returns the EIP-2612 message of PageToken for the allowance of spender."""
+    return {
+        'types': PERMIT_TYPES,
+        'primaryType': 'Permit',
+        'domain': {
+            'name': 'Crypto.Page',
+            'version': '1',
+            'chainId': chainId,
+            'verifyingContract': str(token),
+        },
+        'message': {
+            'owner': str(owner), 'spender': str(spender), 'value': value, 'nonce': nonce, 'deadline': deadline,
+        },
+    }
+
+
+def sign_permit(privateKey, chainId, token, owner, spender, value, nonce, deadline):
+    """
+    Signs the permit with the private key of the owner.
+    Returns (value, deadline, v, r, s), the Permit argument of PageSafeDeal.makeDealWithPermit.
+    """
+    message = encode_typed_data(full_message=permit_typed_data(chainId, token, owner, spender, value, nonce, deadline))
+    signed = Account.sign_message(message, privateKey)
+    return (value, deadline, signed.v, encode_hex(signed.r.to_bytes(32, 'big')), encode_hex(signed.s.to_bytes(32, 'big')))
@@ -0,0 +1,127 @@
+from eth_account import Account
+from eth_utils import encode_hex
+
+from relayer.typed_data import EIP712_DOMAIN, encode_typed_data
+
+VOTE_TYPES = {
+    'EIP712Domain': EIP712_DOMAIN,
+    'Vote': [
+        {'name': 'kind', 'type': 'uint256'},
+        {'name': 'communityId', 'type': 'uint256'},
+        {'name': 'index', 'type': 'uint256'},
+        {'name': 'isYes', 'type': 'bool'},
+        {'name': 'deadline', 'type': 'uint256'},
+    ],
+}
+
+# a part of the block gas limit for one batch, the rest is left for other transactions
+BLOCK_GAS_SHARE = 0.5
+# the first guess of gas per vote, the real batch is checked with eth_estimateGas
+GAS_PER_VOTE = 60000
+BASE_GAS = 50000
+
+
+def vote_typed_data(name, chainId, verifyingContract, communityId, index, isYes, deadline, kind=0):
+    """
+    Returns the EIP-712 message for the vote.
+    name is the voting contract ('PageVoteForCommon' or 'PageVoteForEarn'),
+    deadline is the last timestamp when the vote can be put,
+    kind is 0 for PageVoteForCommon and one of the *_VOTE constants for PageVoteForEarn.
+    """
+    return {
+        'types': VOTE_TYPES,
+        'primaryType': 'Vote',
+        'domain': {
+            'name': name,
+            'version': '1',
+            'chainId': chainId,
+            'verifyingContract': str(verifyingContract),
+        },
+        'message': {'kind': kind, 'communityId': communityId, 'index': index, 'isYes': isYes, 'deadline': deadline},
+    }
+
+
+def sign_vote(privateKey, name, chainId, verifyingContract, communityId, index, isYes, deadline, kind=0):
+    """Signs the vote with the private key of the voter, the result is sent to the relayer."""
+    message = encode_typed_data(full_message=vote_typed_data(
+        name, chainId, verifyingContract, communityId, index, isYes, deadline, kind
+    ))
+    return encode_hex(Account.sign_message(message, privateKey).signature)
+
+
+class VoteRelayer:
+    """
+    Collects the signed votes for one proposal and sends them with putVotesBySig.
+    The votes are split into batches which fit into a part of the block gas limit.
+
+    contract is a brownie Contract of PageVoteForCommon or PageVoteForEarn,
+    kind is None for PageVoteForCommon.
+    """
+
+    def __init__(self, web3, contract, name, communityId, index, kind=None, chainId=None, gasShare=BLOCK_GAS_SHARE):
+        self.web3 = web3
+        self.chainId = web3.eth.chain_id if chainId is None else chainId
+        self.contract = contract
+        self.name = name
+        self.communityId = communityId
+        self.index = index
+        self.kind = kind
+        self.gasShare = gasShare
+        self.votes = {}
+
+    def add(self, isYes, deadline, signature):
+        """
+        Checks the signature and keeps the last vote of every voter.
+        Returns the voter address.
+        """
+        message = encode_typed_data(full_message=vote_typed_data(
+            self.name, self.chainId, self.contract.address, self.communityId, self.index, isYes, deadline,
+            self.kind or 0,
+        ))
+        voter = Account.recover_message(message, signature=signature)
+        self.votes[voter] = (isYes, deadline, signature)
+        return voter
+
+    def batches(self, maxGas=None):
+        """
+        Splits the collected votes into the lists of (isYes, deadline, signature) by the first guess of gas.
+        The votes which have expired by the latest block are dropped, the contract would skip them.
+        """
+        latest = self.web3.eth.get_block('latest')
+        if maxGas is None:
+            maxGas = int(latest['gasLimit'] * self.gasShare)
+        size = max(1, (maxGas - BASE_GAS) // GAS_PER_VOTE)
+        votes = [vote for vote in self.votes.values() if vote[1] >= latest['timestamp']]
+        return [votes[i:i + size] for i in range(0, len(votes), size)]
+
+    def submit(self, sender, maxGas=None):
+        """
+        Sends all collected votes and returns the transactions.
+        A batch which needs more gas than maxGas is split in half again.
+        """
+        if maxGas is None:
+            maxGas = int(self.web3.eth.get_block('latest')['gasLimit'] * self.gasShare)
+        pending = self.batches(maxGas)
+        transactions = []
+        while pending:
+            batch = pending.pop(0)
+            args = self.arguments(batch)
+            if len(batch) > 1 and self.contract.putVotesBySig.estimate_gas(*args, {'from': sender}) > maxGas:
+                half = len(batch) // 2
+                pending[:0] = [batch[:half], batch[half:]]
+                continue
+            transactions.append(self.contract.putVotesBySig(*args, {'from': sender}))
+        self.votes = {}
+        return transactions
+
+    def arguments(self, batch):
+        args = [
+            self.communityId,
+            self.index,
+            [isYes for isYes, deadline, signature in batch],
+            [deadline for isYes, deadline, signature in batch],
+            [signature for isYes, deadline, signature in batch],
+        ]
+        if self.kind is not None:
+            args.insert(0, self.kind)
+        return args
@@ -0,0 +1,15 @@
+try:
+    from eth_account.messages import encode_typed_data
+except ImportError:  # eth-account < 0.10
+    from eth_account.messages import encode_structured_data
+
+    def encode_typed_data(full_message):
+        return encode_structured_data(primitive=full_message)
+
+# the EIP-712 domain of the voting contracts and of PageToken
+EIP712_DOMAIN = [
+    {'name': 'name', 'type': 'string'},
+    {'name': 'version', 'type': 'string'},
+    {'name': 'chainId', 'type': 'uint256'},
+    {'name': 'verifyingContract', 'type': 'address'},
+]
@@ -0,0 +1,43 @@
+import sys
+from brownie import accounts, network, project
+from deploy import config
+from deploy.orchestrator import Orchestrator
+from deploy.system import page_system
+
+
+def main():
+    # on the development chain the accounts of ganache and a mock pool are used, without the prompt
+    is_local = network.show_active() == 'development'
+    if is_local:
+        named = {'deployer': accounts[0], 'admin': accounts[1], 'treasury': accounts[9]}
+        pool = None
+    else:
+        named = {'deployer': accounts.add(config.deployer_private_key), 'admin': config.get_admin(), 'treasury': config.treasury}
+        pool = config.page_token_pool
+    # PAGE_PROXY=uups deploys PageUUPSProxy, PAGE_NFT=lean deploys PageNFTLean
+    proxy = config.get_env('PAGE_PROXY', 'page')
+    nft = 'PageNFTLean' if config.get_env('PAGE_NFT', 'enumerable') == 'lean' else 'PageNFT'
+    statePath = config.get_env('PAGE_DEPLOY_STATE', 'deploy/state/{}.json'.format(network.show_active()))
+
+    print("deployer:", named['deployer'])
+    print("admin:", named['admin'])
+    print("treasury:", named['treasury'])
+    print("proxy:", proxy)
+    print("nft:", nft)
+    print("state:", statePath)
+
+    if not is_local:
+        sys.stdout.write("Proceed? [y/n]: ")
+        if not config.prompt_bool():
+            print("Aborting")
+            return
+
+    steps = page_system(proxy, nft, pool, config.get_rate_token_url(), config.get_nft_url())
+    orchestrator = Orchestrator(
+        steps, named, project.get_loaded_projects()[0], statePath, publishSource=not is_local
+    )
+    orchestrator.run()
+    orchestrator.register(config.get_registry())
+    print("deployed:", orchestrator.report())
+    for name in ('pageToken', 'pageBank', 'pageCommunity', 'pageLens'):
+        print(name, orchestrator.address(name))
@@ -0,0 +1,24 @@
+from brownie import web3
+from deploy import config
+from indexer import Indexer, Store
+
+
+def main():
+    community = config.get_proxy_community()
+    bank = config.get_proxy_bank()
+    nft = config.get_proxy_nft()
+    store = Store(config.get_env('INDEXER_DB', 'indexer.sqlite'))
+
+    indexer = Indexer(
+        web3,
+        store,
+        [(community.address, community.abi), (bank.address, bank.abi), (nft.address, nft.abi)],
+        startBlock=int(config.get_env('INDEXER_START_BLOCK', '0')),
+        batchSize=int(config.get_env('INDEXER_BATCH_SIZE', '2000')),
+        reorgDepth=int(config.get_env('INDEXER_REORG_DEPTH', '12')),
+    )
+    print("community:", community)
+    print("bank:", bank)
+    print("nft:", nft)
+    print("indexed up to block:", indexer.sync())
+    store.close()
@@ -1,150 +1,401 @@
+import os
+import time
+
 import pytest
-from brownie import Wei, ZERO_ADDRESS
+from brownie import Contract, Wei, ZERO_ADDRESS, chain, network, project
 
 FTM_TOKEN = '0x4e15361fd6b4bb609fa63c81a2be19d873717870';
 FTM_ETH_POOL = '0x3b685307c8611afb2a9e83ebc8743dc20480716e' #FTM/ETH
+WETH_TOKEN = '0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2'
+FTM_ETH_TICK = -85325 # 0.000197 ETH for FTM
+TIMING_REPORT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'timing_report.md')
+
+
+class SuiteTimer:
+    """
+    Measures the wall-clock time of the session with SUITE_TIMING=1: the startup (from loading this conftest
+    to the first test, the chain launch and the fork state included) and the setup, call and teardown of every test.
+    PageSystem adds the time of its deployments with the snapshots and of the reverts to them.
+    The report is written to tests/timing_report.md, so the same run on two commits gives the before/after numbers.
+    """
+
+    def __init__(self):
+        self.isEnabled = os.getenv('SUITE_TIMING') == '1'
+        self.loaded = time.perf_counter()
+        self.startup = None
+        self.tests = {}
+        self.fixtures = {}
+
+    def start_test(self):
+        if self.startup is None:
+            self.startup = time.perf_counter() - self.loaded
+
+    def add_fixture_time(self, name, seconds):
+        count, total = self.fixtures.get(name, (0, 0))
+        self.fixtures[name] = (count + 1, total + seconds)
+
+    def add_report(self, report):
+        # keyed by the test and the phase, so the hooks imported by benchmarks/conftest.py do not count twice
+        self.tests.setdefault(report.nodeid, {})[report.when] = report.duration
+
+    def to_markdown(self):
+        total = time.perf_counter() - self.loaded
+        lines = [
+            'Network: {}'.format(network.show_active()),
+            '',
+            'Startup: {:.2f} s, tests: {:.2f} s, total: {:.2f} s'.format(
+                self.startup or 0, sum(sum(phases.values()) for phases in self.tests.values()), total
+            ),
+            '',
+        ]
+        for name, (count, seconds) in self.fixtures.items():
+            lines.append('{}: {} times, {:.2f} s'.format(name, count, seconds))
+        lines += [
+            '',
+            '| Test | Setup, s | Call, s | Teardown, s |',
+            '|---|---:|---:|---:|',
+        ]
+        for nodeid, phases in self.tests.items():
+            lines.append('| {} | {:.3f} | {:.3f} | {:.3f} |'.format(
+                nodeid, phases.get('setup', 0), phases.get('call', 0), phases.get('teardown', 0)
+            ))
+        return '\n'.join(lines) + '\n'
+
+    def save_report(self, path=TIMING_REPORT_PATH):
+        with open(path, 'w') as file:
+            file.write('#### Test timing\n\n')
+            file.write(self.to_markdown())
+
+
+_timer = SuiteTimer()
+
+
+def pytest_runtest_logstart(nodeid, location):
+    _timer.start_test()
+
+
+def pytest_runtest_logreport(report):
+    _timer.add_report(report)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if _timer.isEnabled and _timer.tests:
+        _timer.save_report()
+
+
+def is_mock_pool():
+    # PAGE_POOL=mock|fork overrides the choice by the active network
+    mode = os.getenv('PAGE_POOL')
+    if mode:
+        return mode == 'mock'
+    return 'fork' not in network.show_active()
+
+
+# Contract fixtures with the fixtures they need to be deployed before them.
+# The order of the voting contracts is the order in PageCommunity.voterContracts.
+CONTRACT_DEPENDENCIES = {
+    'pageUserRateToken': [],
+    'pageCalcUserRate': ['pageUserRateToken'],
+    'pageBank': ['pageCalcUserRate'],
+    'pageToken': ['pageBank'],
+    'uniswapPool': [],
+    'pageOracle': ['pageToken', 'pageBank', 'uniswapPool'],
+    'pageSafeDeal': ['pageCalcUserRate', 'pageToken', 'pageOracle'],
+    'pageNFT': ['pageBank'],
+    'pageNFTLean': ['pageBank'],
+    'pageCommunity': ['pageNFT', 'pageUserRateToken', 'pageBank', 'pageToken', 'pageOracle'],
+    'pageLens': ['pageCommunity'],
+    'pageVoteForCommon': ['pageToken', 'pageCommunity', 'pageBank', 'pageOracle'],
+    'pageVoteForEarn': ['pageVoteForCommon', 'pageToken', 'pageCommunity', 'pageBank', 'pageOracle'],
+    'pageVoteForSuperModerator': ['pageVoteForCommon', 'pageVoteForEarn', 'pageToken', 'pageCommunity', 'pageBank', 'pageOracle'],
+}
+
+
+class PageSystem:
+    """
+    Deploys each contract once per session, together with its dependencies, on the first request.
+    The chain snapshot is taken after the deployment and every test reverts to it.
+
+    proxy is None for the contracts without proxies, 'page' for PageProxy and 'uups' for PageUUPSProxy
+    (used by the proxy gas benchmark, the session system is deployed without proxies).
+    """
+
+    def __init__(self, accounts, proxy=None):
+        self.containers = project.get_loaded_projects()[0]
+        self.deployer = accounts[0]
+        self.admin = accounts[1]
+        self.treasury = accounts[9]
+        self.proxy = proxy
+        self.instances = {}
+        self.snapshotNames = set()
+
+    def get(self, name):
+        if name not in self.instances:
+            for dependency in CONTRACT_DEPENDENCIES[name]:
+                self.get(dependency)
+            self.instances[name] = getattr(self, 'deploy_' + name)()
+        return self.instances[name]
+
+    def snapshot(self, names):
+        started = time.perf_counter()
+        for name in names:
+            self.get(name)
+        chain.snapshot()
+        self.snapshotNames = set(self.instances)
+        _timer.add_fixture_time('Deployment and snapshot', time.perf_counter() - started)
+
+    def revert(self):
+        started = time.perf_counter()
+        chain.revert()
+        # contracts deployed after the snapshot are gone with the reverted blocks
+        for name in set(self.instances) - self.snapshotNames:
+            del self.instances[name]
+        _timer.add_fixture_time('Revert to the snapshot', time.perf_counter() - started)
+
+    def deploy(self, container):
+        implementation = container.deploy({'from': self.deployer})
+        if self.proxy is None:
+            return implementation
+        if self.proxy == 'uups':
+            proxy = self.containers.PageUUPSProxy.deploy(implementation, b'', {'from': self.deployer})
+        else:
+            proxy = self.containers.PageProxy.deploy(implementation, self.admin, {'from': self.deployer})
+        return Contract.from_abi(container._name, proxy.address, container.abi, owner=self.deployer)
+
+    def deploy_pageUserRateToken(self):
+        instanсe = self.deploy(self.containers.PageUserRateToken)
+        instanсe.initialize('https://')
+        return instanсe
+
+    def deploy_pageCalcUserRate(self):
+        pageUserRateToken = self.instances['pageUserRateToken']
+        instanсe = self.deploy(self.containers.PageCalcUserRate)
+        instanсe.initialize(self.admin, pageUserRateToken)
+        pageUserRateToken.setCalcRateContract(instanсe)
+        self.deployer.transfer(instanсe, Wei('10 ether'))
+
+        return instanсe
+
+    def deploy_pageBank(self):
+        pageCalcUserRate = self.instances['pageCalcUserRate']
+        instanсe = self.deploy(self.containers.PageBank)
+        instanсe.initialize(self.treasury, self.admin, pageCalcUserRate)
+        self.deployer.transfer(instanсe, Wei('10 ether'))
+
+        pageCalcUserRate.grantRole(pageCalcUserRate.BANK_ROLE(), instanсe, {'from': self.admin})
+
+        return instanсe
+
+    def deploy_pageToken(self):
+        pageBank = self.instances['pageBank']
+        instanсe = self.deploy(self.containers.PageToken)
+        instanсe.initialize(self.treasury, pageBank)
+        pageBank.setToken(instanсe, {'from': self.deployer})
+        return instanсe
+
+    def deploy_uniswapPool(self):
+        if not is_mock_pool():
+            return FTM_ETH_POOL
+        return self.containers.MockUniswapV3Pool.deploy(FTM_TOKEN, WETH_TOKEN, FTM_ETH_TICK, {'from': self.deployer})
+
+    def deploy_pageOracle(self):
+        instanсe = self.deploy(self.containers.PageOracle)
+        instanсe.initialize(FTM_TOKEN, self.instances['uniswapPool'])
+        self.instances['pageBank'].setOracle(instanсe, {'from': self.deployer})
+        return instanсe
+
+    def deploy_pageSafeDeal(self):
+        pageCalcUserRate = self.instances['pageCalcUserRate']
+        instanсe = self.deploy(self.containers.PageSafeDeal)
+        instanсe.initialize(self.admin, pageCalcUserRate, self.instances['pageOracle'])
+        instanсe.setToken(self.instances['pageToken'], {'from': self.deployer})
+        pageCalcUserRate.grantRole(pageCalcUserRate.DEAL_ROLE(), instanсe, {'from': self.admin})
+
+        return instanсe
+
+    def deploy_pageNFT(self):
+        instanсe = self.deploy(self.containers.PageNFT)
+        instanсe.initialize(self.instances['pageBank'], 'https://')
+        return instanсe
+
+    def deploy_pageNFTLean(self):
+        # the deployer mints and burns instead of the community
+        instanсe = self.deploy(self.containers.PageNFTLean)
+        instanсe.initialize(self.instances['pageBank'], 'https://')
+        instanсe.setCommunity(self.deployer, {'from': self.deployer})
+        return instanсe
+
+    def deploy_pageCommunity(self):
+        pageNFT = self.instances['pageNFT']
+        pageBank = self.instances['pageBank']
+        instanсe = self.deploy(self.containers.PageCommunity)
+        instanсe.initialize(pageNFT, pageBank, self.admin)
+        assert self.deployer == pageNFT.owner()
+
+        pageNFT.setCommunity(instanсe, {'from': self.deployer})
+
+        self.deployer.transfer(instanсe, Wei('10 ether'))
+
+        pageBank.grantRole(pageBank.MINTER_ROLE(), instanсe, {'from': self.admin})
+        pageBank.grantRole(pageBank.BURNER_ROLE(), instanсe, {'from': self.admin})
+        pageBank.setToken(self.instances['pageToken'], {'from': self.deployer})
+        pageBank.setOracle(self.instances['pageOracle'], {'from': self.deployer})
+
+        return instanсe
+
+    def deploy_pageLens(self):
+        pageCommunity = self.instances['pageCommunity']
+        instanсe = self.containers.PageLens.deploy(pageCommunity, {'from': self.deployer})
+        pageCommunity.setLens(instanсe, {'from': self.deployer})
+        return instanсe
+
+    def deploy_pageVoteForCommon(self):
+        pageBank = self.instances['pageBank']
+        instanсe = self.deploy(self.containers.PageVoteForCommon)
+        instanсe.initialize(self.deployer, self.instances['pageToken'], self.instances['pageCommunity'], pageBank)
+        self.deployer.transfer(instanсe, Wei('10 ether'))
+
+        pageBank.grantRole(pageBank.UPDATER_FEE_ROLE(), instanсe, {'from': self.admin})
+        pageBank.setOracle(self.instances['pageOracle'], {'from': self.deployer})
+
+        self.instances['pageCommunity'].addVoterContract(instanсe, {'from': self.deployer})
+
+        return instanсe
+
+    def deploy_pageVoteForEarn(self):
+        pageBank = self.instances['pageBank']
+        instanсe = self.deploy(self.containers.PageVoteForEarn)
+        instanсe.initialize(self.admin, self.instances['pageToken'], self.instances['pageCommunity'], pageBank)
+        self.deployer.transfer(instanсe, Wei('10 ether'))
+        pageBank.grantRole(pageBank.VOTE_FOR_EARN_ROLE(), instanсe, {'from': self.admin})
+        pageBank.setOracle(self.instances['pageOracle'], {'from': self.deployer})
+        self.instances['pageCommunity'].addVoterContract(instanсe, {'from': self.deployer})
+        return instanсe
+
+    def deploy_pageVoteForSuperModerator(self):
+        pageCommunity = self.instances['pageCommunity']
+        instanсe = self.deploy(self.containers.PageVoteForSuperModerator)
+        instanсe.initialize(self.admin, self.instances['pageToken'], pageCommunity, self.instances['pageBank'])
+        pageCommunity.addVoterContract(instanсe, {'from': self.deployer})
+        self.instances['pageBank'].setOracle(self.instances['pageOracle'], {'from': self.deployer})
+
+        assert self.instances['pageVoteForCommon'] == pageCommunity.voterContracts(0)
+        assert self.instances['pageVoteForEarn'] == pageCommunity.voterContracts(1)
+        assert instanсe == pageCommunity.voterContracts(2)
+
+        return instanсe
+
+
+@pytest.fixture(scope='session')
+def pageSystem(accounts):
+    return PageSystem(accounts)
+
+
+@pytest.fixture(scope='module', autouse=True)
+def module_snapshot(request, pageSystem):
+    # only the contracts requested by the tests of the module are deployed
+    names = set()
+    for item in request.session.items:
+        if item.module is request.module:
+            names.update(name for name in item.fixturenames if name in CONTRACT_DEPENDENCIES)
+    pageSystem.snapshot(sorted(names, key=list(CONTRACT_DEPENDENCIES).index))
+
 
 @pytest.fixture(scope='function', autouse=True)
-def shared_setup(fn_isolation):
-    pass
+def shared_setup(module_snapshot, pageSystem):
+    yield
+    pageSystem.revert()
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def deployer(accounts):
     return accounts[0]
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def admin(accounts):
     return accounts[1]
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def treasury(accounts):
     return accounts[9]
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def someUser(accounts):
     return accounts[8]
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def helpers():
     return Helpers
 
-@pytest.fixture(scope="module")
-def pageUserRateToken(PageUserRateToken, deployer):
-    instanсe = PageUserRateToken.deploy({'from': deployer})
-    instanсe.initialize('https://')
-    return instanсe
-
-
-@pytest.fixture(scope="module")
-def pageCalcUserRate(PageCalcUserRate, pageUserRateToken, deployer, admin):
-    instanсe = PageCalcUserRate.deploy({'from': deployer})
-    instanсe.initialize(admin, pageUserRateToken)
-    pageUserRateToken.setCalcRateContract(instanсe)
-    deployer.transfer(instanсe, Wei('10 ether'))
-
-    return instanсe
-
-
-@pytest.fixture(scope="module")
-def pageBank(PageBank, pageCalcUserRate, treasury, admin, deployer):
-    instanсe = PageBank.deploy({'from': deployer})
-    instanсe.initialize(treasury, admin, pageCalcUserRate)
-    deployer.transfer(instanсe, Wei('10 ether'))
-
-    pageCalcUserRate.grantRole(pageCalcUserRate.BANK_ROLE(), instanсe, {'from': admin})
 
-    return instanсe
+@pytest.fixture
+def pageUserRateToken(pageSystem):
+    return pageSystem.get('pageUserRateToken')
 
 
-@pytest.fixture(scope="module")
-def pageToken(PageToken, treasury, deployer, pageBank):
-    instanсe = PageToken.deploy({'from': deployer})
-    instanсe.initialize(treasury, pageBank)
-    pageBank.setToken(instanсe, {'from': deployer})
-    return instanсe
+@pytest.fixture
+def pageCalcUserRate(pageSystem):
+    return pageSystem.get('pageCalcUserRate')
 
 
-@pytest.fixture(scope="module")
-def pageOracle(PageOracle, deployer, pageToken, pageBank):
-    instanсe = PageOracle.deploy({'from': deployer})
-    instanсe.initialize(FTM_TOKEN, FTM_ETH_POOL)
-    pageBank.setOracle(instanсe, {'from': deployer})
-    return instanсe
+@pytest.fixture
+def pageBank(pageSystem):
+    return pageSystem.get('pageBank')
 
 
-@pytest.fixture(scope="module")
-def pageSafeDeal(PageSafeDeal, admin, deployer, pageCalcUserRate, pageToken, pageOracle):
-    instanсe = PageSafeDeal.deploy({'from': deployer})
-    instanсe.initialize(admin, pageCalcUserRate, pageOracle)
-    instanсe.setToken(pageToken, {'from': deployer})
-    pageCalcUserRate.grantRole(pageCalcUserRate.DEAL_ROLE(), instanсe, {'from': admin})
+@pytest.fixture
+def pageToken(pageSystem):
+    return pageSystem.get('pageToken')
 
-    return instanсe
 
+@pytest.fixture
+def uniswapPool(pageSystem):
+    return pageSystem.get('uniswapPool')
 
-@pytest.fixture(scope="module")
-def pageNFT(PageNFT, pageBank, treasury, deployer):
-    instanсe = PageNFT.deploy({'from': deployer})
-    instanсe.initialize(pageBank, 'https://')
-    return instanсe
 
+@pytest.fixture
+def pageOracle(pageSystem):
+    return pageSystem.get('pageOracle')
 
-@pytest.fixture(scope="module")
-def pageCommunity(PageCommunity, pageNFT, pageUserRateToken, pageBank, pageToken, pageOracle, deployer, admin):
-    instanсe = PageCommunity.deploy({'from': deployer})
-    instanсe.initialize(pageNFT, pageBank, admin)
-    assert deployer == pageNFT.owner()
 
-    pageNFT.setCommunity(instanсe, {'from': deployer})
+@pytest.fixture
+def pageSafeDeal(pageSystem):
+    return pageSystem.get('pageSafeDeal')
 
-    deployer.transfer(instanсe, Wei('10 ether'))
 
-    pageBank.grantRole(pageBank.MINTER_ROLE(), instanсe, {'from': admin})
-    pageBank.grantRole(pageBank.BURNER_ROLE(), instanсe, {'from': admin})
-    pageBank.setToken(pageToken, {'from': deployer})
-    pageBank.setOracle(pageOracle, {'from': deployer})
+@pytest.fixture
+def pageNFT(pageSystem):
+    return pageSystem.get('pageNFT')
 
-    return instanсe
 
+@pytest.fixture
+def pageNFTLean(pageSystem):
+    return pageSystem.get('pageNFTLean')
 
-@pytest.fixture(scope="module")
-def pageVoteForCommon(PageVoteForCommon, deployer, pageToken, pageCommunity, pageBank, pageOracle, admin):
-    instanсe = PageVoteForCommon.deploy({'from': deployer})
-    instanсe.initialize(deployer, pageToken, pageCommunity, pageBank)
-    deployer.transfer(instanсe, Wei('10 ether'))
 
-    pageBank.grantRole(pageBank.UPDATER_FEE_ROLE(), instanсe, {'from': admin})
-    pageBank.setOracle(pageOracle, {'from': deployer})
+@pytest.fixture
+def pageCommunity(pageSystem):
+    return pageSystem.get('pageCommunity')
 
-    pageCommunity.addVoterContract(instanсe, {'from': deployer})
 
-    return instanсe
+@pytest.fixture
+def pageLens(pageSystem):
+    return pageSystem.get('pageLens')
 
 
-@pytest.fixture(scope="module")
-def pageVoteForEarn(pageVoteForCommon, PageVoteForEarn, deployer, pageToken, pageCommunity, pageBank, pageOracle, admin):
-    instanсe = PageVoteForEarn.deploy({'from': deployer})
-    instanсe.initialize(admin, pageToken, pageCommunity, pageBank)
-    deployer.transfer(instanсe, Wei('10 ether'))
-    pageBank.grantRole(pageBank.VOTE_FOR_EARN_ROLE(), instanсe, {'from': admin})
-    pageBank.setOracle(pageOracle, {'from': deployer})
-    pageCommunity.addVoterContract(instanсe, {'from': deployer})
-    return instanсe
+@pytest.fixture
+def pageVoteForCommon(pageSystem):
+    return pageSystem.get('pageVoteForCommon')
 
 
-@pytest.fixture(scope="module")
-def pageVoteForSuperModerator(pageVoteForCommon, pageVoteForEarn, PageVoteForSuperModerator, deployer, pageToken, pageCommunity, pageBank, pageOracle, admin):
-    instanсe = PageVoteForSuperModerator.deploy({'from': deployer})
-    instanсe.initialize(admin, pageToken, pageCommunity, pageBank)
-    pageCommunity.addVoterContract(instanсe, {'from': deployer})
-    pageBank.setOracle(pageOracle, {'from': deployer})
+@pytest.fixture
+def pageVoteForEarn(pageSystem):
+    return pageSystem.get('pageVoteForEarn')
 
-    assert pageVoteForCommon == pageCommunity.voterContracts(0)
-    assert pageVoteForEarn == pageCommunity.voterContracts(1)
-    assert instanсe == pageCommunity.voterContracts(2)
 
-    return instanсe
+@pytest.fixture
+def pageVoteForSuperModerator(pageSystem):
+    return pageSystem.get('pageVoteForSuperModerator')
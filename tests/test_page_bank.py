@@ -14,8 +14,7 @@ def test_version(pageBank):
     assert VERSION == pageBank.version()
 
 
-def test_define_comment_fee_for_new_community(pageBank, pageCommunity):
-    pageBank.defineCommentFeeForNewCommunity(1, {'from': pageCommunity})
+def test_default_comment_fee_for_new_community(pageBank, pageCommunity):
     readCommentFee = pageBank.readCommentFee(1)
     assert readCommentFee[0] == 4500
     assert readCommentFee[1] == 4500
@@ -23,8 +22,7 @@ def test_define_comment_fee_for_new_community(pageBank, pageCommunity):
     assert readCommentFee[3] == 9000
 
 
-def test_define_post_fee_for_new_community(pageBank, pageCommunity):
-    pageBank.definePostFeeForNewCommunity(1, {'from': pageCommunity})
+def test_default_post_fee_for_new_community(pageBank, pageCommunity):
     readPostFee = pageBank.readPostFee(1)
     assert readPostFee[0] == 4500
     assert readPostFee[1] == 4500
@@ -51,8 +49,6 @@ def test_update_post_fee_for_new_community(pageBank, pageVoteForCommon):
 
 
 def test_mint_burn_token_for_new_post(pageBank, pageCommunity, pageToken, pageOracle, admin, someUser):
-    pageBank.definePostFeeForNewCommunity(1, {'from': pageCommunity})
-    pageBank.defineCommentFeeForNewCommunity(1, {'from': pageCommunity})
     price = pageOracle.getFromPageToWethPrice()
     assert price > 0
     network.gas_price("65 gwei")
@@ -88,8 +84,6 @@ def test_mint_burn_token_for_new_post(pageBank, pageCommunity, pageToken, pageOr
 
 
 def test_mint_burn_token_for_new_comment(pageBank, pageCommunity, pageToken, pageOracle, admin, someUser):
-    pageBank.definePostFeeForNewCommunity(1, {'from': pageCommunity})
-    pageBank.defineCommentFeeForNewCommunity(1, {'from': pageCommunity})
     price = pageOracle.getFromPageToWethPrice()
     assert price > 0
     network.gas_price("65 gwei")
@@ -124,6 +118,65 @@ def test_mint_burn_token_for_new_comment(pageBank, pageCommunity, pageToken, pag
     assert beforePageBankBalance > afterPageBankBalance
 
 
+def test_accrual_mode(pageBank, pageCommunity, pageToken, deployer, treasury, admin, someUser):
+    network.gas_price("65 gwei")
+    gas = 200000
+
+    def bankInvariant():
+        # tokens of the bank and not yet minted tokens cover all user balances
+        return pageToken.balanceOf(pageBank) + pageBank.pendingMint() == pageBank.balanceOf(admin) + pageBank.balanceOf(someUser)
+
+    pageBank.mintTokenForNewPost(1, admin, someUser, gas, {'from': pageCommunity})
+    pageBank.mintTokenForNewComment(1, admin, someUser, gas, {'from': pageCommunity})
+    postGas = pageBank.mintTokenForNewPost(1, admin, someUser, gas, {'from': pageCommunity}).gas_used
+    commentGas = pageBank.mintTokenForNewComment(1, admin, someUser, gas, {'from': pageCommunity}).gas_used
+
+    with reverts():
+        pageBank.setAccrualMode(True, {'from': someUser})
+    pageBank.setAccrualMode(True, {'from': deployer})
+    assert pageBank.isAccrualMode() == True
+
+    supplyBefore = pageToken.totalSupply()
+    treasuryBefore = pageToken.balanceOf(treasury)
+    accrualPostGas = pageBank.mintTokenForNewPost(1, admin, someUser, gas, {'from': pageCommunity}).gas_used
+    accrualCommentGas = pageBank.mintTokenForNewComment(1, admin, someUser, gas, {'from': pageCommunity}).gas_used
+    print('gas saved per post', postGas - accrualPostGas, 'per comment', commentGas - accrualCommentGas)
+    assert accrualPostGas < postGas
+    assert accrualCommentGas < commentGas
+
+    assert pageToken.totalSupply() == supplyBefore
+    assert pageBank.pendingMint() > 0
+    assert pageBank.treasuryAccrued() > 0
+    assert bankInvariant()
+
+    pageBank.burnTokenForPost(1, admin, someUser, 20, {'from': pageCommunity})
+    assert bankInvariant()
+
+    virtualSupply = pageToken.totalSupply() + pageBank.pendingMint() + pageBank.treasuryAccrued()
+    treasuryAccrued = pageBank.treasuryAccrued()
+
+    someUserBalance = pageBank.balanceOf(someUser)
+    pageBank.withdraw(someUserBalance, {'from': someUser})
+    assert pageBank.pendingMint() == 0
+    assert pageToken.balanceOf(someUser) == someUserBalance
+    assert bankInvariant()
+
+    pageBank.settleTreasury({'from': someUser})
+    assert pageBank.treasuryAccrued() == 0
+    assert pageToken.balanceOf(treasury) == treasuryBefore + treasuryAccrued
+    assert pageToken.totalSupply() == virtualSupply
+    with reverts():
+        pageBank.settleTreasury({'from': someUser})
+
+    pageBank.mintTokenForNewPost(1, admin, someUser, gas, {'from': pageCommunity})
+    virtualSupply = pageToken.totalSupply() + pageBank.pendingMint() + pageBank.treasuryAccrued()
+    pageBank.setAccrualMode(False, {'from': deployer})
+    assert pageBank.pendingMint() == 0
+    assert pageBank.treasuryAccrued() == 0
+    assert pageToken.totalSupply() == virtualSupply
+    assert bankInvariant()
+
+
 def test_add_balance_withdraw(pageBank, pageToken, treasury, someUser):
     amount = 1000
 
@@ -157,6 +210,35 @@ def test_set_comment_default_fee(pageBank, deployer):
     assert defaultRemoveCommentOwnerFee == 99
 
 
+def test_inherit_default_fee(pageBank, pageCommunity, pageVoteForCommon, deployer):
+    pageCommunity.addCommunity('First users')
+    pageCommunity.addCommunity('Second users')
+    pageBank.updatePostFee(2, 2, 3, 4, 5, {'from': pageVoteForCommon})
+
+    # the first community follows the default fees, the second one keeps its voted fees
+    pageBank.setDefaultFee(0, 4000, {'from': deployer})
+    assert pageBank.readPostFee(1) == (4000, 4500, 0, 9000)
+    assert pageBank.readPostFee(2) == (2, 3, 4, 5)
+    assert pageBank.readCommentFee(2) == (4500, 4500, 0, 9000)
+
+    # zero fees set by voting are not replaced by the default fees
+    pageBank.updateCommentFee(2, 0, 0, 0, 0, {'from': pageVoteForCommon})
+    assert pageBank.readCommentFee(2) == (0, 0, 0, 0)
+
+    with reverts():
+        pageBank.updatePostFee(1, 2**32, 3, 4, 5, {'from': pageVoteForCommon})
+    with reverts():
+        pageBank.setDefaultFee(0, 2**32, {'from': deployer})
+
+    with reverts():
+        pageBank.syncFeeOverrides(1, 3, {'from': pageVoteForCommon})
+    # the communities created after the upgrade have no copied fees and keep inheriting the default fees
+    pageBank.syncFeeOverrides(1, 3, {'from': deployer})
+    assert pageBank.readPostFee(1) == (4000, 4500, 0, 9000)
+    assert pageBank.readPostFee(2) == (2, 3, 4, 5)
+    assert pageBank.readCommentFee(2) == (0, 0, 0, 0)
+
+
 def test_set_TreasuryFee(pageBank, deployer):
     oldTreasuryFee = pageBank.treasuryFee()
     newTreasuryFee = 999
@@ -164,3 +246,38 @@ def test_set_TreasuryFee(pageBank, deployer):
 
     pageBank.setTreasuryFee(newTreasuryFee, {'from': deployer} )
     assert newTreasuryFee == pageBank.treasuryFee()
+
+
+def test_pay_for_privacy_access_batch(pageBank, pageToken, pageVoteForEarn, treasury, someUser):
+    pageToken.transfer(someUser, 1000, {'from': treasury})
+    pageToken.approve(pageBank, 1000, {'from': someUser})
+    pageBank.addBalance(1000, {'from': someUser})
+    for communityId, price in [(1, 10), (2, 20), (5, 50)]:
+        pageBank.setPriceForPrivacyAccess(communityId, price, {'from': pageVoteForEarn})
+
+    with reverts():
+        pageBank.payForPrivacyAccessBatch([1, 2], [100], {'from': someUser})
+    with reverts():
+        pageBank.payForPrivacyAccessBatch([1, 3], [100, 100], {'from': someUser})
+
+    tx = pageBank.payForPrivacyAccessBatch([1, 2, 5], [100, 100, 105], {'from': someUser})
+    assert len(tx.events['PaidForPrivacyAccess']) == 3
+    assert pageBank.balanceOf(someUser) == 1000 - 100 - 100 - 100
+    assert pageBank.balanceOfCommunity(5) == 100
+
+    startTime = tx.timestamp
+    day = 86400
+    assert pageBank.privacyExpiries(someUser, [1, 2, 3, 5]) == [startTime + 10 * day, startTime + 5 * day, 0, startTime + 2 * day]
+    assert pageBank.isPrivacyAvailable(someUser, 2) == True
+    assert pageBank.isPrivacyAvailable(someUser, 3) == False
+
+    # a new payment prolongs the current access
+    pageBank.payForPrivacyAccess(20, 2, {'from': someUser})
+    assert pageBank.privacyExpiries(someUser, [1, 2]) == [startTime + 10 * day, startTime + 6 * day]
+
+    chain.sleep(20 * day)
+    chain.mine()
+    assert pageBank.isPrivacyAvailable(someUser, 1) == False
+
+    with reverts():
+        pageBank.payForPrivacyAccessBatch([1, 2], [1000, 1000], {'from': someUser})
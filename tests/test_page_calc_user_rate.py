@@ -54,6 +54,33 @@ def test_check_ten_posts(pageBank, pageCalcUserRate, pageUserRateToken, someUser
     assert afterBalance == 1
 
 
+def test_check_tiers_batch(pageBank, pageCalcUserRate, pageUserRateToken, someUser):
+    # a common activity does not call the rating token
+    tx = pageCalcUserRate.checkCommunityActivity(1, someUser, 1, {'from': pageBank})
+    calls = [step for step in tx.trace if step['op'] in ('CALL', 'STATICCALL')]
+    assert len(calls) == 0
+    assert pageCalcUserRate.calcPercent(someUser, 100) == 0
+
+    # 99 messages more reach the first and the second tiers, minted by one call
+    tx = pageCalcUserRate.checkCommunityActivities(1, someUser, 1, 99, {'from': pageBank})
+    assert pageCalcUserRate.getUserActivity(1, someUser) == (100,0,0,0)
+    assert len(tx.events['TransferBatch']) == 1
+    assert 'TransferSingle' not in tx.events
+    assert pageUserRateToken.balanceOf(someUser, 105) == 10
+    assert pageUserRateToken.balanceOf(someUser, 106) == 1
+    assert pageUserRateToken.balanceOf(someUser, 107) == 0
+
+    redeemed = pageCalcUserRate.getUserRedeemed(1, someUser)
+    assert redeemed[0] == (10, 1, 0)
+
+    weight = [pageCalcUserRate.interestAdjustment(i) for i in range(10)]
+    assert pageCalcUserRate.calcPercent(someUser, 100) == weight[0] * 10 + weight[1] * 1
+
+    pageCalcUserRate.checkCommunityActivities(1, someUser, 3, 100, {'from': pageBank})
+    assert pageUserRateToken.balanceOf(someUser, 103) == 1
+    assert pageCalcUserRate.calcPercent(someUser, 100) == weight[0] * 10 + weight[1] * 1 - weight[8] * 1
+
+
 def test_setInterestAdjustment(pageCalcUserRate, admin):
     interestAdjustment = pageCalcUserRate.interestAdjustment(1)
     assert interestAdjustment == 10
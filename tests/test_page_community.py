@@ -20,6 +20,42 @@ def test_add_read_community(pageCommunity):
     assert community[0] == communityName
 
 
+def test_read_community_ranges(pageCommunity, pageVoteForCommon, accounts, deployer):
+    communityName = 'First users'
+    pageCommunity.addCommunity(communityName)
+    network.gas_price("65 gwei")
+
+    for i in range(2, 7): pageCommunity.join(1, {'from': accounts[i]})
+    pageCommunity.writePost(1, 'dddd', accounts[2], {'from': accounts[2]})
+    pageCommunity.writePost(1, 'aaaa', accounts[2], {'from': accounts[2]})
+
+    pageCommunity.addModerator(1, accounts[2], {'from': pageVoteForCommon})
+    pageCommunity.addBannedUser(1, accounts[6], {'from': accounts[2]})
+
+    community = pageCommunity.readCommunity(1)
+    #('First users', '0x66aB6D9362d4F35596279692F0251Db635165871', ('0x...',), 2, 5, 1, True, False, False)
+    assert community[2] == (accounts[2],)
+    assert community[3] == 2
+    assert community[4] == 5
+    assert community[5] == 1
+
+    assert pageCommunity.readCommunityUsers(1, 0, 2) == (accounts[2], accounts[3])
+    assert pageCommunity.readCommunityUsers(1, 3, 10) == (accounts[5], accounts[6])
+    assert pageCommunity.readCommunityUsers(1, 5, 10) == ()
+    assert pageCommunity.readCommunityUsers(1, 0, 0) == ()
+    assert pageCommunity.readCommunityUsers(1, 4, 1) == (accounts[6],)
+    assert pageCommunity.readCommunityUsers(1, 100, 10) == ()
+    assert pageCommunity.readCommunityUsers(1, 2, 2 ** 256 - 1) == (accounts[4], accounts[5], accounts[6])
+
+    assert pageCommunity.readCommunityPostIds(1, 0, 10) == (0, 1)
+    assert pageCommunity.readCommunityPostIds(1, 1, 1) == (1,)
+
+    assert pageCommunity.readCommunityBannedUsers(1, 0, 10) == (accounts[6],)
+
+    with reverts():
+        pageCommunity.readCommunityUsers(2, 0, 10)
+
+
 def test_add_remove_moderator(pageCommunity, pageVoteForCommon, accounts, deployer):
     communityName = 'First users'
     pageCommunity.addCommunity(communityName)
@@ -76,6 +112,43 @@ def test_join_quit(pageCommunity, someUser):
     assert isCommunityActiveUser == False
 
 
+def test_member_status(pageCommunity, pageVoteForCommon, someUser, accounts):
+    pageCommunity.addCommunity('First users')
+    assert pageCommunity.readMemberStatus(1, someUser) == (False, False, False, 0)
+
+    tx = pageCommunity.join(1, {'from': someUser})
+    joinedAt = chain[tx.block_number].timestamp
+    pageCommunity.join(1, {'from': accounts[2]})
+    pageCommunity.addModerator(1, accounts[2], {'from': pageVoteForCommon})
+    assert pageCommunity.readMemberStatus(1, someUser) == (True, False, False, joinedAt)
+    assert pageCommunity.readMemberStatus(1, accounts[2])[2] == True
+    assert pageCommunity.isCommunityModerator(1, accounts[2]) == True
+
+    pageCommunity.addBannedUser(1, someUser, {'from': accounts[2]})
+    assert pageCommunity.readMemberStatus(1, someUser) == (True, True, False, joinedAt)
+    assert pageCommunity.isCommunityActiveUser(1, someUser) == False
+    assert pageCommunity.isBannedUser(1, someUser) == True
+
+    # all checks are resolved by one storage slot
+    tx = pageCommunity.isCommunityActiveUser.transact(1, someUser)
+    loadedSlots = {step['stack'][-1] for step in tx.trace if step['op'] == 'SLOAD'}
+    assert len(loadedSlots) == 1
+
+    pageCommunity.removeBannedUser(1, someUser, {'from': accounts[2]})
+    pageCommunity.removeModerator(1, accounts[2], {'from': pageVoteForCommon})
+    pageCommunity.quit(1, {'from': someUser})
+    assert pageCommunity.readMemberStatus(1, someUser)[:3] == (False, False, False)
+    assert pageCommunity.readMemberStatus(1, accounts[2])[:3] == (True, False, False)
+
+    with reverts():
+        pageCommunity.syncMemberStatus(1, [someUser, accounts[2]], {'from': someUser})
+    accountJoinedAt = pageCommunity.readMemberStatus(1, accounts[2])[3]
+    pageCommunity.syncMemberStatus(1, [someUser, accounts[2]])
+    assert pageCommunity.readMemberStatus(1, someUser)[:3] == (False, False, False)
+    # the joining time of a synced record is kept
+    assert pageCommunity.readMemberStatus(1, accounts[2]) == (True, False, False, accountJoinedAt)
+
+
 def test_write_read_Post(pageBank, pageCommunity, someUser, deployer):
     communityName = 'First users'
     pageCommunity.addCommunity(communityName)
@@ -129,6 +202,55 @@ def test_write_read_Comment(pageBank, pageCommunity, someUser, deployer):
         pageCommunity.writeComment(0, 'dddd-dddd', True, True, deployer, {'from': someUser})
 
 
+def test_write_read_Comments(pageBank, pageCommunity, someUser, deployer):
+    communityName = 'First users'
+    pageCommunity.addCommunity(communityName)
+    pageCommunity.join(1, {'from': someUser})
+    pageCommunity.join(1, {'from': deployer})
+    network.gas_price("65 gwei")
+
+    pageCommunity.writePost(1, 'dddd', deployer, {'from': someUser})
+    pageCommunity.writePost(1, 'aaaa', deployer, {'from': someUser})
+
+    tx = pageCommunity.writeComments(
+        1, [0, 1, 1], ['dddd-dddd', 'aaaa-aaaa', 'aaaa-bbbb'], [True, False, False], [False, True, False], deployer,
+        {'from': someUser}
+    )
+
+    assert pageCommunity.getCommentCount(0) == 1
+    assert pageCommunity.getCommentCount(1) == 2
+
+    comments = [
+        ((0, 0), 'dddd-dddd', True, False),
+        ((1, 0), 'aaaa-aaaa', False, True),
+        ((1, 1), 'aaaa-bbbb', False, False),
+    ]
+    prices = []
+    for (postId, commentId), ipfsHash, isUp, isDown in comments:
+        readComment = pageCommunity.readComment(postId, commentId)
+        assert readComment[:3] == (ipfsHash, someUser, deployer)
+        assert readComment[4:] == (isUp, isDown, True)
+        prices.append(readComment[3])
+    assert [event['price'] for event in tx.events['WriteComment']] == prices
+
+    # the minted amount is divided equally, the last comment gets the remainder
+    assert prices[0] > 0
+    assert prices[0] == prices[1]
+    assert prices[1] <= prices[2] < prices[1] + len(comments)
+
+    readPost = pageCommunity.readPost(0)
+    assert readPost[3] == 1
+    readPost = pageCommunity.readPost(1)
+    assert readPost[4] == 1
+
+    with reverts():
+        pageCommunity.writeComments(1, [0], ['dddd-dddd'], [True, False], [False], deployer, {'from': someUser})
+    with reverts():
+        pageCommunity.writeComments(1, [], [], [], [], deployer, {'from': someUser})
+    with reverts():
+        pageCommunity.writeComments(1, [2], ['dddd-dddd'], [False], [False], deployer, {'from': someUser})
+
+
 def test_write_burn_Post(pageBank, pageCommunity, someUser, deployer):
     communityName = 'First users'
     pageCommunity.addCommunity(communityName)
@@ -216,6 +338,169 @@ def test_write_burn_Comment(accounts, pageBank, pageCommunity, pageToken, pageVo
     assert readComment[0] == ''
 
 
+def test_live_comment_ids(accounts, pageBank, pageCommunity, pageToken, pageVoteForCommon, someUser, deployer, treasury):
+    moderator = accounts[2]
+    pageCommunity.addCommunity('First users')
+    pageCommunity.join(1, {'from': someUser})
+    pageCommunity.join(1, {'from': deployer})
+    pageCommunity.join(1, {'from': moderator})
+    pageCommunity.addModerator(1, moderator, {'from': pageVoteForCommon})
+    network.gas_price("65 gwei")
+
+    amount = 10000000000000000000000;
+    pageToken.transfer(moderator, amount, {'from': treasury})
+    pageToken.approve(pageBank, amount, {'from': moderator})
+    pageBank.addBalance(amount, {'from': moderator})
+
+    pageCommunity.writePost(1, 'dddd', deployer, {'from': someUser})
+    batchSize = 250
+    for i in range(8):
+        pageCommunity.writeComments(
+            1, [0] * batchSize, ['dddd-dddd'] * batchSize, [False] * batchSize, [False] * batchSize, deployer,
+            {'from': deployer}
+        )
+    assert pageCommunity.getCommentCount(0) == 2000
+    assert pageCommunity.getLiveCommentCount(0) == 2000
+
+    for commentId in [0, 999, 1999]:
+        pageCommunity.burnComment(0, commentId, {'from': moderator})
+    for commentId in [1, 500]:
+        pageCommunity.setVisibilityComment(0, commentId, False, {'from': moderator})
+    pageCommunity.setVisibilityComment(0, 500, True, {'from': moderator})
+
+    assert pageCommunity.getCommentCount(0) == 2000
+    assert pageCommunity.getLiveCommentCount(0) == 1996
+
+    commentIds = []
+    for offset in range(0, 2000, 300):
+        commentIds += pageCommunity.getCommentIds(0, offset, 300)
+    assert len(commentIds) == 1996
+    assert set(commentIds) == set(range(2000)) - {0, 1, 999, 1999}
+    assert pageCommunity.getCommentIds(0, 1996, 10) == ()
+
+    # a burned comment is not added back to the index
+    pageCommunity.setVisibilityComment(0, 999, True, {'from': moderator})
+    assert pageCommunity.getLiveCommentCount(0) == 1996
+
+    with reverts():
+        pageCommunity.syncCommentIds(0, 0, 2000, {'from': someUser})
+    pageCommunity.syncCommentIds(0, 0, 2000, {'from': deployer})
+    assert pageCommunity.getLiveCommentCount(0) == 1996
+
+    pageCommunity.burnPost(0, {'from': deployer})
+    assert pageCommunity.getLiveCommentCount(0) == 0
+    assert pageCommunity.getCommentIds(0, 0, 10) == ()
+
+
+def cid_to_digest(cid):
+    alphabet = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+    value = 0
+    for char in cid: value = value * 58 + alphabet.index(char)
+    multihash = value.to_bytes(34, 'big')
+    assert multihash[:2] == bytes.fromhex('1220')
+    return '0x' + multihash[2:].hex()
+
+
+def written_slots(tx, contract):
+    return {step['stack'][-1] for step in tx.trace if step['op'] == 'SSTORE' and step['address'] == contract.address}
+
+
+def test_write_read_packed_Post_Comment(pageCommunity, pageVoteForCommon, someUser, deployer, accounts):
+    ipfsHash = 'QmdfTbBqBPQ7VNxZEYEj14VmRuZBkqFbiwReogJgS1zR1n'
+    pageCommunity.addCommunity('First users')
+    pageCommunity.join(1, {'from': someUser})
+    pageCommunity.join(1, {'from': deployer})
+    network.gas_price("65 gwei")
+
+    with reverts():
+        pageCommunity.writePostDigest(1, 0, deployer, {'from': someUser})
+
+    pageCommunity.writePostDigest(1, cid_to_digest(ipfsHash), deployer, {'from': someUser})
+    readPost = pageCommunity.readPost(0)
+    #('QmdfTbBqBPQ7VNxZEYEj14VmRuZBkqFbiwReogJgS1zR1n', '0xA868bC7c1AF08B8831795FAC946025557369F69C', '0x66aB6D9362d4F35596279692F0251Db635165871', 0, 0, 12122487000000000000, 0, (), True)
+    assert readPost[0] == ipfsHash
+    assert readPost[1] == someUser
+    assert readPost[2] == deployer
+    assert readPost[5] == pageCommunity.getPostPrice(0)
+    assert readPost[5] > 0
+    assert readPost[8] == True
+
+    pageCommunity.writeCommentDigest(0, cid_to_digest(ipfsHash), True, False, deployer, {'from': someUser})
+    pageCommunity.writeComment(0, 'dddd-dddd', False, True, deployer, {'from': deployer})
+    assert pageCommunity.getCommentCount(0) == 2
+
+    readPost = pageCommunity.readPost(0)
+    assert readPost[3] == 1
+    assert readPost[4] == 1
+    assert readPost[6] == 2
+
+    readComment = pageCommunity.readComment(0, 0)
+    assert readComment[0] == ipfsHash
+    assert readComment[1] == someUser
+    assert readComment[2] == deployer
+    assert readComment[3] > 0
+    assert readComment[4] == True
+    assert readComment[5] == False
+    assert readComment[6] == True
+    assert pageCommunity.readComment(0, 1)[0] == 'dddd-dddd'
+
+    pageCommunity.join(1, {'from': accounts[2]})
+    pageCommunity.addModerator(1, accounts[2], {'from': pageVoteForCommon})
+    pageCommunity.setVisibilityComment(0, 0, False, {'from': accounts[2]})
+    assert pageCommunity.readComment(0, 0)[6] == False
+    pageCommunity.setPostVisibility(0, False, {'from': accounts[2]})
+    assert pageCommunity.readPost(0)[8] == False
+    with reverts():
+        pageCommunity.writeCommentDigest(0, cid_to_digest(ipfsHash), False, False, deployer, {'from': someUser})
+
+
+def test_packed_layout_gas_report(pageBank, pageCommunity, pageToken, pageVoteForCommon, someUser, deployer, accounts, treasury):
+    # Compares the string layout with the packed layout:
+    # the number of written storage slots and gas for write/burn of posts and comments.
+    ipfsHash = 'QmdfTbBqBPQ7VNxZEYEj14VmRuZBkqFbiwReogJgS1zR1n'
+    digest = cid_to_digest(ipfsHash)
+    moderator = accounts[2]
+    pageCommunity.addCommunity('First users')
+    pageCommunity.join(1, {'from': someUser})
+    pageCommunity.join(1, {'from': deployer})
+    pageCommunity.join(1, {'from': moderator})
+    pageCommunity.addModerator(1, moderator, {'from': pageVoteForCommon})
+    network.gas_price("65 gwei")
+
+    amount = 10000000000000000000000;
+    pageToken.transfer(moderator, amount, {'from': treasury})
+    pageToken.approve(pageBank, amount, {'from': moderator})
+    pageBank.addBalance(amount, {'from': moderator})
+
+    # warm up the counters of NFT, bank and user rate
+    pageCommunity.writePost(1, ipfsHash, deployer, {'from': deployer})
+    pageCommunity.writeComment(0, ipfsHash, False, False, deployer, {'from': someUser})
+    pageCommunity.burnComment(0, 0, {'from': moderator})
+    pageCommunity.burnPost(0, {'from': deployer})
+
+    txs = {'string': {}, 'packed': {}}
+    txs['string']['writePost'] = pageCommunity.writePost(1, ipfsHash, deployer, {'from': deployer})
+    txs['packed']['writePost'] = pageCommunity.writePostDigest(1, digest, deployer, {'from': deployer})
+    txs['string']['writeComment'] = pageCommunity.writeComment(1, ipfsHash, False, False, deployer, {'from': someUser})
+    txs['packed']['writeComment'] = pageCommunity.writeCommentDigest(2, digest, False, False, deployer, {'from': someUser})
+    txs['string']['burnComment'] = pageCommunity.burnComment(1, 0, {'from': moderator})
+    txs['packed']['burnComment'] = pageCommunity.burnComment(2, 0, {'from': moderator})
+    txs['string']['burnPost'] = pageCommunity.burnPost(1, {'from': deployer})
+    txs['packed']['burnPost'] = pageCommunity.burnPost(2, {'from': deployer})
+
+    for method in ['writePost', 'writeComment', 'burnPost', 'burnComment']:
+        stringTx = txs['string'][method]
+        packedTx = txs['packed'][method]
+        stringSlots = len(written_slots(stringTx, pageCommunity))
+        packedSlots = len(written_slots(packedTx, pageCommunity))
+        print(method, 'slots', stringSlots, '->', packedSlots, 'gas', stringTx.gas_used, '->', packedTx.gas_used)
+
+        assert packedSlots <= stringSlots
+        if method.startswith('write'):
+            assert packedSlots < stringSlots
+            assert packedTx.gas_used < stringTx.gas_used
+
+
 def test_visibility(accounts, pageCommunity, pageVoteForCommon, someUser, deployer):
     communityName = 'First users'
     pageCommunity.addCommunity(communityName)
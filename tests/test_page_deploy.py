@@ -0,0 +1,74 @@
+import json
+
+import pytest
+from brownie import project, web3
+import brownie
+
+from deploy.orchestrator import Orchestrator, DeployError, Call, Deploy, Ref
+from deploy.system import page_system
+
+
+def create_orchestrator(steps, statePath, deployer, admin, treasury):
+    named = {'deployer': deployer, 'admin': admin, 'treasury': treasury}
+    return Orchestrator(steps, named, project.get_loaded_projects()[0], statePath)
+
+
+def test_deploy_system(tmp_path, deployer, admin, treasury):
+    statePath = str(tmp_path / 'state.json')
+    steps = page_system()
+    names = [step.name for step in steps]
+
+    # an interrupted deployment, only the steps up to the bank are confirmed
+    first = create_orchestrator(steps[:names.index('pageBank.initialize') + 1], statePath, deployer, admin, treasury)
+    first.run()
+    bankAddress = first.address('pageBank')
+    assert first.sent == names.index('pageBank.initialize') + 1
+
+    orchestrator = create_orchestrator(steps, statePath, deployer, admin, treasury)
+    orchestrator.run()
+    assert orchestrator.sent == len(steps) - first.sent
+    # the independent steps are sent together
+    assert orchestrator.waves < orchestrator.sent
+    assert orchestrator.address('pageBank') == bankAddress
+    assert '{} transactions'.format(orchestrator.sent) in orchestrator.report()
+
+    pageBank = orchestrator.contract('pageBank')
+    pageCommunity = orchestrator.contract('pageCommunity')
+    pageCalcUserRate = orchestrator.contract('pageCalcUserRate')
+    pageSafeDeal = orchestrator.address('pageSafeDeal')
+    assert pageBank.hasRole(pageBank.MINTER_ROLE(), pageCommunity)
+    assert pageBank.hasRole(pageBank.BURNER_ROLE(), pageCommunity)
+    assert pageBank.hasRole(pageBank.VOTE_FOR_EARN_ROLE(), orchestrator.address('pageVoteForEarn'))
+    assert pageCalcUserRate.hasRole(pageCalcUserRate.BANK_ROLE(), pageBank)
+    assert pageCalcUserRate.hasRole(pageCalcUserRate.DEAL_ROLE(), pageSafeDeal)
+    assert orchestrator.contract('pageToken').balanceOf(treasury) == 5 * 10 ** 25
+    assert orchestrator.contract('pageNFT').owner() == deployer
+    assert pageCommunity.voterContracts(0) == orchestrator.address('pageVoteForCommon')
+    assert pageCommunity.voterContracts(1) == orchestrator.address('pageVoteForEarn')
+    assert pageCommunity.voterContracts(2) == orchestrator.address('pageVoteForSuperModerator')
+
+    pageCommunity.addCommunity('First users', {'from': deployer})
+    pageCommunity.join(1, {'from': treasury})
+    assert pageCommunity.isCommunityActiveUser(1, treasury)
+
+    # a finished deployment sends nothing
+    again = create_orchestrator(steps, statePath, deployer, admin, treasury)
+    again.run()
+    assert again.sent == 0
+    with open(statePath) as file:
+        state = json.load(file)
+    assert state['chainId'] == web3.eth.chain_id
+    assert all(item['done'] for item in state['steps'].values())
+
+
+def test_wrong_graph(tmp_path, deployer, admin, treasury):
+    statePath = str(tmp_path / 'state.json')
+    with pytest.raises(DeployError):
+        create_orchestrator([Call('pageBank.setToken', 'pageBank', 'setToken', (Ref('pageToken'),))], statePath, deployer, admin, treasury)
+
+    steps = [
+        Deploy('pageLens', 'PageLens', (Ref('pageCommunity'),)),
+        Call('pageCommunity', 'pageLens', 'setLens', (Ref('pageLens'),)),
+    ]
+    with pytest.raises(DeployError):
+        create_orchestrator(steps, statePath, deployer, admin, treasury).run()
@@ -0,0 +1,221 @@
+import pytest
+from brownie import ZERO_ADDRESS, chain, reverts, network, web3
+import brownie
+
+from indexer import Indexer, Store, ReorgTooDeepError
+
+
+def create_indexer(store, pageCommunity, pageBank, **kwargs):
+    contracts = [(pageCommunity.address, pageCommunity.abi), (pageBank.address, pageBank.abi)]
+    return Indexer(web3, store, contracts, **kwargs)
+
+
+def test_index_community(tmp_path, pageBank, pageCommunity, pageVoteForCommon, someUser, deployer, accounts):
+    startBlock = chain.height + 1
+    moderator = accounts[2]
+    network.gas_price("65 gwei")
+
+    pageCommunity.addCommunity('First users')
+    pageCommunity.join(1, {'from': someUser})
+    pageCommunity.join(1, {'from': deployer})
+    pageCommunity.join(1, {'from': moderator})
+    pageCommunity.addModerator(1, moderator, {'from': pageVoteForCommon})
+    pageCommunity.writePost(1, 'dddd', deployer, {'from': someUser})
+    pageCommunity.writePost(1, 'aaaa', deployer, {'from': someUser})
+    pageCommunity.writeComment(0, 'cccc', False, False, deployer, {'from': someUser})
+    pageCommunity.writeComment(0, 'bbbb', False, False, deployer, {'from': moderator})
+
+    path = str(tmp_path / 'indexer.sqlite')
+    store = Store(path)
+    # a small batch makes several eth_getLogs requests
+    indexer = create_indexer(store, pageCommunity, pageBank, startBlock=startBlock, batchSize=3)
+    assert indexer.sync() == chain.height
+    assert store.get_checkpoint() == chain.height
+
+    posts = store.read_posts(1)
+    assert [post['id'] for post in posts] == [0, 1]
+    assert posts[0]['creator'] == someUser
+    assert posts[0]['owner'] == deployer
+    assert [comment['creator'] for comment in store.read_comments(0)] == [someUser, moderator]
+    assert set(store.read_members(1)) == {someUser, deployer, moderator}
+    flows = store.read_bank_flows(1)
+    assert [flow['name'] for flow in flows] == ['MintForPost', 'MintForPost', 'MintForComment', 'MintForComment']
+    assert int(flows[0]['amount']) > 0
+    store.close()
+
+    pageCommunity.setPostVisibility(1, False, {'from': moderator})
+    pageCommunity.setVisibilityComment(0, 1, False, {'from': moderator})
+    pageCommunity.burnPost(0, {'from': deployer})
+    pageCommunity.quit(1, {'from': someUser})
+
+    # the indexer continues from the saved checkpoint
+    store = Store(path)
+    indexer = create_indexer(store, pageCommunity, pageBank, startBlock=startBlock, batchSize=3)
+    indexer.sync()
+    posts = store.read_posts(1)
+    assert [post['id'] for post in posts] == [1]
+    assert posts[0]['is_view'] == 0
+    assert store.read_comments(0)[1]['is_view'] == 0
+    assert set(store.read_members(1)) == {deployer, moderator}
+    assert store.read_bank_flows(1)[-1]['name'] == 'BurnForPost'
+
+
+def test_index_members_history(pageBank, pageCommunity, someUser, deployer):
+    startBlock = chain.height + 1
+    pageCommunity.addCommunity('First users')
+    pageCommunity.join(1, {'from': someUser})
+    pageCommunity.join(1, {'from': deployer})
+    quitBlock = pageCommunity.quit(1, {'from': someUser}).block_number
+    joinBlock = pageCommunity.join(1, {'from': someUser}).block_number
+
+    store = Store()
+    create_indexer(store, pageCommunity, pageBank, startBlock=startBlock).sync()
+    assert store.read_members(1) == [deployer, someUser]
+
+    # the history is kept, so a rollback restores the membership of every block
+    store.rollback(joinBlock - 1)
+    assert store.read_members(1) == [deployer]
+    store.rollback(quitBlock - 1)
+    assert store.read_members(1) == [someUser, deployer]
+
+    # a database indexed before the history is rebuilt from its events
+    store.connection.execute('DELETE FROM member_events')
+    store.rebuild_member_events()
+    assert store.read_members(1) == [someUser, deployer]
+
+
+def test_index_reorg(pageBank, pageCommunity, someUser, deployer):
+    startBlock = chain.height + 1
+    network.gas_price("65 gwei")
+    pageCommunity.addCommunity('First users')
+    pageCommunity.join(1, {'from': someUser})
+    pageCommunity.join(1, {'from': deployer})
+    pageCommunity.writePost(1, 'dddd', deployer, {'from': someUser})
+    pageCommunity.writePost(1, 'aaaa', deployer, {'from': someUser})
+
+    store = Store()
+    indexer = create_indexer(store, pageCommunity, pageBank, startBlock=startBlock, reorgDepth=4)
+    indexer.sync()
+    eventsCount = store.connection.execute('SELECT COUNT(*) FROM events').fetchone()[0]
+    assert len(store.connection.execute('SELECT * FROM blocks').fetchall()) == 4
+
+    # the last block was replaced on the chain
+    head = chain.height
+    store.connection.execute('UPDATE blocks SET hash = ? WHERE number = ?', ('0x01', head))
+    assert indexer.check_reorg() == head - 1
+    assert store.get_checkpoint() == head - 1
+    assert [post['id'] for post in store.read_posts(1)] == [0]
+
+    indexer.sync()
+    assert [post['id'] for post in store.read_posts(1)] == [0, 1]
+    assert store.connection.execute('SELECT COUNT(*) FROM events').fetchone()[0] == eventsCount
+
+    # all saved blocks were replaced
+    store.connection.execute('UPDATE blocks SET hash = ?', ('0x01',))
+    with pytest.raises(ReorgTooDeepError):
+        indexer.sync()
+
+
+def rebuilt_balance(store, user):
+    balance = 0
+    for flow in store.connection.execute('SELECT * FROM bank_flows').fetchall():
+        sign = 1 if flow['name'].startswith('Mint') else -1
+        if flow['owner'] == user:
+            balance += sign * int(flow['owner_amount'])
+        if flow['creator'] == user:
+            balance += sign * int(flow['creator_amount'])
+    return balance
+
+
+def test_replay_matches_views(pageBank, pageCommunity, pageToken, pageVoteForCommon, someUser, deployer, accounts, treasury):
+    startBlock = chain.height + 1
+    moderator = accounts[2]
+    digest = '0xe3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855'
+    network.gas_price("65 gwei")
+
+    pageCommunity.addCommunity('First users')
+    for user in (someUser, deployer, moderator):
+        pageCommunity.join(1, {'from': user})
+    pageCommunity.addModerator(1, moderator, {'from': pageVoteForCommon})
+    pageToken.transfer(moderator, 10000000000000000000000, {'from': treasury})
+    pageToken.approve(pageBank, 10000000000000000000000, {'from': moderator})
+    pageBank.addBalance(10000000000000000000000, {'from': moderator})
+
+    tx = pageCommunity.writePost(1, 'dddd', deployer, {'from': someUser})
+    event = tx.events['WritePost']
+    assert event['postId'] == 0
+    assert event['ipfsHash'] == 'dddd'
+    assert event['price'] == pageCommunity.readPost(0)[5]
+    mint = tx.events['MintForPost']
+    assert mint['amount'] > mint['ownerAmount'] > 0
+
+    pageCommunity.writePostDigest(1, digest, deployer, {'from': someUser})
+    pageCommunity.writePost(1, 'aaaa', deployer, {'from': someUser})
+    pageCommunity.writeComment(0, 'cccc', True, False, deployer, {'from': deployer})
+    pageCommunity.writeComment(0, 'bbbb', False, True, deployer, {'from': moderator})
+    pageCommunity.writeCommentDigest(1, digest, True, False, deployer, {'from': someUser})
+    pageCommunity.writeComments(1, [0, 1, 1], ['e', 'f', 'g'], [False] * 3, [False] * 3, deployer, {'from': someUser})
+    pageCommunity.setVisibilityComment(1, 1, False, {'from': moderator})
+    pageCommunity.burnComment(0, 2, {'from': moderator})
+    pageCommunity.setPostVisibility(2, False, {'from': moderator})
+    pageCommunity.burnPost(2, {'from': deployer})
+
+    store = Store()
+    create_indexer(store, pageCommunity, pageBank, startBlock=startBlock).sync()
+
+    for postId in range(3):
+        readPost = pageCommunity.readPost(postId)
+        post = store.read_post(postId)
+        assert post['ipfsHash'] == readPost[0]
+        assert post['creator'] == readPost[1]
+        assert post['owner'] == readPost[2]
+        assert post['upCount'] == readPost[3]
+        assert post['downCount'] == readPost[4]
+        assert post['commentCount'] == readPost[6]
+        assert post['isView'] == readPost[8]
+        if readPost[1] != ZERO_ADDRESS:
+            assert post['price'] == readPost[5]
+            assert post['upDownUsers'] == list(readPost[7])
+
+        for commentId in range(readPost[6]):
+            readComment = pageCommunity.readComment(postId, commentId)
+            comment = store.read_comment(postId, commentId)
+            assert comment == {
+                'ipfsHash': readComment[0], 'creator': readComment[1], 'owner': readComment[2],
+                'price': readComment[3], 'isUp': readComment[4], 'isDown': readComment[5], 'isView': readComment[6],
+            }
+
+    assert rebuilt_balance(store, someUser) == pageBank.balanceOf(someUser)
+    assert rebuilt_balance(store, deployer) == pageBank.balanceOf(deployer)
+
+
+def test_index_nft_owners(pageNFTLean, deployer, admin, someUser):
+    startBlock = chain.height + 1
+    for i in range(3): pageNFTLean.mint(admin, {'from': deployer})
+    pageNFTLean.approve(someUser, 1, {'from': admin})
+    pageNFTLean.transferFrom(admin, someUser, 1, {'from': admin})
+    pageNFTLean.burn(2, {'from': deployer})
+
+    store = Store()
+    Indexer(web3, store, [(pageNFTLean.address, pageNFTLean.abi)], startBlock=startBlock).sync()
+    assert store.read_tokens_of_owner(admin) == [0]
+    assert store.read_tokens_of_owner(someUser) == [1]
+    assert store.read_owner_of(2) == ZERO_ADDRESS
+    assert store.read_owner_of(3) is None
+
+
+def test_index_voters(pageVoteForCommon, pageCommunity, someUser, deployer, accounts):
+    startBlock = chain.height + 1
+    pageCommunity.addCommunity('First users')
+    pageCommunity.join(1, {'from': someUser})
+    pageCommunity.join(1, {'from': deployer})
+    pageVoteForCommon.createVote(1, 'test for vote', 86400 * 4, 2, [10, 11, 12, 13], ZERO_ADDRESS, {'from': deployer})
+    pageVoteForCommon.putVote(1, 0, True, {'from': someUser})
+    pageVoteForCommon.putVote(1, 0, False, {'from': deployer})
+
+    store = Store()
+    Indexer(web3, store, [(pageVoteForCommon.address, pageVoteForCommon.abi)], startBlock=startBlock).sync()
+    voters = store.read_voters(pageVoteForCommon.address, 'PutVote', 0, communityId=1)
+    assert [voter['voter'] for voter in voters] == [someUser, deployer]
+    assert [voter['is_yes'] for voter in voters] == [1, 0]
+    assert len(voters) == pageVoteForCommon.readVote(1, 0)[8]
@@ -0,0 +1,82 @@
+import pytest
+from brownie import ZERO_ADDRESS, chain, reverts, network
+import brownie
+
+VERSION = '1'
+
+
+def test_deployment(pageLens, pageCommunity):
+    print('='*20 + ' running for PageLens ... ' + '='*20)
+    assert pageLens != ZERO_ADDRESS
+    assert pageCommunity.lens() == pageLens
+
+
+def test_version(pageLens):
+    assert VERSION == pageLens.version()
+
+
+def test_read_posts_comments(pageLens, pageCommunity, pageVoteForCommon, someUser, deployer, accounts):
+    pageCommunity.addCommunity('First users')
+    pageCommunity.join(1, {'from': someUser})
+    pageCommunity.join(1, {'from': deployer})
+    pageCommunity.join(1, {'from': accounts[2]})
+    pageCommunity.addModerator(1, accounts[2], {'from': pageVoteForCommon})
+    network.gas_price("65 gwei")
+
+    for ipfsHash in ('dddd', 'aaaa', 'bbbb'):
+        pageCommunity.writePost(1, ipfsHash, deployer, {'from': someUser})
+    pageCommunity.writeComment(0, 'cccc', True, False, deployer, {'from': deployer})
+    pageCommunity.writeComment(0, 'eeee', False, False, deployer, {'from': someUser})
+    pageCommunity.writeComment(0, 'ffff', False, False, deployer, {'from': someUser})
+    pageCommunity.setPostVisibility(1, False, {'from': accounts[2]})
+
+    posts = pageLens.readPosts([0, 2])
+    assert len(posts) == 2
+    # (0, 'dddd', creator, owner, upCount, downCount, price, commentCount, upDownUsers, isView)
+    assert posts[0][0] == 0
+    assert posts[0][1:] == pageCommunity.readPost(0)
+    assert posts[1][1:] == pageCommunity.readPost(2)
+
+    feed = pageLens.readFeed(1, 1, 10)
+    assert [post[0] for post in feed] == [1, 2]
+    assert feed[0][9] == False
+    assert len(pageLens.readFeed(1, 3, 10)) == 0
+
+    comments = pageLens.readCommentsRange(0, 1, 10)
+    assert [comment[1] for comment in comments] == [1, 2]
+    assert comments[0][2:] == pageCommunity.readComment(0, 1)
+    assert len(pageLens.readCommentsRange(0, 3, 10)) == 0
+    assert len(pageLens.readCommentsRange(1, 0, 10)) == 0
+
+
+def test_read_private_community(pageLens, pageCommunity, pageBank, pageToken, pageVoteForEarn, someUser, deployer, treasury, accounts):
+    reader = accounts[3]
+    pageCommunity.addCommunity('First users')
+    pageCommunity.join(1, {'from': someUser})
+    pageCommunity.join(1, {'from': deployer})
+    pageCommunity.join(1, {'from': reader})
+    network.gas_price("65 gwei")
+    pageCommunity.writePost(1, 'dddd', deployer, {'from': someUser})
+    pageCommunity.writeComment(0, 'cccc', False, False, deployer, {'from': someUser})
+
+    pageCommunity.setCommunityPrivate(1, True, {'from': deployer})
+    pageBank.setPriceForPrivacyAccess(1, 1, {'from': pageVoteForEarn})
+
+    # without the privacy access the posts and comments are empty, as in PageCommunity
+    assert pageCommunity.readPost(0, {'from': reader})[0] == ''
+    posts = pageLens.readPosts([0], {'from': reader})
+    assert posts[0][0] == 0
+    assert posts[0][1] == ''
+    assert posts[0][2] == ZERO_ADDRESS
+    assert pageLens.readFeed(1, 0, 10, {'from': reader})[0][1] == ''
+    comments = pageLens.readCommentsRange(0, 0, 10, {'from': reader})
+    assert comments[0][1] == 0
+    assert comments[0][3] == ZERO_ADDRESS
+
+    pageToken.transfer(reader, 100, {'from': treasury})
+    pageToken.approve(pageBank, 100, {'from': reader})
+    pageBank.addBalance(100, {'from': reader})
+    pageBank.payForPrivacyAccess(100, 1, {'from': reader})
+
+    assert pageLens.readPosts([0], {'from': reader})[0][1:] == pageCommunity.readPost(0, {'from': reader})
+    assert pageLens.readCommentsRange(0, 0, 10, {'from': reader})[0][2] == 'cccc'
@@ -73,3 +73,33 @@ def test_transfer_from(pageNFT, pageCommunity, admin, someUser):
     assert tokens[1] == 2
 
 
+def test_tokens_of_owner_range(pageNFT, pageCommunity, admin, someUser):
+    for i in range(5): pageNFT.mint(admin, {'from': pageCommunity})
+    pageNFT.mint(someUser, {'from': pageCommunity})
+
+    assert pageNFT.tokensOfOwner(admin, 0, 2) == (0, 1)
+    assert pageNFT.tokensOfOwner(admin, 3, 10) == (3, 4)
+    assert pageNFT.tokensOfOwner(admin, 5, 10) == ()
+    assert pageNFT.tokensOfOwner(someUser, 0, 10) == (5,)
+
+
+def test_lean_mint_transfer_burn(pageNFTLean, deployer, admin, someUser):
+    pageNFTLean.mint(admin, {'from': deployer})
+    pageNFTLean.mint(admin, {'from': deployer})
+    assert pageNFTLean.balanceOf(admin) == 2
+    assert pageNFTLean.ownerOf(1) == admin
+    assert pageNFTLean.tokenURI(1) == 'https://1'
+
+    with reverts():
+        pageNFTLean.mint(admin, {'from': someUser})
+    with reverts():
+        pageNFTLean.transferFrom(admin, someUser, 1, {'from': admin})
+
+    pageNFTLean.approve(someUser, 1, {'from': admin})
+    pageNFTLean.transferFrom(admin, someUser, 1, {'from': admin})
+    assert pageNFTLean.ownerOf(1) == someUser
+
+    pageNFTLean.burn(0, {'from': deployer})
+    assert pageNFTLean.balanceOf(admin) == 0
+    with reverts():
+        pageNFTLean.ownerOf(0)
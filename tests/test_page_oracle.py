@@ -37,3 +37,84 @@ def test_get_stable_price(pageOracle, deployer):
     price = pageOracle.getFromPageToWethPrice()
     print('price', price) # 197085401415975
     assert price == newPrice
+
+
+PAGE_WETH_TICK = -85325
+
+
+def test_token_order_from_pool(PageOracle, MockUniswapV3Pool, pageToken, deployer, accounts):
+    weth = accounts[5]
+    pool = MockUniswapV3Pool.deploy(pageToken, weth, PAGE_WETH_TICK, {'from': deployer})
+    oracle = PageOracle.deploy({'from': deployer})
+    oracle.initialize(pageToken, pool)
+    assert oracle.isPageToken0() == True
+
+    price = oracle.getFromPageToWethPrice()
+    print('price', price / 1e18) # 0.000197...
+    assert abs(price - 1.0001 ** PAGE_WETH_TICK * 1e18) < price / 1e6
+
+    reversedPool = MockUniswapV3Pool.deploy(weth, pageToken, -PAGE_WETH_TICK, {'from': deployer})
+    oracle.setPool(reversedPool, {'from': deployer})
+    assert oracle.isPageToken0() == False
+    assert abs(oracle.getFromPageToWethPrice() - price) < price / 1e6
+
+
+def test_cached_price(PageOracle, MockUniswapV3Pool, pageToken, deployer, accounts):
+    pool = MockUniswapV3Pool.deploy(pageToken, accounts[5], PAGE_WETH_TICK, {'from': deployer})
+    oracle = PageOracle.deploy({'from': deployer})
+    oracle.initialize(pageToken, pool)
+    wethAmount = Wei('1 ether')/10
+
+    # without cache every conversion requests the pool
+    uncachedGas = oracle.convertFromWethToPageAmount(wethAmount).gas_used
+    assert oracle.priceCache()[1] == 0
+
+    oracle.changeCachedPriceStatus({'from': deployer})
+    oracle.setMaxPriceAge(60, {'from': deployer})
+    with reverts():
+        oracle.setMaxPriceAge(16 * 60, {'from': deployer})
+
+    tx = oracle.convertFromWethToPageAmount(wethAmount)
+    missGas = tx.gas_used
+    cache = oracle.priceCache()
+    assert cache[1] == tx.block_number
+    pageAmount = tx.return_value
+
+    pool.setTick(PAGE_WETH_TICK + 1000, {'from': deployer})
+    tx = oracle.convertFromWethToPageAmount(wethAmount)
+    hitGas = tx.gas_used
+    assert tx.return_value == pageAmount
+    assert oracle.getFromWethToPageAmount(wethAmount) == pageAmount
+    assert oracle.priceCache() == cache
+
+    print('gas uncached', uncachedGas, 'cache miss', missGas, 'cache hit', hitGas)
+    assert hitGas < uncachedGas
+    assert hitGas < missGas
+
+    # the stale price is requested from the pool again
+    chain.sleep(61)
+    tx = oracle.convertFromWethToPageAmount(wethAmount)
+    assert tx.return_value < pageAmount
+    assert oracle.priceCache()[1] == tx.block_number
+
+
+def test_mock_pool_twap(PageOracle, MockUniswapV3Pool, pageToken, deployer, accounts):
+    pool = MockUniswapV3Pool.deploy(pageToken, accounts[5], PAGE_WETH_TICK, {'from': deployer})
+    oracle = PageOracle.deploy({'from': deployer})
+    oracle.initialize(pageToken, pool)
+    price = oracle.getFromPageToWethPrice()
+
+    pool.setTick(PAGE_WETH_TICK + 1000, {'from': deployer})
+    assert pool.checkpointsCount() == 2
+
+    # the half of the TWAP interval is on the new tick
+    chain.sleep(oracle.pageTwapInterval() // 2)
+    chain.mine()
+    halfPrice = oracle.getFromPageToWethPrice()
+    assert halfPrice > price
+
+    chain.sleep(oracle.pageTwapInterval())
+    chain.mine()
+    newPrice = oracle.getFromPageToWethPrice()
+    assert abs(newPrice - 1.0001 ** (PAGE_WETH_TICK + 1000) * 1e18) < newPrice / 1e6
+    assert halfPrice < newPrice
@@ -0,0 +1,52 @@
+import pytest
+from brownie import Contract, PageBank, PageProxy, PageUUPSProxy, reverts
+import brownie
+
+
+def deploy_uups_bank(deployer, treasury, admin, pageCalcUserRate):
+    implementation = PageBank.deploy({'from': deployer})
+    data = implementation.initialize.encode_input(treasury, admin, pageCalcUserRate)
+    proxy = PageUUPSProxy.deploy(implementation, data, {'from': deployer})
+    return implementation, Contract.from_abi('PageBank', proxy.address, PageBank.abi, owner=deployer)
+
+
+def test_uups_upgrade(pageCalcUserRate, deployer, treasury, admin, someUser):
+    implementation, bank = deploy_uups_bank(deployer, treasury, admin, pageCalcUserRate)
+    assert bank.owner() == deployer
+    assert bank.treasury() == treasury
+    assert implementation.proxiableUUID() == '0x360894a13ba1a3210667c828492db98dca3e2076cc3735a920a3ca505d382bbc'
+
+    newImplementation = PageBank.deploy({'from': deployer})
+    with reverts():
+        bank.upgradeTo(newImplementation, {'from': someUser})
+    # the implementation itself can not be upgraded
+    with reverts():
+        implementation.upgradeTo(newImplementation, {'from': deployer})
+    # a proxy can not become an implementation
+    with reverts():
+        bank.upgradeTo(bank, {'from': deployer})
+
+    tx = bank.upgradeTo(newImplementation, {'from': deployer})
+    assert tx.events['Upgraded']['implementation'] == newImplementation
+    assert bank.treasury() == treasury
+
+
+def test_page_proxy_upgrade(pageCalcUserRate, deployer, treasury, admin):
+    implementation = PageBank.deploy({'from': deployer})
+    proxy = PageProxy.deploy(implementation, admin, {'from': deployer})
+    bank = Contract.from_abi('PageBank', proxy.address, PageBank.abi, owner=deployer)
+    bank.initialize(treasury, admin, pageCalcUserRate, {'from': deployer})
+
+    # upgradeTo of the implementation does not go around the proxy admin
+    newImplementation = PageBank.deploy({'from': deployer})
+    assert bank.owner() == deployer
+    with reverts("proxy: not a UUPS proxy"):
+        bank.upgradeTo(newImplementation, {'from': deployer})
+    with reverts("proxy: not a UUPS proxy"):
+        bank.upgradeToAndCall(newImplementation, b'', {'from': deployer})
+    assert proxy.implementation() == implementation
+
+    # the contracts behind PageProxy keep their storage and can be upgraded by the proxy admin as before
+    proxy.proxy_upgradeTo(newImplementation, b'', {'from': admin})
+    assert proxy.implementation() == newImplementation
+    assert bank.treasury() == treasury
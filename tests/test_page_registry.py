@@ -0,0 +1,38 @@
+import pytest
+from brownie import PageBank, PageProxy, project
+import brownie
+
+from deploy.registry import Registry, RegistryError
+
+
+def test_registry(tmp_path, pageBank, pageToken, deployer, admin, treasury):
+    containers = project.get_loaded_projects()[0]
+    registry = Registry(containers, 'development', str(tmp_path))
+    with pytest.raises(RegistryError):
+        registry.contract('pageBank')
+
+    # PageBank keeps its own address in an immutable variable, the code is compared without it
+    registry.register('pageBank', 'PageBank', pageBank)
+    registry.register('pageToken', 'PageToken', pageToken)
+    assert registry.contract('pageBank').treasury() == treasury
+    assert registry.contract('pageToken').bank() == pageBank
+
+    implementation = PageBank.deploy({'from': deployer})
+    proxy = PageProxy.deploy(implementation, admin, {'from': deployer})
+    registry.register('proxyBank', 'PageBank', proxy, 'PageProxy', implementation)
+    assert registry.contract('proxyBank').address == proxy.address
+
+    # the handles are built from the file
+    loaded = Registry(containers, 'development', str(tmp_path))
+    assert loaded.address('pageBank') == pageBank.address
+    assert loaded.contract('pageToken').balanceOf(treasury) == pageToken.balanceOf(treasury)
+
+    # the code is not compiled from the registered contract
+    registry.register('wrongBank', 'PageBank', pageToken)
+    with pytest.raises(RegistryError):
+        registry.contract('wrongBank')
+
+    # the proxy was upgraded without a new registration
+    proxy.proxy_upgradeTo(PageBank.deploy({'from': deployer}), b'', {'from': admin})
+    with pytest.raises(RegistryError):
+        loaded.contract('proxyBank')
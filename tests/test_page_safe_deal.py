@@ -1,6 +1,9 @@
 import pytest
-from brownie import Wei, ZERO_ADDRESS, chain, reverts, network
+from brownie import Wei, ZERO_ADDRESS, accounts, chain, reverts, network, web3
 import brownie
+from eth_utils import encode_hex
+
+from relayer.permit import sign_permit
 
 VERSION = '1'
 
@@ -184,3 +187,104 @@ def test_finish_deal(pageSafeDeal, pageToken, pageBank, pageOracle, pageUserRate
 
 
 
+
+
+def make_eth_deal(pageSafeDeal, pageToken, pageBank, pageOracle, seller, buyer, guarantor):
+    value = Wei('1 ether')/5
+    currentTime = pageSafeDeal.currentTime()
+    mintAmount = pageOracle.getFromWethToPageAmount(pageSafeDeal.GUARANTOR_FEE())
+    pageToken.mint(buyer, mintAmount, {'from': pageBank})
+    pageToken.approve(pageSafeDeal, mintAmount, {'from': buyer})
+    pageSafeDeal.makeDeal('deal', seller, guarantor, currentTime + 100, currentTime + 1000, value, True, {'from': buyer, 'value': value})
+    return pageSafeDeal.dealCount()
+
+
+def test_read_messages_range(pageSafeDeal, pageToken, pageBank, pageOracle, deployer, someUser, admin):
+    dealId = make_eth_deal(pageSafeDeal, pageToken, pageBank, pageOracle, deployer, someUser, admin)
+    for i in range(5):
+        pageSafeDeal.addMessage(dealId, 'message ' + str(i), {'from': someUser if i % 2 else deployer})
+
+    messages = pageSafeDeal.readMessagesDeal(dealId, 1, 2)
+    assert [message[0] for message in messages] == ['message 1', 'message 2']
+    assert messages[0][1] == someUser
+    assert len(pageSafeDeal.readMessagesDeal(dealId, 4, 10)) == 1
+    assert len(pageSafeDeal.readMessagesDeal(dealId, 5, 10)) == 0
+    assert len(pageSafeDeal.readMessagesDeal(dealId, 100, 2 ** 256 - 1)) == 0
+    messages = pageSafeDeal.readMessagesDeal(dealId, 3, 2 ** 256 - 1)
+    assert [message[0] for message in messages] == ['message 3', 'message 4']
+    assert len(pageSafeDeal.readMessagesDeal(dealId, 0, 2 ** 256 - 1)) == 5
+    assert len(pageSafeDeal.readMessagesDeal(dealId)) == 5
+
+    assert pageSafeDeal.readMessagesHash(dealId) == (False, '0x' + '00' * 32, 5)
+
+    with reverts():
+        pageSafeDeal.addMessage(dealId, 'message', {'from': admin})
+
+
+def test_message_hash_mode(pageSafeDeal, pageToken, pageBank, pageOracle, deployer, someUser, admin):
+    with reverts():
+        pageSafeDeal.setMessageHashMode(True, {'from': someUser})
+    pageSafeDeal.setMessageHashMode(True, {'from': deployer})
+    assert pageSafeDeal.isMessageHashMode() == True
+
+    dealId = make_eth_deal(pageSafeDeal, pageToken, pageBank, pageOracle, deployer, someUser, admin)
+    messagesHash = bytes(32)
+    for i in range(3):
+        tx = pageSafeDeal.addMessage(dealId, 'message ' + str(i), {'from': someUser})
+        assert tx.events['AddMessage']['message'] == 'message ' + str(i)
+        messagesHash = web3.solidityKeccak(
+            ['bytes32', 'address', 'uint256', 'string'], [messagesHash, someUser.address, tx.timestamp, 'message ' + str(i)]
+        )
+
+    isMessageHash, readHash, messageCount = pageSafeDeal.readMessagesHash(dealId)
+    assert isMessageHash == True
+    assert readHash == encode_hex(messagesHash)
+    assert messageCount == 3
+    assert len(pageSafeDeal.readMessagesDeal(dealId)) == 0
+
+    pageSafeDeal.setIssue(dealId, 'issue', {'from': deployer})
+    assert pageSafeDeal.readMessagesHash(dealId)[2] == 4
+
+
+def test_make_deal_with_permit(pageSafeDeal, pageToken, pageBank, pageOracle, deployer, admin):
+    buyer = accounts.add()
+    deployer.transfer(buyer, '1 ether')
+    bonus = pageOracle.getFromWethToPageAmount(pageSafeDeal.GUARANTOR_FEE())
+    amount = 1000
+    pageToken.mint(buyer, bonus * 3 + amount, {'from': pageBank})
+    currentTime = pageSafeDeal.currentTime()
+    deadline = currentTime + 1000
+
+    # the tokens of the deal and the bonus are pulled with one permit
+    permit = sign_permit(buyer.private_key, chain.id, pageToken, buyer, pageSafeDeal, amount + bonus, 0, deadline)
+    tx = pageSafeDeal.makeDealWithPermit(
+        'token deal', deployer, admin, currentTime + 100, currentTime + 1000, amount, False, permit, {'from': buyer}
+    )
+    print('makeDealWithPermit tokens gas', tx.gas_used)
+    assert tx.events['MakeDeal']['creator'] == buyer
+    assert pageToken.balanceOf(pageSafeDeal) == amount
+    assert pageToken.balanceOf(admin) == bonus
+    assert pageSafeDeal.readCommonDeal(1)[2] == buyer
+
+    # a permit for the ether deal covers only the bonus
+    value = Wei('1 ether')/5
+    permit = sign_permit(buyer.private_key, chain.id, pageToken, buyer, pageSafeDeal, bonus, 1, deadline)
+    tx = pageSafeDeal.makeDealWithPermit(
+        'ether deal', deployer, admin, currentTime + 100, currentTime + 1000, value, True, permit, {'from': buyer, 'value': value}
+    )
+    print('makeDealWithPermit ether gas', tx.gas_used)
+    assert pageSafeDeal.readBoolDeal(2)[1] == True
+    assert pageToken.balanceOf(admin) == bonus * 2
+    assert pageSafeDeal.balance() == value
+
+    # a permit which is already used still works while the allowance is enough
+    pageToken.approve(pageSafeDeal, bonus, {'from': buyer})
+    tx = pageSafeDeal.makeDealWithPermit(
+        'ether deal', deployer, admin, currentTime + 100, currentTime + 1000, value, True, permit, {'from': buyer, 'value': value}
+    )
+    assert pageSafeDeal.dealCount() == 3
+
+    with reverts():
+        pageSafeDeal.makeDealWithPermit(
+            'ether deal', deployer, admin, currentTime + 100, currentTime + 1000, value, True, permit, {'from': buyer, 'value': value}
+        )
@@ -1,7 +1,9 @@
 import pytest
-from brownie import ZERO_ADDRESS, chain, reverts
+from brownie import ZERO_ADDRESS, accounts, chain, reverts
 import brownie
 
+from relayer.permit import sign_permit
+
 VERSION = '1'
 
 
@@ -41,3 +43,28 @@ def test_mint_burn(treasury, admin, pageToken, pageBank):
     totalSupply = pageToken.totalSupply()
     assert totalSupply == beforeTotalSupply + mintAmount - burnAmount
 
+
+
+def test_permit(pageToken, pageBank, someUser):
+    owner = accounts.add()
+    pageToken.mint(owner, 1000, {'from': pageBank})
+    deadline = chain.time() + 1000
+    value, deadline, v, r, s = sign_permit(owner.private_key, chain.id, pageToken, owner, someUser, 500, 0, deadline)
+
+    pageToken.permit(owner, someUser, value, deadline, v, r, s, {'from': someUser})
+    assert pageToken.allowance(owner, someUser) == 500
+    assert pageToken.nonces(owner) == 1
+
+    with reverts():
+        pageToken.permit(owner, someUser, value, deadline, v, r, s, {'from': someUser})
+
+    value, deadline, v, r, s = sign_permit(owner.private_key, chain.id, pageToken, owner, someUser, 700, 1, deadline)
+    with reverts():
+        pageToken.permit(owner, someUser, 800, deadline, v, r, s, {'from': someUser})
+
+    chain.sleep(2000)
+    with reverts():
+        pageToken.permit(owner, someUser, value, deadline, v, r, s, {'from': someUser})
+
+    pageToken.transferFrom(owner, someUser, 500, {'from': someUser})
+    assert pageToken.balanceOf(someUser) == 500
@@ -1,7 +1,13 @@
 import pytest
-from brownie import ZERO_ADDRESS, chain, reverts
+from brownie import ZERO_ADDRESS, chain, reverts, web3
 import brownie
 
+from eth_abi import encode
+from eth_account import Account
+from eth_utils import keccak
+
+from relayer import VoteRelayer, sign_vote
+
 VERSION = '1'
 duration = 86400 * 4
 
@@ -48,9 +54,14 @@ def test_put_execute_vote(chain, accounts, pageVoteForCommon, pageCommunity, pag
     pageToken.transfer(deployer, 1000, {'from': treasury})
 
     pageVoteForCommon.putVote(1, 0, True, {'from': someUser})
-    pageVoteForCommon.putVote(1, 0, True, {'from': deployer})
+    tx = pageVoteForCommon.putVote(1, 0, True, {'from': deployer})
+    assert tx.events['PutVote']['sender'] == deployer
+
+    with reverts():
+        pageVoteForCommon.putVote(1, 0, False, {'from': deployer})
 
     readVote = pageVoteForCommon.readVote(1, 0)
+    assert readVote[8] == 2
     assert readVote[9] == True
 
     with reverts():
@@ -67,8 +78,7 @@ def test_put_execute_vote(chain, accounts, pageVoteForCommon, pageCommunity, pag
 
     readVote = pageVoteForCommon.readVote(1, 0)
     #('test for vote', '0x66aB6D9362d4F35596279692F0251Db635165871', 2, 1649439695, 0, 0, (10, 11, 12, 13),
-    # '0x0000000000000000000000000000000000000000',
-    # ('0xA868bC7c1AF08B8831795FAC946025557369F69C', '0x66aB6D9362d4F35596279692F0251Db635165871'), False)
+    # '0x0000000000000000000000000000000000000000', 2, False)
     assert readVote[9] == False
 
     readCommentFee = pageBank.readCommentFee(1)
@@ -107,3 +117,127 @@ def test_execute_community_active_vote(chain, accounts, pageVoteForCommon, pageC
 
 
 
+
+
+def test_vote_signature_typehash(accounts, pageVoteForCommon):
+    # the digest is built as VoteSignature.sol builds it on-chain
+    voter = accounts.add()
+    deadline = chain.time() + 3600
+    domainSeparator = keccak(encode(
+        ['bytes32', 'bytes32', 'bytes32', 'uint256', 'address'],
+        [
+            keccak(text='EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)'),
+            keccak(text='PageVoteForCommon'), keccak(text='1'), chain.id, pageVoteForCommon.address,
+        ]
+    ))
+    structHash = keccak(encode(
+        ['bytes32', 'uint256', 'uint256', 'uint256', 'bool', 'uint256'],
+        [keccak(text='Vote(uint256 kind,uint256 communityId,uint256 index,bool isYes,uint256 deadline)'), 0, 1, 0, True, deadline]
+    ))
+    digest = keccak(b'\x19\x01' + domainSeparator + structHash)
+
+    signature = sign_vote(voter.private_key, 'PageVoteForCommon', chain.id, pageVoteForCommon, 1, 0, True, deadline)
+    assert Account._recover_hash(digest, signature=signature) == voter.address
+
+
+def test_put_votes_by_sig(accounts, pageVoteForCommon, pageCommunity, pageToken, deployer, treasury):
+    pageCommunity.addCommunity('First users')
+    pageVoteForCommon.createVote(1, 'test for vote', duration, 2, [10, 11, 12, 13], ZERO_ADDRESS, {'from': deployer})
+
+    voters = [accounts.add() for i in range(6)]
+    for voter in voters:
+        deployer.transfer(voter, '0.1 ether')
+        pageToken.transfer(voter, 100, {'from': treasury})
+    for voter in voters[:5]:
+        pageCommunity.join(1, {'from': voter})
+
+    deadline = chain.time() + 3600
+    relayer = VoteRelayer(web3, pageVoteForCommon, 'PageVoteForCommon', 1, 0, chainId=chain.id)
+    for i, voter in enumerate(voters):
+        signature = sign_vote(voter.private_key, 'PageVoteForCommon', chain.id, pageVoteForCommon, 1, 0, i != 1, deadline)
+        assert relayer.add(i != 1, deadline, signature) == voter
+
+    # the vote sent directly is skipped in the batch, as well as the signature of a stranger
+    pageVoteForCommon.putVote(1, 0, True, {'from': voters[0]})
+    # a tiny gas limit splits the votes into several transactions
+    transactions = relayer.submit(deployer, maxGas=120000)
+    assert len(transactions) > 1
+    assert sum(tx.return_value for tx in transactions) == 4
+
+    readVote = pageVoteForCommon.readVote(1, 0)
+    assert readVote[4] == 400
+    assert readVote[5] == 100
+    assert readVote[8] == 5
+
+    signature = sign_vote(voters[2].private_key, 'PageVoteForCommon', chain.id, pageVoteForCommon, 1, 0, True, deadline)
+    tx = pageVoteForCommon.putVotesBySig(1, 0, [True], [deadline], [signature], {'from': deployer})
+    assert tx.return_value == 0
+    with reverts():
+        pageVoteForCommon.putVotesBySig(1, 0, [True, False], [deadline], [signature], {'from': deployer})
+    with reverts():
+        pageVoteForCommon.putVotesBySig(1, 0, [True], [deadline, deadline], [signature], {'from': deployer})
+    with reverts():
+        pageVoteForCommon.putVotesBySig(1, 1, [True], [deadline], [signature], {'from': deployer})
+
+    # the broken and the expired signatures are skipped without the revert
+    pageCommunity.join(1, {'from': voters[5]})
+    signature = sign_vote(voters[5].private_key, 'PageVoteForCommon', chain.id, pageVoteForCommon, 1, 0, True, deadline)
+    tx = pageVoteForCommon.putVotesBySig(1, 0, [True], [deadline], ['0x' + '00' * 65], {'from': deployer})
+    assert tx.return_value == 0
+    tx = pageVoteForCommon.putVotesBySig(1, 0, [True], [deadline + 1], [signature], {'from': deployer})
+    assert tx.return_value == 0
+    chain.sleep(7200)
+    chain.mine()
+    tx = pageVoteForCommon.putVotesBySig(1, 0, [True], [deadline], [signature], {'from': deployer})
+    assert tx.return_value == 0
+    relayer.add(True, deadline, signature)
+    assert relayer.batches() == []
+
+
+def test_execute_votes(chain, accounts, pageVoteForCommon, pageCommunity, pageBank, pageToken, someUser, deployer, treasury):
+    pageCommunity.addCommunity('First users')
+    pageCommunity.join(1, {'from': someUser})
+    pageCommunity.join(1, {'from': deployer})
+    pageToken.transfer(someUser, 1000, {'from': treasury})
+    pageToken.transfer(deployer, 1000, {'from': treasury})
+
+    for i in range(3):
+        pageVoteForCommon.createVote(1, 'test for vote', duration, 2, [10, 11, 12, 13], ZERO_ADDRESS, {'from': accounts[0]})
+    for index, isYes in [(0, True), (1, False), (2, True)]:
+        pageVoteForCommon.putVote(1, index, isYes, {'from': someUser})
+        pageVoteForCommon.putVote(1, index, isYes, {'from': deployer})
+
+    indexes, finishTimes = pageVoteForCommon.readActiveVotes(1, 0, 10)
+    assert indexes == [0, 1, 2]
+    assert finishTimes[0] == pageVoteForCommon.readVote(1, 0)[3]
+    assert pageVoteForCommon.readActiveVotes(1, 1, 1)[0] == [1]
+    assert pageVoteForCommon.readActiveVotes(1, 3, 10) == ([], [])
+    assert pageVoteForCommon.readExecutableVotes(1, 0, 10) == []
+
+    with reverts():
+        pageVoteForCommon.executeVotes(1, [1], {'from': someUser})
+
+    chain.sleep(duration + 10)
+    chain.mine()
+    # the failed proposal 1 is returned too, executeVotes closes it
+    assert pageVoteForCommon.readExecutableVotes(1, 0, 10) == [0, 1, 2]
+    assert pageVoteForCommon.readExecutableVotes(1, 1, 2) == [1, 2]
+    assert pageVoteForCommon.readExecutableVotes(1, 5, 2) == []
+
+    with reverts():
+        pageVoteForCommon.executeVote(1, 1, {'from': someUser})
+
+    tx = pageVoteForCommon.executeVotes(1, [0, 1], {'from': someUser})
+    assert 'ExecuteVote' in tx.events
+    assert tx.events['CloseVote']['index'] == 1
+    assert pageVoteForCommon.readVote(1, 1)[9] == False
+    assert pageVoteForCommon.readActiveVotes(1, 0, 10)[0] == [2]
+
+    with reverts():
+        pageVoteForCommon.executeVotes(1, [1], {'from': someUser})
+
+    pageVoteForCommon.executeVotes(1, [2], {'from': someUser})
+    assert pageVoteForCommon.readActiveVotes(1, 0, 10) == ([], [])
+    assert pageVoteForCommon.readExecutableVotes(1, 0, 10) == []
+    assert pageVoteForCommon.readVote(1, 2)[9] == False
+    assert pageBank.readCommentFee(1)[0] == 10
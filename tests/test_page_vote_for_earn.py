@@ -1,7 +1,9 @@
 import pytest
-from brownie import ZERO_ADDRESS, chain, reverts, network
+from brownie import ZERO_ADDRESS, chain, reverts, network, web3
 import brownie
 
+from relayer import VoteRelayer, sign_vote
+
 VERSION = '1'
 duration = 86400 * 4
 
@@ -116,3 +118,72 @@ def test_execute_nft_transfer_vote(chain, accounts, pageCommunity, pageVoteForCo
 
 
 
+
+
+def test_put_token_transfer_votes_by_sig(accounts, pageVoteForEarn, pageCommunity, pageToken, deployer, treasury):
+    pageCommunity.addCommunity('First users')
+    pageCommunity.join(1, {'from': deployer})
+    pageVoteForEarn.createTokenTransferVote(1, 'test for vote', duration, 2, accounts[5], {'from': deployer})
+
+    voters = [accounts.add() for i in range(3)]
+    for voter in voters:
+        deployer.transfer(voter, '0.1 ether')
+        pageToken.transfer(voter, 100, {'from': treasury})
+        pageCommunity.join(1, {'from': voter})
+
+    kind = pageVoteForEarn.TOKEN_TRANSFER_VOTE()
+    deadline = chain.time() + 3600
+    relayer = VoteRelayer(web3, pageVoteForEarn, 'PageVoteForEarn', 1, 0, kind=kind, chainId=chain.id)
+    for voter in voters:
+        signature = sign_vote(voter.private_key, 'PageVoteForEarn', chain.id, pageVoteForEarn, 1, 0, True, deadline, kind)
+        relayer.add(True, deadline, signature)
+    transactions = relayer.submit(deployer)
+    assert len(transactions) == 1
+    assert transactions[0].return_value == 3
+    assert len(transactions[0].events['PutTokenTransferVote']) == 3
+
+    readVote = pageVoteForEarn.readTokenTransferVote(1, 0)
+    assert readVote[3] == 300
+    assert readVote[7] == 3
+
+    # the signature of the token transfer vote is not valid for the NFT transfer vote
+    pageVoteForEarn.createNftTransferVote(1, 'test for vote', duration, 0, accounts[5], {'from': deployer})
+    signature = sign_vote(voters[0].private_key, 'PageVoteForEarn', chain.id, pageVoteForEarn, 1, 0, True, deadline, kind)
+    tx = pageVoteForEarn.putVotesBySig(pageVoteForEarn.NFT_TRANSFER_VOTE(), 1, 0, [True], [deadline], [signature], {'from': deployer})
+    assert tx.return_value == 0
+
+
+def test_execute_votes(chain, accounts, pageVoteForEarn, pageCommunity, pageBank, pageToken, someUser, deployer, treasury):
+    pageCommunity.addCommunity('First users')
+    pageCommunity.join(1, {'from': someUser})
+    pageToken.transfer(someUser, 100, {'from': treasury})
+
+    pageBank.setPriceForPrivacyAccess(1, 1, {'from': pageVoteForEarn})
+    pageToken.approve(pageBank, 100, {'from': treasury})
+    pageBank.addBalance(100, {'from': treasury})
+    pageBank.payForPrivacyAccess(100, 1, {'from': treasury})
+
+    pageVoteForEarn.createPrivacyAccessPriceVote(1, 'test for vote', duration, 10, {'from': accounts[0]})
+    pageVoteForEarn.createTokenTransferVote(1, 'test for vote', duration, 2, accounts[5], {'from': accounts[0]})
+    pageVoteForEarn.putPrivacyAccessPriceVote(1, 0, True, {'from': someUser})
+    pageVoteForEarn.putTokenTransferVote(1, 0, True, {'from': someUser})
+    # a failed proposal is closed by executeVotes without the transfer
+    pageVoteForEarn.createNftTransferVote(1, 'test for vote', duration, 0, accounts[5], {'from': accounts[0]})
+    pageVoteForEarn.putNftTransferVote(1, 0, False, {'from': someUser})
+    assert pageVoteForEarn.readExecutableVotes(1) == ([], [])
+
+    chain.sleep(duration + 10)
+    chain.mine()
+    kinds, indexes = pageVoteForEarn.readExecutableVotes(1)
+    assert kinds == [0, 1, 2]
+    assert indexes == [0, 0, 0]
+
+    with reverts():
+        pageVoteForEarn.executeVotes(1, [0], [0, 0], {'from': someUser})
+
+    pageVoteForEarn.executeVotes(1, kinds, indexes, {'from': someUser})
+    assert pageVoteForEarn.readExecutableVotes(1) == ([], [])
+    assert pageVoteForEarn.readPrivacyAccessPriceVote(1, 0)[-1] == False
+    assert pageVoteForEarn.readTokenTransferVote(1, 0)[8] == False
+    assert pageVoteForEarn.readNftTransferVote(1, 0)[8] == False
+    pageVoteForEarn.createNftTransferVote(1, 'test for vote', duration, 0, accounts[5], {'from': accounts[0]})
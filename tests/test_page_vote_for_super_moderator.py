@@ -49,9 +49,13 @@ def test_execute_vote(chain, pageVoteForSuperModerator, pageCommunity, pageVoteF
     pageVoteForSuperModerator.putVote(1, 0, True, {'from': someUser})
     pageVoteForSuperModerator.putVote(2, 0, True, {'from': deployer})
 
+    assert pageVoteForSuperModerator.readExecutableVotes() == []
     chain.sleep(duration + 10)
+    chain.mine()
+    assert pageVoteForSuperModerator.readExecutableVotes() == [0]
 
     pageVoteForSuperModerator.executeVote(1, 0, {'from': someUser})
+    assert pageVoteForSuperModerator.readExecutableVotes() == []
 
     readVote = pageVoteForSuperModerator.readVote(0)
     assert readVote[8] == False
@@ -59,5 +63,18 @@ def test_execute_vote(chain, pageVoteForSuperModerator, pageCommunity, pageVoteF
     supervisor = pageCommunity.supervisor()
     assert supervisor == treasury
 
+    # with one community the matured Vote is closed without the change, so a new Vote can be created
+    pageVoteForSuperModerator.createVote(1, desc, duration, someUser, {'from': someUser})
+    pageVoteForSuperModerator.putVote(1, 1, True, {'from': someUser})
+    chain.sleep(duration + 10)
+    chain.mine()
+    assert pageVoteForSuperModerator.readExecutableVotes() == [1]
+
+    pageVoteForSuperModerator.executeVote(1, 1, {'from': someUser})
+    assert pageVoteForSuperModerator.readExecutableVotes() == []
+    assert pageVoteForSuperModerator.readVote(1)[8] == False
+    assert pageCommunity.supervisor() == treasury
+    pageVoteForSuperModerator.createVote(1, desc, duration, someUser, {'from': someUser})
+
 
 